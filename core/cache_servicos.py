@@ -0,0 +1,43 @@
+"""
+Cache das estatísticas de serviços (dashboard e lista de serviços).
+
+As chaves levam um número de versão guardado no próprio cache: invalidar é
+só trocar a versão, e as entradas antigas expiram sozinhas pelo TIMEOUT.
+Assim o worker de planilhas invalida tudo ao concluir uma importação, sem
+precisar conhecer os usuários nem os filtros usados nas chaves.
+
+A invalidação só alcança os processos que compartilham o backend de cache
+(Redis, Memcached, banco). Com LocMemCache cada processo tem o seu, e as
+estatísticas dos outros processos ficam velhas até o TIMEOUT.
+"""
+import hashlib
+
+from django.core.cache import cache
+
+CHAVE_VERSAO = 'servicos_stats_versao'
+
+
+def versao_cache_servicos() -> int:
+    versao = cache.get(CHAVE_VERSAO)
+    if versao is None:
+        versao = 1
+        cache.add(CHAVE_VERSAO, versao, None)
+    return versao
+
+
+def chave_dashboard(usuario_id) -> str:
+    return f"dashboard_stats_{versao_cache_servicos()}_{usuario_id}"
+
+
+def chave_lista_servicos(parametros) -> str:
+    filtros = hashlib.md5(parametros.urlencode().encode('utf-8')).hexdigest()
+    return f"lista_servicos_stats_{versao_cache_servicos()}_{filtros}"
+
+
+def invalidar_cache_servicos():
+    """Descarta as estatísticas em cache de todos os usuários e filtros"""
+    try:
+        cache.incr(CHAVE_VERSAO)
+    except ValueError:
+        # Versão ainda não existia (ou expirou): qualquer valor novo serve
+        cache.set(CHAVE_VERSAO, versao_cache_servicos() + 1, None)
@@ -0,0 +1,162 @@
+"""
+Classificação dos campos derivados de Servico a partir do texto do serviço.
+
+Cada dimensão (tipo, direção, aeroporto, região) é uma tabela de regras em
+ordem de prioridade, compilada uma única vez numa regex de alternação. A regex
+usa lookahead para enxergar ocorrências sobrepostas, então o resultado é o mesmo
+da sequência original de testes `in`: vence a regra de maior prioridade presente
+em qualquer ponto do texto, não a que aparece primeiro.
+"""
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+# (valor, padrões) em ordem de prioridade. Padrões são literais, exceto o
+# prefixo '^', que ancora no início do texto.
+REGRAS_TIPO = [
+    ('DISPOSICAO', ['DISPOSIÇÃO', 'DISPOSICAO']),
+    ('TOUR', ['^TOUR']),
+    ('TRANSFER', ['TRANSFER']),
+]
+
+REGRAS_DIRECAO = [
+    ('IN', [' IN ']),
+    ('OUT', [' OUT ']),
+]
+
+REGRAS_AEROPORTO = [
+    ('GIG', ['GIG', 'INTERNACIONAL']),
+    ('SDU', ['SDU']),
+]
+
+REGRAS_REGIAO = [
+    ('ZONA SUL', ['Z.SUL', 'ZONA SUL', 'COPACABANA', 'IPANEMA', 'LEBLON']),
+    ('SANTOS DUMONT', ['SANTOS DUMONT']),
+    ('BARRA', ['BARRA', 'RECREIO']),
+    ('CENTRO', ['CENTRO']),
+    ('BUZIOS', ['BÚZIOS', 'BUZIOS']),
+    ('ANGRA', ['ANGRA DOS REIS', 'ANGRA', 'FRADE', 'VILA GALE']),
+    ('PETROPOLIS', ['PETRÓPOLIS', 'PETROPOLIS', 'ITAIPAVA']),
+    ('PARATY', ['PARATY']),
+    ('MACAE', ['MACAÉ', 'MACAE']),
+]
+
+CLIENTES_PRIORITARIOS = ['hotelbeds', 'holiday']
+REGIOES_PRIORITARIAS = frozenset({'BARRA'})
+
+CAMPOS_CLASSIFICACAO = ['tipo', 'direcao', 'aeroporto', 'regiao', 'eh_regular', 'eh_prioritario']
+
+
+def _alternacao(padroes: Sequence[str]) -> str:
+    return '|'.join(
+        r'\A' + re.escape(p[1:]) if p.startswith('^') else re.escape(p)
+        for p in padroes
+    )
+
+
+class RegraCompilada:
+    """Uma dimensão de classificação compilada numa única regex"""
+
+    def __init__(self, regras: Sequence[Tuple[str, Sequence[str]]], padrao: str):
+        self.regras = regras
+        self.valores = [valor for valor, _ in regras]
+        self.padrao = padrao
+        alternativas = [
+            f'(?P<r{prioridade}>{_alternacao(padroes)})'
+            for prioridade, (_, padroes) in enumerate(regras)
+        ]
+        self.regex = re.compile(f"(?=(?:{'|'.join(alternativas)}))")
+
+    def classificar(self, texto: str) -> str:
+        melhor = len(self.valores)
+        for match in self.regex.finditer(texto):
+            prioridade = int(match.lastgroup[1:])
+            if prioridade < melhor:
+                melhor = prioridade
+                if melhor == 0:
+                    break
+        return self.valores[melhor] if melhor < len(self.valores) else self.padrao
+
+    def classificar_series(self, textos: pd.Series) -> pd.Series:
+        """Versão vetorizada: uma máscara str.contains por regra, da menor para a maior prioridade"""
+        resultado = pd.Series(self.padrao, index=textos.index, dtype=object)
+        for valor, padroes in reversed(self.regras):
+            resultado = resultado.mask(textos.str.contains(_alternacao(padroes), regex=True), valor)
+        return resultado
+
+
+REGRA_TIPO = RegraCompilada(REGRAS_TIPO, 'OUTRO')
+REGRA_DIRECAO = RegraCompilada(REGRAS_DIRECAO, 'N/A')
+REGRA_AEROPORTO = RegraCompilada(REGRAS_AEROPORTO, 'N/A')
+REGRA_REGIAO = RegraCompilada(REGRAS_REGIAO, 'N/A')
+RE_CLIENTE_PRIORITARIO = re.compile('|'.join(re.escape(c) for c in CLIENTES_PRIORITARIOS))
+
+
+@lru_cache(maxsize=8192)
+def _classificar_texto(texto: str) -> Tuple[str, str, str, str, bool]:
+    s = texto.upper()
+    return (
+        REGRA_TIPO.classificar(s),
+        REGRA_DIRECAO.classificar(s),
+        REGRA_AEROPORTO.classificar(s),
+        REGRA_REGIAO.classificar(s),
+        'REGULAR' in s,
+    )
+
+
+def classificar_servico(servico: Optional[str], cliente: Optional[str] = '') -> Dict[str, object]:
+    """
+    Campos derivados de um serviço (tipo, direcao, aeroporto, regiao,
+    eh_regular, eh_prioritario) a partir do texto e do cliente
+    """
+    tipo, direcao, aeroporto, regiao, eh_regular = _classificar_texto(servico or '')
+    cliente_prioritario = bool(cliente) and RE_CLIENTE_PRIORITARIO.search(cliente.lower()) is not None
+    return {
+        'tipo': tipo,
+        'direcao': direcao,
+        'aeroporto': aeroporto,
+        'regiao': regiao,
+        'eh_regular': eh_regular,
+        'eh_prioritario': cliente_prioritario or regiao in REGIOES_PRIORITARIAS,
+    }
+
+
+def classificar_lote(servicos: Iterable) -> List:
+    """
+    Preenche os campos derivados de vários Servico sem passar por save(),
+    para uso antes de bulk_create/bulk_update
+
+    Returns:
+        Lista com os mesmos objetos, já classificados
+    """
+    classificados = []
+    for servico in servicos:
+        for campo, valor in classificar_servico(servico.servico, servico.cliente).items():
+            setattr(servico, campo, valor)
+        classificados.append(servico)
+    return classificados
+
+
+def classificar_dataframe(servicos: pd.Series, clientes: pd.Series) -> pd.DataFrame:
+    """
+    Classificação vetorizada de uma planilha inteira
+
+    Returns:
+        DataFrame com as colunas de CAMPOS_CLASSIFICACAO, no mesmo índice da entrada
+    """
+    textos = servicos.fillna('').astype(str).str.upper()
+    clientes = clientes.reindex(servicos.index).fillna('').astype(str).str.lower()
+    regiao = REGRA_REGIAO.classificar_series(textos)
+    return pd.DataFrame({
+        'tipo': REGRA_TIPO.classificar_series(textos),
+        'direcao': REGRA_DIRECAO.classificar_series(textos),
+        'aeroporto': REGRA_AEROPORTO.classificar_series(textos),
+        'regiao': regiao,
+        'eh_regular': textos.str.contains('REGULAR', regex=False),
+        'eh_prioritario': (
+            clientes.str.contains(RE_CLIENTE_PRIORITARIO.pattern, regex=True)
+            | regiao.isin(REGIOES_PRIORITARIAS)
+        ),
+    }, index=servicos.index)
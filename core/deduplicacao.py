@@ -0,0 +1,59 @@
+"""
+Hashes usados para reimportar planilhas sem duplicar serviços.
+
+- chave natural: identifica a linha (venda, data, horário, serviço). Linhas
+  idênticas no mesmo arquivo recebem um número de ocorrência, para que duas
+  reservas iguais sem número de venda não virem um único serviço.
+- hash de conteúdo: muda quando os dados editáveis da linha mudam (cliente,
+  pickup, PAX), indicando que o serviço existente precisa ser atualizado.
+"""
+import hashlib
+from collections import Counter
+
+SEPARADOR = '\x1f'
+
+
+def _sha1(partes) -> str:
+    return hashlib.sha1(SEPARADOR.join(partes).encode('utf-8')).hexdigest()
+
+
+def _texto(valor) -> str:
+    if valor is None:
+        return ''
+    return valor.isoformat() if hasattr(valor, 'isoformat') else str(valor)
+
+
+def calcular_hash_conteudo(cliente, local_pickup, pax) -> str:
+    return _sha1([_texto(cliente), _texto(local_pickup), _texto(pax)])
+
+
+def calcular_hash_arquivo(arquivo) -> str:
+    """SHA-256 do arquivo inteiro, lido em blocos"""
+    sha = hashlib.sha256()
+    for bloco in arquivo.chunks():
+        sha.update(bloco)
+    return sha.hexdigest()
+
+
+class ChaveadorServicos:
+    """Gera as chaves naturais das linhas de um arquivo, na ordem em que aparecem"""
+
+    def __init__(self):
+        self.ocorrencias = Counter()
+
+    def chave(self, numero_venda, data_do_servico, horario, servico) -> str:
+        base = (_texto(numero_venda), _texto(data_do_servico), _texto(horario), _texto(servico))
+        ocorrencia = self.ocorrencias[base]
+        self.ocorrencias[base] += 1
+        return _sha1(base + (str(ocorrencia),))
+
+    def aplicar(self, servicos):
+        """Preenche chave_natural e hash_conteudo de objetos Servico ainda não salvos"""
+        for servico in servicos:
+            servico.chave_natural = self.chave(
+                servico.numero_venda, servico.data_do_servico, servico.horario, servico.servico
+            )
+            servico.hash_conteudo = calcular_hash_conteudo(
+                servico.cliente, servico.local_pickup, servico.pax
+            )
+        return servicos
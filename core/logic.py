@@ -212,7 +212,7 @@ class CalculadorVeiculoPreco:
         Returns:
             Tuple (veiculo, preco)
         """
-        from core.busca_inteligente_precos import buscador_inteligente
+        from core.busca_inteligente_precos import obter_buscador
         
         # Pega o primeiro serviço do grupo como referência
         servicos_do_grupo = grupo.servicogrupo_set.all()
@@ -223,7 +223,7 @@ class CalculadorVeiculoPreco:
         total_pax = grupo.pax_total
         
         # Usa busca inteligente de preços
-        veiculo, preco, fonte = buscador_inteligente.buscar_preco_inteligente(
+        veiculo, preco, fonte = obter_buscador().buscar_preco_inteligente(
             servico_principal.servico,
             total_pax,
             servico_principal.numero_venda
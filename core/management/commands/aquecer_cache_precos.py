@@ -0,0 +1,56 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.busca_inteligente_precos import obter_buscador
+from core.models import CacheMatchTarifario, Servico
+
+
+class Command(BaseCommand):
+    help = 'Pré-calcula e persiste os matches fuzzy dos serviços recentes nos tarifários'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dias',
+            type=int,
+            default=30,
+            help='Quantidade de dias de serviços a considerar (padrão: 30)',
+        )
+
+    def handle(self, *args, **options):
+        dias = options['dias']
+        buscador = obter_buscador()
+
+        # Remove entradas de versões anteriores dos tarifários
+        fingerprints = [
+            buscador.obter_indice_tarifario(tarifario).fingerprint
+            for tarifario in (buscador.TARIFARIO_JW, buscador.TARIFARIO_MOTORISTAS)
+        ]
+        removidas, _ = CacheMatchTarifario.objects.exclude(
+            fingerprint_tarifario__in=fingerprints
+        ).delete()
+        if removidas:
+            self.stdout.write(f'{removidas} matches de tarifários antigos removidos')
+
+        data_inicio = timezone.now().date() - timedelta(days=dias)
+        nomes = (
+            Servico.objects
+            .filter(data_do_servico__gte=data_inicio)
+            .exclude(servico='')
+            .order_by()
+            .values_list('servico', flat=True)
+            .distinct()
+        )
+
+        total = 0
+        for nome in nomes.iterator():
+            for tarifario, threshold in buscador.limiares_busca():
+                buscador.buscar_melhor_match_tarifario(nome, tarifario, threshold)
+            total += 1
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Cache de matches aquecido: {total} serviços distintos dos últimos {dias} dias'
+            )
+        )
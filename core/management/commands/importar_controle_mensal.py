@@ -0,0 +1,252 @@
+import csv
+import re
+import time
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from core.classificacao_servicos import classificar_lote
+from core.models import Servico
+from escalas.models import AlocacaoVan, Escala
+
+
+class Command(BaseCommand):
+    help = (
+        'Importa a planilha mensal de controle das vans (CSV "VAN FRETAMENTO CONTROLE"): '
+        'lê o arquivo numa passada e grava escalas, serviços e alocações em lote'
+    )
+
+    TAMANHO_LOTE = 1000
+    # AlocacaoVan.lucratividade é DecimalField(max_digits=5, decimal_places=2)
+    LIMITE_LUCRATIVIDADE = Decimal('1000')
+    MARCADORES_VAN = {'Van 01': 'VAN1', 'Van 02': 'VAN2'}
+    FORMATOS_DATA = ['%d/%m/%y', '%d/%m/%Y']
+    FORMATOS_HORARIO = ['%H:%M', '%H:%M:%S', '%H.%M']
+
+    # Posição das colunas na planilha de controle
+    COLUNAS = {
+        'data': 0,           # Data
+        'nr_venda': 1,       # Nr Venda
+        'pax': 2,            # Qtdade Pax
+        'horario': 3,        # Horário
+        'inicio': 4,         # Início
+        'termino': 5,        # Término
+        'servicos': 6,       # Serviços
+        'valor_custo': 7,    # Valor Custo Tarifário
+        'valor_van_dia': 8,  # Valor Van/Dia
+        'observacao': 9,     # Observação
+        'acum_van01': 10,    # Acumulado Van 01
+        'rent_van01': 11,    # Rent Van 01
+        'acum_van02': 12,    # Acumulado Van 02
+        'rent_van02': 13,    # Rent Van 02
+    }
+    CAMPOS_ORIGINAIS = {
+        'valor_custo': 'valor_custo_tarifario',
+        'observacao': 'observacao',
+        'acum_van01': 'acumulado_van01',
+        'rent_van01': 'rent_van01',
+        'acum_van02': 'acumulado_van02',
+        'rent_van02': 'rent_van02',
+    }
+
+    def add_arguments(self, parser):
+        parser.add_argument('arquivo', help='Caminho do CSV de controle do mês')
+        parser.add_argument(
+            '--ano',
+            type=int,
+            help='Força o ano das datas da planilha (padrão: o ano escrito em cada data)',
+        )
+        parser.add_argument(
+            '--lote',
+            type=int,
+            default=self.TAMANHO_LOTE,
+            help=f'Tamanho dos lotes de bulk_create (padrão: {self.TAMANHO_LOTE})',
+        )
+
+    def converter_data(self, texto, ano=None):
+        for formato in self.FORMATOS_DATA:
+            try:
+                data = datetime.strptime(texto, formato).date()
+            except ValueError:
+                continue
+            return data.replace(year=ano) if ano else data
+        return None
+
+    def converter_horario(self, texto):
+        for formato in self.FORMATOS_HORARIO:
+            try:
+                return datetime.strptime(texto, formato).time()
+            except ValueError:
+                continue
+        return None
+
+    def converter_valor(self, texto):
+        """'-R$ 1.092,00' -> Decimal('1092.00'); o sinal é descartado como na planilha original"""
+        if not texto:
+            return None
+        valor = re.sub(r'[R$\s+-]', '', texto).replace('.', '').replace(',', '.')
+        try:
+            return Decimal(valor)
+        except InvalidOperation:
+            return None
+
+    def separar_numeros_venda(self, texto):
+        """'47639 / 47640' vira um serviço por número de venda"""
+        numeros = [n for n in re.split(r'\s*/\s*|\s+', texto) if n]
+        return numeros or ['']
+
+    def ler_planilha(self, caminho, ano=None):
+        """
+        Lê o CSV numa passada. Linhas com 'Van 01'/'Van 02' na coluna de data
+        trocam a van das linhas seguintes; linhas só com data abrem um novo dia.
+
+        Returns:
+            (registros, linhas_lidas) onde cada registro é um dict com a data
+            (None antes da primeira data da planilha), a van e os campos da linha
+        """
+        registros = []
+        van_atual = 'VAN1'
+        data_atual = None
+        linhas_lidas = 0
+
+        with open(caminho, 'r', encoding='utf-8', newline='') as arquivo:
+            for numero, linha in enumerate(csv.reader(arquivo)):
+                linhas_lidas += 1
+                linha = [celula.strip() for celula in linha] + [''] * (len(self.COLUNAS) - len(linha))
+                campos = {nome: linha[posicao] for nome, posicao in self.COLUNAS.items()}
+
+                # Título e cabeçalho da planilha
+                if numero == 0 or campos['nr_venda'] == 'Nr Venda':
+                    continue
+
+                marcador = campos['data']
+                van = next((v for texto, v in self.MARCADORES_VAN.items() if texto in marcador), None)
+                if van:
+                    van_atual = van
+                elif marcador:
+                    data_atual = self.converter_data(marcador, ano) or data_atual
+
+                if not (campos['nr_venda'] or campos['pax'] or campos['servicos']):
+                    continue
+
+                registros.append({
+                    'linha': numero,
+                    'data': data_atual,
+                    'van': van_atual,
+                    'campos': campos,
+                })
+
+        return registros, linhas_lidas
+
+    def montar_detalhes(self, registro, pax, valores, data_importacao):
+        campos = registro['campos']
+        return {
+            'metodo': 'importacao_completa',
+            'dados_originais': {
+                'nr_venda': campos['nr_venda'],
+                'pax': pax,
+                'horario': campos['horario'],
+                'inicio': campos['inicio'],
+                'termino': campos['termino'],
+                'servico': campos['servicos'],
+                'valor_van_dia': campos['valor_van_dia'],
+                **{chave: campos[campo] for campo, chave in self.CAMPOS_ORIGINAIS.items()},
+            },
+            'valores_processados': {
+                nome: float(valor) if valor else 0 for nome, valor in valores.items()
+            },
+            'observacoes': campos['observacao'],
+            'linha_planilha': registro['linha'],
+            'van_atribuida': registro['van'],
+            'data_importacao': data_importacao,
+        }
+
+    def obter_escalas(self, datas, tamanho_lote):
+        """Escalas das datas informadas; as que faltam são criadas num único bulk_create"""
+        escalas = {escala.data: escala for escala in Escala.objects.filter(data__in=datas)}
+        faltantes = [Escala(data=data, etapa='DADOS_PUXADOS') for data in sorted(datas - escalas.keys())]
+        if faltantes:
+            Escala.objects.bulk_create(faltantes, batch_size=tamanho_lote)
+            escalas.update(
+                (escala.data, escala)
+                for escala in Escala.objects.filter(data__in=[e.data for e in faltantes])
+            )
+        return escalas, len(faltantes)
+
+    def handle(self, *args, **options):
+        caminho = Path(options['arquivo'])
+        if not caminho.exists():
+            raise CommandError(f'Arquivo não encontrado: {caminho}')
+        tamanho_lote = options['lote']
+        inicio = time.perf_counter()
+
+        registros, linhas_lidas = self.ler_planilha(caminho, options['ano'])
+        datas = [r['data'] for r in registros if r['data']]
+        if not datas:
+            raise CommandError('Nenhuma data encontrada na planilha')
+
+        # Serviços antes da primeira data ficam no primeiro dia do mês
+        data_padrao = date(datas[0].year, datas[0].month, 1)
+        for registro in registros:
+            registro['data'] = registro['data'] or data_padrao
+
+        data_importacao = datetime.now().isoformat()
+        precificado_em = timezone.now()
+        servicos, alocacoes = [], []
+        for registro in registros:
+            campos = registro['campos']
+            pax = int(campos['pax']) if campos['pax'].isdigit() else 0
+            valores = {
+                nome: self.converter_valor(campos[nome])
+                for nome in ('valor_custo', 'valor_van_dia', 'acum_van01', 'rent_van01', 'acum_van02', 'rent_van02')
+            }
+            lucratividade = valores['rent_van01'] if registro['van'] == 'VAN1' else valores['rent_van02']
+            if lucratividade and lucratividade >= self.LIMITE_LUCRATIVIDADE:
+                lucratividade = None
+            detalhes = self.montar_detalhes(registro, pax, valores, data_importacao)
+            horario = self.converter_horario(campos['horario'])
+
+            for numero_venda in self.separar_numeros_venda(campos['nr_venda']):
+                servico = Servico(
+                    numero_venda=numero_venda,
+                    cliente='Cliente Importado',
+                    local_pickup='',
+                    pax=pax,
+                    horario=horario,
+                    data_do_servico=registro['data'],
+                    servico=campos['servicos'],
+                    linha_original=registro['linha'],
+                    arquivo_origem=caminho.name,
+                )
+                servicos.append(servico)
+                alocacoes.append(AlocacaoVan(
+                    servico=servico,
+                    van=registro['van'],
+                    ordem=len(alocacoes) + 1,
+                    automatica=True,
+                    status_alocacao='NAO_ALOCADO',
+                    preco_calculado=valores['valor_custo'],
+                    precificado_em=precificado_em if valores['valor_custo'] is not None else None,
+                    lucratividade=lucratividade or None,
+                    detalhes_precificacao=detalhes,
+                ))
+
+        with transaction.atomic():
+            escalas, escalas_criadas = self.obter_escalas(set(r['data'] for r in registros), tamanho_lote)
+            Servico.objects.bulk_create(classificar_lote(servicos), batch_size=tamanho_lote)
+            for alocacao in alocacoes:
+                alocacao.escala = escalas[alocacao.servico.data_do_servico]
+            AlocacaoVan.objects.bulk_create(alocacoes, batch_size=tamanho_lote)
+
+        duracao = time.perf_counter() - inicio
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'{caminho.name}: {len(servicos)} serviços, {len(alocacoes)} alocações e '
+                f'{escalas_criadas} escalas novas ({linhas_lidas} linhas em {duracao:.2f}s, '
+                f'{linhas_lidas / duracao if duracao else 0:.0f} linhas/s)'
+            )
+        )
@@ -0,0 +1,141 @@
+import glob
+import inspect
+import os
+import queue
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import Manager
+from pathlib import Path
+
+import django
+from django.core.files import File
+from django.core.management.base import BaseCommand, CommandError
+
+from core.models import ProcessamentoPlanilha
+from core.processors import ProcessadorPlanilhaOS, enviar_lotes_convertidos
+
+
+class Command(BaseCommand):
+    help = (
+        'Importa várias planilhas OS de uma vez (backfill): a leitura e a limpeza '
+        'rodam em paralelo em processos filhos e a gravação em lote fica no processo principal'
+    )
+
+    EXTENSOES = ('.xlsx', '.xls', '.csv')
+    LOTES_EM_ESPERA = 2  # lotes lidos por arquivo aguardando gravação
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'caminhos',
+            nargs='+',
+            help='Arquivos, diretórios ou padrões glob (ex.: "dados/*.xlsx")',
+        )
+        parser.add_argument(
+            '--processos',
+            type=int,
+            default=os.cpu_count(),
+            help='Processos de leitura em paralelo (padrão: número de CPUs)',
+        )
+        parser.add_argument(
+            '--lote',
+            type=int,
+            default=ProcessadorPlanilhaOS.TAMANHO_LOTE,
+            help=f'Linhas por lote de leitura e gravação (padrão: {ProcessadorPlanilhaOS.TAMANHO_LOTE})',
+        )
+
+    def listar_arquivos(self, caminhos):
+        """Expande diretórios e globs, sem repetir arquivos"""
+        arquivos = []
+        for caminho in caminhos:
+            if os.path.isdir(caminho):
+                encontrados = sorted(str(p) for p in Path(caminho).iterdir() if self.e_planilha(p))
+            elif os.path.isfile(caminho):
+                encontrados = [caminho]
+            else:
+                encontrados = sorted(p for p in glob.glob(caminho) if self.e_planilha(Path(p)))
+            arquivos.extend(a for a in encontrados if a not in arquivos)
+        return arquivos
+
+    def e_planilha(self, caminho: Path):
+        return caminho.is_file() and caminho.suffix.lower() in self.EXTENSOES
+
+    def proximo_lote(self, fila, futuro):
+        """Próximo lote da fila (None no fim); não espera para sempre se o filho morreu"""
+        while True:
+            try:
+                return fila.get(timeout=1)
+            except queue.Empty:
+                if futuro.done() and fila.empty():
+                    futuro.result()  # BrokenProcessPool e afins
+                    return None
+
+    def receber_lotes(self, fila, futuro):
+        """Lotes do arquivo conforme o processo filho os converte"""
+        while (lote := self.proximo_lote(fila, futuro)) is not None:
+            yield lote
+        # Falha na leitura: o erro sobe dentro de executar_processamento,
+        # que marca o processamento como ERRO em vez de CONCLUIDO parcial
+        futuro.result()
+
+    def descartar_lotes(self, fila, futuro):
+        """Esvazia a fila até o fim, para o processo filho não ficar preso no put"""
+        try:
+            while self.proximo_lote(fila, futuro) is not None:
+                pass
+        except Exception:
+            pass
+
+    def handle(self, *args, **options):
+        arquivos = self.listar_arquivos(options['caminhos'])
+        if not arquivos:
+            raise CommandError('Nenhuma planilha encontrada')
+
+        processador = ProcessadorPlanilhaOS()
+        inicio = time.perf_counter()
+        linhas, erros = 0, 0
+
+        # Os filhos só leem e convertem (sem ORM); django.setup garante os models
+        # importáveis também quando o sistema cria processos com spawn. Cada
+        # arquivo tem sua fila: os lotes são gravados conforme chegam, e os
+        # arquivos são consumidos na ordem de envio, a mesma em que o pool os
+        # começa, então o arquivo da vez nunca espera um processo livre.
+        with Manager() as gerenciador, ProcessPoolExecutor(
+            max_workers=options['processos'], initializer=django.setup
+        ) as executor:
+            tarefas = []
+            for caminho in arquivos:
+                fila = gerenciador.Queue(maxsize=self.LOTES_EM_ESPERA)
+                futuro = executor.submit(enviar_lotes_convertidos, caminho, fila, options['lote'])
+                tarefas.append((caminho, fila, futuro))
+
+            for caminho, fila, futuro in tarefas:
+                nome_arquivo = os.path.basename(caminho)
+                lotes = self.receber_lotes(fila, futuro)
+                try:
+                    with open(caminho, 'rb') as arquivo:
+                        processamento = ProcessamentoPlanilha.objects.create(
+                            arquivo=File(arquivo, name=nome_arquivo),
+                            nome_arquivo=nome_arquivo,
+                            tamanho_arquivo=os.path.getsize(caminho),
+                            status='PROCESSANDO'
+                        )
+                    processador.executar_processamento(processamento, lotes=lotes)
+                except Exception as e:
+                    # Erros de gravação já deixaram o processamento como ERRO
+                    erros += 1
+                    self.stdout.write(self.style.ERROR(f'{nome_arquivo}: {e}'))
+                    if inspect.getgeneratorstate(lotes) != inspect.GEN_CLOSED:
+                        self.descartar_lotes(fila, futuro)
+                    continue
+
+                linhas += processamento.linhas_processadas
+                self.stdout.write(f'{nome_arquivo}: {processamento.log_processamento}')
+
+        duracao = time.perf_counter() - inicio
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'{len(arquivos) - erros} de {len(arquivos)} planilhas importadas: {linhas} linhas '
+                f'em {duracao:.2f}s ({linhas / duracao if duracao else 0:.0f} linhas/s, '
+                f'{options["processos"]} processos)'
+            )
+        )
@@ -0,0 +1,110 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from django.utils import timezone
+
+from core.cache_servicos import invalidar_cache_servicos
+from core.models import ProcessamentoPlanilha
+from core.processors import ProcessadorPlanilhaOS
+
+
+class Command(BaseCommand):
+    help = (
+        'Worker que processa as planilhas enviadas pelo upload: busca registros '
+        'PENDENTE no banco e processa um de cada vez, sem broker externo. '
+        'Precisa enxergar o mesmo MEDIA_ROOT que o servidor web'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--intervalo',
+            type=float,
+            default=2.0,
+            help='Segundos entre consultas quando a fila está vazia (padrão: 2)',
+        )
+        parser.add_argument(
+            '--uma-vez',
+            action='store_true',
+            help='Processa o que estiver pendente e encerra',
+        )
+        parser.add_argument(
+            '--expirar-apos',
+            type=float,
+            default=15.0,
+            help='Minutos sem progresso até um PROCESSANDO voltar para a fila (padrão: 15)',
+        )
+
+    def recuperar_expirados(self, minutos):
+        """
+        Devolve para a fila os processamentos cujo worker parou no meio.
+        
+        executar_processamento grava updated_at a cada lote, então um
+        PROCESSANDO sem atualização há mais de `minutos` perdeu seu worker
+        (processo morto, deploy, falta de memória). A volta para PENDENTE
+        também é um UPDATE condicional, feito uma vez só mesmo com vários workers.
+        """
+        limite = timezone.now() - timedelta(minutes=minutos)
+        expirados = ProcessamentoPlanilha.objects.filter(status='PROCESSANDO', updated_at__lt=limite)
+        for processamento_id in expirados.values_list('id', flat=True):
+            devolvido = ProcessamentoPlanilha.objects.filter(
+                id=processamento_id, status='PROCESSANDO', updated_at__lt=limite
+            ).update(status='PENDENTE', updated_at=timezone.now())
+            if devolvido:
+                self.stdout.write(self.style.WARNING(
+                    f'#{processamento_id} parado há mais de {minutos:g} min; voltou para a fila'
+                ))
+
+    def reservar_proximo(self):
+        """
+        Pega o pendente mais antigo. A troca PENDENTE -> PROCESSANDO é um UPDATE
+        condicional, então dois workers nunca processam o mesmo arquivo.
+        """
+        while True:
+            proximo = (
+                ProcessamentoPlanilha.objects
+                .filter(status='PENDENTE')
+                .order_by('created_at', 'id')
+                .values_list('id', flat=True)
+                .first()
+            )
+            if proximo is None:
+                return None
+            reservado = ProcessamentoPlanilha.objects.filter(
+                id=proximo, status='PENDENTE'
+            ).update(status='PROCESSANDO', updated_at=timezone.now())
+            if reservado:
+                return ProcessamentoPlanilha.objects.get(id=proximo)
+
+    def handle(self, *args, **options):
+        processador = ProcessadorPlanilhaOS()
+        processados = 0
+
+        while True:
+            close_old_connections()
+            self.recuperar_expirados(options['expirar_apos'])
+            processamento = self.reservar_proximo()
+
+            if processamento is None:
+                if options['uma_vez']:
+                    break
+                time.sleep(options['intervalo'])
+                continue
+
+            self.stdout.write(f'Processando {processamento.nome_arquivo} (#{processamento.id})...')
+            try:
+                processador.executar_processamento(processamento)
+            except Exception as e:
+                # executar_processamento já marcou o registro como ERRO
+                self.stdout.write(self.style.ERROR(f'Erro em #{processamento.id}: {e}'))
+            else:
+                self.stdout.write(self.style.SUCCESS(
+                    f'#{processamento.id}: {processamento.total_servicos_criados} serviços importados'
+                ))
+            finally:
+                # Mesmo com erro, lotes já gravados mudaram as estatísticas
+                invalidar_cache_servicos()
+            processados += 1
+
+        self.stdout.write(self.style.SUCCESS(f'{processados} planilhas processadas'))
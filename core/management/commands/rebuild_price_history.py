@@ -0,0 +1,168 @@
+from datetime import datetime
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+from core.busca_inteligente_precos import (
+    BuscadorInteligenteComHistorico, arquivo_historico_gerado,
+    ler_arquivo_historico_precos, salvar_historico_precos
+)
+from escalas.models import AlocacaoVan
+
+CENTAVO = Decimal('0.01')
+
+
+class Command(BaseCommand):
+    help = (
+        'Atualiza o arquivo de padrões históricos de preço com as alocações precificadas '
+        'desde a última execução (ou reconstrói tudo com --completo)'
+    )
+
+    MIN_OCORRENCIAS = 2
+    MAX_EXEMPLOS = 3
+    TAMANHO_LOTE = 2000
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--completo',
+            action='store_true',
+            help='Ignora o arquivo atual e reprocessa todas as alocações',
+        )
+        parser.add_argument(
+            '--min-ocorrencias',
+            type=int,
+            default=self.MIN_OCORRENCIAS,
+            help='Ocorrências mínimas para um termo virar padrão (padrão: 2)',
+        )
+
+    def extrair_termos(self, texto_limpo):
+        """Palavras com 3+ caracteres e pares de palavras consecutivas"""
+        palavras = [p for p in texto_limpo.split() if len(p) >= 3]
+        pares = [f"{a} {b}" for a, b in zip(palavras, palavras[1:])]
+        return set(palavras + pares)
+
+    def acumular(self, agregado, preco):
+        agregado['count'] += 1
+        agregado['soma_preco'] += preco
+        agregado['preco_min'] = min(agregado['preco_min'], preco)
+        agregado['preco_max'] = max(agregado['preco_max'], preco)
+
+    def ate(self, precificado_ate):
+        """Alocações precificadas até o instante dado (as sem marca são anteriores ao campo)"""
+        return (
+            AlocacaoVan.objects
+            .filter(preco_calculado__gt=0, servico__isnull=False)
+            .filter(Q(precificado_em__isnull=True) | Q(precificado_em__lte=precificado_ate))
+        )
+
+    def marca_atual(self, precificado_ate):
+        """
+        Resumo das alocações já cobertas pelo arquivo. Se uma delas foi
+        reprecificada, apagada ou trocou de serviço depois da última execução,
+        o resumo muda e os agregados antigos não servem mais.
+        """
+        resumo = self.ate(precificado_ate).aggregate(
+            total=Count('id'), soma_ids=Sum('id'), soma_servicos=Sum('servico_id'),
+            soma_precos=Sum('preco_calculado'),
+        )
+        return {
+            'total': resumo['total'],
+            'soma_ids': resumo['soma_ids'] or 0,
+            'soma_servicos': resumo['soma_servicos'] or 0,
+            'soma_precos': str(Decimal(resumo['soma_precos'] or 0).quantize(CENTAVO)),
+        }
+
+    def handle(self, *args, **options):
+        min_ocorrencias = options['min_ocorrencias']
+        anterior = {} if options['completo'] else ler_arquivo_historico_precos(arquivo_historico_gerado())
+        marca = anterior.get('marca')
+        if anterior and not marca:
+            self.stdout.write(self.style.WARNING(
+                'Arquivo atual não tem marca de precificação; reconstruindo tudo.'
+            ))
+            anterior = {}
+        elif marca:
+            precificado_ate = datetime.fromisoformat(marca['precificado_ate'])
+            resumo = {chave: marca[chave] for chave in ('total', 'soma_ids', 'soma_servicos', 'soma_precos')}
+            if self.marca_atual(precificado_ate) != resumo:
+                self.stdout.write(self.style.WARNING(
+                    'Alocações já processadas foram reprecificadas ou removidas; reconstruindo tudo.'
+                ))
+                anterior = {}
+
+        termos = {**anterior.get('padroes', {}), **anterior.get('pendentes', {})}
+        ate = timezone.now()
+        linhas = self.ate(ate)
+        if anterior:
+            linhas = linhas.filter(precificado_em__gt=precificado_ate)
+            nova_marca = resumo
+        else:
+            nova_marca = {'total': 0, 'soma_ids': 0, 'soma_servicos': 0, 'soma_precos': '0'}
+        soma_precos = Decimal(nova_marca['soma_precos'])
+
+        buscador = BuscadorInteligenteComHistorico()
+        linhas = linhas.order_by('id').values_list(
+            'id', 'preco_calculado', 'servico_id', 'servico__servico', 'servico__pax', 'servico__tipo',
+            'servico__regiao', 'servico__aeroporto', 'servico__direcao'
+        )
+
+        novas = 0
+        for id_alocacao, preco_decimal, id_servico, texto, pax, tipo, regiao, aeroporto, direcao in linhas.iterator(
+            chunk_size=self.TAMANHO_LOTE
+        ):
+            preco = float(preco_decimal)
+            chave_pax = str(pax)
+            for termo in self.extrair_termos(buscador.limpar_texto_servico(texto)):
+                dados = termos.setdefault(termo, {
+                    'count': 0, 'soma_preco': 0.0, 'soma_pax': 0,
+                    'preco_min': preco, 'preco_max': preco, 'exemplos': [], 'por_pax': {},
+                })
+                self.acumular(dados, preco)
+                dados['soma_pax'] += pax
+                faixa = dados.setdefault('por_pax', {}).setdefault(chave_pax, {
+                    'count': 0, 'soma_preco': 0.0, 'preco_min': preco, 'preco_max': preco,
+                })
+                self.acumular(faixa, preco)
+                if len(dados['exemplos']) < self.MAX_EXEMPLOS:
+                    dados['exemplos'].append({
+                        'preco': preco,
+                        'pax': pax,
+                        'tipo': tipo,
+                        'regiao': regiao,
+                        'aeroporto': aeroporto,
+                        'direcao': direcao,
+                        'servico_completo': texto,
+                    })
+            nova_marca['total'] += 1
+            nova_marca['soma_ids'] += id_alocacao
+            nova_marca['soma_servicos'] += id_servico
+            soma_precos += preco_decimal
+            novas += 1
+
+        if not novas and anterior:
+            self.stdout.write('Nenhuma alocação precificada nova desde a última execução.')
+            return
+        nova_marca['soma_precos'] = str(soma_precos.quantize(CENTAVO))
+
+        padroes, pendentes = {}, {}
+        for termo, dados in termos.items():
+            dados['preco_medio'] = dados['soma_preco'] / dados['count']
+            dados['pax_medio'] = dados['soma_pax'] / dados['count']
+            destino = padroes if dados['count'] >= min_ocorrencias else pendentes
+            destino[termo] = dados
+
+        destino = salvar_historico_precos({
+            'gerado_em': timezone.now().isoformat(),
+            'marca': {'precificado_ate': ate.isoformat(), **nova_marca},
+            'padroes': padroes,
+            'pendentes': pendentes,
+        })
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'{novas} alocações processadas; {len(padroes)} padrões históricos '
+                f'gravados em {destino}'
+            )
+        )
@@ -0,0 +1,42 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.models import ProcessamentoPlanilha
+from core.processors import ProcessadorPlanilhaOS
+
+
+class Command(BaseCommand):
+    help = (
+        'Reaplica as regras de limpeza e conversão a uma planilha já enviada, a partir '
+        'dos trechos lidos no primeiro processamento (sem ler o Excel de novo)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('ids', nargs='+', type=int, help='IDs dos ProcessamentoPlanilha')
+
+    def handle(self, *args, **options):
+        processador = ProcessadorPlanilhaOS()
+
+        for id_processamento in options['ids']:
+            try:
+                processamento = ProcessamentoPlanilha.objects.get(id=id_processamento)
+            except ProcessamentoPlanilha.DoesNotExist:
+                raise CommandError(f'Processamento #{id_processamento} não encontrado')
+            if processamento.status in ('PENDENTE', 'PROCESSANDO'):
+                raise CommandError(
+                    f'Processamento #{id_processamento} ainda está {processamento.get_status_display().lower()}'
+                )
+
+            origem = 'trechos já lidos' if processador.tem_trechos_lidos(processamento) else 'arquivo original'
+            inicio = time.perf_counter()
+            try:
+                processador.reprocessar(processamento)
+            except Exception as e:
+                # reprocessar já marcou o registro como ERRO
+                raise CommandError(f'Erro em #{id_processamento}: {e}')
+
+            self.stdout.write(self.style.SUCCESS(
+                f'#{processamento.id} {processamento.nome_arquivo} ({origem}, '
+                f'{time.perf_counter() - inicio:.2f}s): {processamento.log_processamento}'
+            ))
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.7 on 2026-10-17 17:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_add_performance_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CacheMatchTarifario',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hash_nome', models.CharField(help_text='SHA-1 do nome do serviço consultado', max_length=40)),
+                ('nome_servico', models.TextField()),
+                ('fingerprint_tarifario', models.CharField(help_text='SHA-1 do conteúdo do tarifário', max_length=40)),
+                ('threshold', models.FloatField()),
+                ('chave_encontrada', models.CharField(blank=True, max_length=255, null=True)),
+                ('similaridade', models.FloatField(default=0.0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Cache de Match de Tarifário',
+                'verbose_name_plural': 'Cache de Matches de Tarifário',
+                'indexes': [models.Index(fields=['fingerprint_tarifario'], name='core_cachem_fingerp_aba2d2_idx')],
+                'unique_together': {('hash_nome', 'fingerprint_tarifario', 'threshold')},
+            },
+        ),
+    ]
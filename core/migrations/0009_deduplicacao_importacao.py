@@ -0,0 +1,81 @@
+# Generated by Django 4.2.7 on 2026-10-17 17:57
+
+import hashlib
+from collections import Counter
+
+from django.db import migrations, models
+
+# Cópia congelada do formato das chaves de core.deduplicacao nesta migração:
+# mudanças futuras no formato não alteram o que ela grava num banco novo.
+SEPARADOR = '\x1f'
+
+
+def _sha1(partes):
+    return hashlib.sha1(SEPARADOR.join(partes).encode('utf-8')).hexdigest()
+
+
+def _texto(valor):
+    if valor is None:
+        return ''
+    return valor.isoformat() if hasattr(valor, 'isoformat') else str(valor)
+
+
+def chavear(servico, ocorrencias):
+    """Preenche chave_natural (com o número de ocorrência no arquivo) e hash_conteudo"""
+    base = (_texto(servico.numero_venda), _texto(servico.data_do_servico),
+            _texto(servico.horario), _texto(servico.servico))
+    ocorrencia = ocorrencias[base]
+    ocorrencias[base] += 1
+    servico.chave_natural = _sha1(base + (str(ocorrencia),))
+    servico.hash_conteudo = _sha1([_texto(servico.cliente), _texto(servico.local_pickup), _texto(servico.pax)])
+    return servico
+
+
+def preencher_chaves(apps, schema_editor):
+    """Calcula as chaves dos serviços já importados, arquivo a arquivo, na ordem das linhas"""
+    Servico = apps.get_model('core', 'Servico')
+    pendentes = []
+    arquivo_atual = ocorrencias = None
+    for servico in Servico.objects.order_by('arquivo_origem', 'linha_original', 'id').iterator(chunk_size=2000):
+        if servico.arquivo_origem != arquivo_atual or ocorrencias is None:
+            arquivo_atual, ocorrencias = servico.arquivo_origem, Counter()
+        pendentes.append(chavear(servico, ocorrencias))
+        if len(pendentes) >= 2000:
+            Servico.objects.bulk_update(pendentes, ['chave_natural', 'hash_conteudo'])
+            pendentes = []
+    if pendentes:
+        Servico.objects.bulk_update(pendentes, ['chave_natural', 'hash_conteudo'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_cachematchtarifario'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='processamentoplanilha',
+            name='hash_arquivo',
+            field=models.CharField(blank=True, help_text='SHA-256 do conteúdo do arquivo', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='servico',
+            name='chave_natural',
+            field=models.CharField(blank=True, help_text='SHA-1 de venda, data, horário e serviço (reimportação sem duplicar)', max_length=40),
+        ),
+        migrations.AddField(
+            model_name='servico',
+            name='hash_conteudo',
+            field=models.CharField(blank=True, help_text='SHA-1 de cliente, pickup e PAX na última importação', max_length=40),
+        ),
+        migrations.AddIndex(
+            model_name='processamentoplanilha',
+            index=models.Index(fields=['hash_arquivo'], name='idx_proc_hash'),
+        ),
+        migrations.AddIndex(
+            model_name='servico',
+            index=models.Index(fields=['chave_natural'], name='idx_servico_chave'),
+        ),
+        migrations.RunPython(preencher_chaves, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 4.2.7 on 2026-10-17 18:01
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+TAMANHO_LOTE = 2000
+
+
+def associar_servicos(apps, schema_editor):
+    """
+    Liga os serviços existentes ao processamento que os criou. Para arquivos
+    enviados mais de uma vez com o mesmo nome, cada serviço vai para o último
+    upload feito antes da sua criação.
+    """
+    Servico = apps.get_model('core', 'Servico')
+    ProcessamentoPlanilha = apps.get_model('core', 'ProcessamentoPlanilha')
+
+    uploads = {}
+    for processamento in ProcessamentoPlanilha.objects.order_by('created_at', 'id'):
+        uploads.setdefault(processamento.nome_arquivo, []).append(processamento)
+
+    for nome_arquivo, processamentos in uploads.items():
+        for posicao, processamento in enumerate(processamentos):
+            servicos = Servico.objects.filter(arquivo_origem=nome_arquivo, processamento__isnull=True)
+            if posicao > 0:
+                servicos = servicos.filter(created_at__gte=processamento.created_at)
+            if posicao + 1 < len(processamentos):
+                servicos = servicos.filter(created_at__lt=processamentos[posicao + 1].created_at)
+
+            ids = list(servicos.values_list('id', flat=True))
+            for inicio in range(0, len(ids), TAMANHO_LOTE):
+                Servico.objects.filter(id__in=ids[inicio:inicio + TAMANHO_LOTE]).update(
+                    processamento=processamento
+                )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_deduplicacao_importacao'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='servico',
+            name='processamento',
+            field=models.ForeignKey(blank=True, help_text='Processamento que gerou este serviço', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='servicos_criados', to='core.processamentoplanilha'),
+        ),
+        migrations.RunPython(associar_servicos, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-17 18:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_servico_processamento_fk'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='processamentoplanilha',
+            name='arquivo_lido',
+            field=models.FileField(blank=True, help_text='Trechos da planilha já lidos (JSON Lines), para reprocessar sem abrir o Excel', upload_to='planilhas/lidas/'),
+        ),
+    ]
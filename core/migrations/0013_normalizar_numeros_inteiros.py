@@ -0,0 +1,81 @@
+import hashlib
+import re
+from collections import Counter
+
+from django.db import migrations
+
+# Importações antigas gravavam números inteiros lidos como float com ".0"
+# ("47639.0"); a leitura em lotes grava "47639". Sem normalizar, reimportar
+# a mesma planilha gera outra chave natural e duplica os serviços.
+INTEIRO_COM_PONTO_ZERO = re.compile(r'^-?\d+\.0$')
+CAMPOS_TEXTO = ['numero_venda', 'cliente', 'local_pickup', 'servico']
+
+# Cópia congelada do formato das chaves de core.deduplicacao nesta migração:
+# mudanças futuras no formato não alteram o que ela grava num banco novo.
+SEPARADOR = '\x1f'
+
+
+def _sha1(partes):
+    return hashlib.sha1(SEPARADOR.join(partes).encode('utf-8')).hexdigest()
+
+
+def _texto(valor):
+    if valor is None:
+        return ''
+    return valor.isoformat() if hasattr(valor, 'isoformat') else str(valor)
+
+
+def chavear(servico, ocorrencias):
+    """Preenche chave_natural (com o número de ocorrência no arquivo) e hash_conteudo"""
+    base = (_texto(servico.numero_venda), _texto(servico.data_do_servico),
+            _texto(servico.horario), _texto(servico.servico))
+    ocorrencia = ocorrencias[base]
+    ocorrencias[base] += 1
+    servico.chave_natural = _sha1(base + (str(ocorrencia),))
+    servico.hash_conteudo = _sha1([_texto(servico.cliente), _texto(servico.local_pickup), _texto(servico.pax)])
+    return servico
+
+
+def normalizar_numeros_inteiros(apps, schema_editor):
+    Servico = apps.get_model('core', 'Servico')
+    arquivos = set()
+    alterados = []
+    for servico in Servico.objects.only('id', 'arquivo_origem', *CAMPOS_TEXTO).iterator(chunk_size=2000):
+        mudou = False
+        for campo in CAMPOS_TEXTO:
+            valor = getattr(servico, campo)
+            if valor and INTEIRO_COM_PONTO_ZERO.match(valor):
+                setattr(servico, campo, valor[:-2])
+                mudou = True
+        if mudou:
+            alterados.append(servico)
+            arquivos.add(servico.arquivo_origem)
+        if len(alterados) >= 2000:
+            Servico.objects.bulk_update(alterados, CAMPOS_TEXTO)
+            alterados = []
+    if alterados:
+        Servico.objects.bulk_update(alterados, CAMPOS_TEXTO)
+
+    # Chaves recalculadas arquivo a arquivo, na ordem das linhas (como em 0009)
+    for arquivo in sorted(arquivos, key=lambda nome: nome or ''):
+        ocorrencias = Counter()
+        pendentes = []
+        servicos = Servico.objects.filter(arquivo_origem=arquivo).order_by('linha_original', 'id')
+        for servico in servicos.iterator(chunk_size=2000):
+            pendentes.append(chavear(servico, ocorrencias))
+            if len(pendentes) >= 2000:
+                Servico.objects.bulk_update(pendentes, ['chave_natural', 'hash_conteudo'])
+                pendentes = []
+        if pendentes:
+            Servico.objects.bulk_update(pendentes, ['chave_natural', 'hash_conteudo'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_processamento_arquivo_lido'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalizar_numeros_inteiros, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-17 18:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_normalizar_numeros_inteiros'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cachematchtarifario',
+            name='candidatos',
+            field=models.JSONField(blank=True, help_text='Melhores [chave, similaridade] da mesma busca, do maior para o menor', null=True),
+        ),
+    ]
@@ -4,6 +4,8 @@ from decimal import Decimal
 from datetime import timedelta
 import re
 
+from .classificacao_servicos import classificar_servico
+
 
 class Servico(models.Model):
     """Model para representar um serviço de fretamento"""
@@ -60,6 +62,16 @@ class Servico(models.Model):
     # Metadados
     linha_original = models.IntegerField(null=True, blank=True, help_text="Linha na planilha original")
     arquivo_origem = models.CharField(max_length=255, blank=True, help_text="Nome do arquivo de origem")
+    processamento = models.ForeignKey(
+        'ProcessamentoPlanilha',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='servicos_criados',
+        help_text="Processamento que gerou este serviço"
+    )
+    chave_natural = models.CharField(max_length=40, blank=True, help_text="SHA-1 de venda, data, horário e serviço (reimportação sem duplicar)")
+    hash_conteudo = models.CharField(max_length=40, blank=True, help_text="SHA-1 de cliente, pickup e PAX na última importação")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -74,6 +86,7 @@ class Servico(models.Model):
             models.Index(fields=['eh_prioritario'], name='idx_servico_prior'),
             models.Index(fields=['-data_do_servico'], name='idx_servico_data_desc'),
             models.Index(fields=['data_do_servico', 'horario'], name='idx_servico_data_hora'),
+            models.Index(fields=['chave_natural'], name='idx_servico_chave'),
         ]
     
     def __str__(self):
@@ -86,62 +99,8 @@ class Servico(models.Model):
     
     def _extrair_detalhes_do_servico(self):
         """Extrai detalhes do serviço baseado no texto"""
-        s = self.servico.upper() if self.servico else ""
-        
-        # Determinar tipo
-        if 'DISPOSIÇÃO' in s or 'DISPOSICAO' in s:
-            self.tipo = 'DISPOSICAO'
-        elif s.startswith('TOUR'):
-            self.tipo = 'TOUR'
-        elif 'TRANSFER' in s:
-            self.tipo = 'TRANSFER'
-        else:
-            self.tipo = 'OUTRO'
-        
-        # Determinar direção
-        if ' IN ' in s:
-            self.direcao = 'IN'
-        elif ' OUT ' in s:
-            self.direcao = 'OUT'
-        else:
-            self.direcao = 'N/A'
-        
-        # Determinar aeroporto
-        if 'GIG' in s or 'INTERNACIONAL' in s:
-            self.aeroporto = 'GIG'
-        elif 'SDU' in s:
-            self.aeroporto = 'SDU'
-        else:
-            self.aeroporto = 'N/A'
-        
-        # Determinar região
-        regioes = {
-            'ZONA SUL': ['Z.SUL', 'ZONA SUL', 'COPACABANA', 'IPANEMA', 'LEBLON'],
-            'SANTOS DUMONT': ['SANTOS DUMONT'],
-            'BARRA': ['BARRA', 'RECREIO'],
-            'CENTRO': ['CENTRO'],
-            'BUZIOS': ['BÚZIOS', 'BUZIOS'],
-            'ANGRA': ['ANGRA DOS REIS', 'ANGRA', 'FRADE', 'VILA GALE'],
-            'PETROPOLIS': ['PETRÓPOLIS', 'PETROPOLIS', 'ITAIPAVA'],
-            'PARATY': ['PARATY'],
-            'MACAE': ['MACAÉ', 'MACAE']
-        }
-        
-        for nome, sinonimos in regioes.items():
-            if any(sin in s for sin in sinonimos):
-                self.regiao = nome
-                break
-        else:
-            self.regiao = 'N/A'
-        
-        # Verificar se é regular
-        self.eh_regular = 'REGULAR' in s
-        
-        # Verificar se é prioritário
-        cliente_lower = self.cliente.lower() if self.cliente else ""
-        cliente_prioritario = 'hotelbeds' in cliente_lower or 'holiday' in cliente_lower
-        regiao_prioritaria = self.regiao == 'BARRA'
-        self.eh_prioritario = cliente_prioritario or regiao_prioritaria
+        for campo, valor in classificar_servico(self.servico, self.cliente).items():
+            setattr(self, campo, valor)
 
 
 class GrupoServico(models.Model):
@@ -231,6 +190,12 @@ class ProcessamentoPlanilha(models.Model):
     total_servicos_criados = models.IntegerField(default=0, help_text="Total de serviços criados a partir desta planilha")
     data_primeira_linha = models.DateField(null=True, blank=True, help_text="Data do primeiro serviço na planilha")
     data_ultima_linha = models.DateField(null=True, blank=True, help_text="Data do último serviço na planilha")
+    hash_arquivo = models.CharField(max_length=64, blank=True, help_text="SHA-256 do conteúdo do arquivo")
+    arquivo_lido = models.FileField(
+        upload_to='planilhas/lidas/',
+        blank=True,
+        help_text="Trechos da planilha já lidos (JSON Lines), para reprocessar sem abrir o Excel"
+    )
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -242,6 +207,7 @@ class ProcessamentoPlanilha(models.Model):
         indexes = [
             models.Index(fields=['-created_at'], name='idx_proc_created'),
             models.Index(fields=['status'], name='idx_proc_status'),
+            models.Index(fields=['hash_arquivo'], name='idx_proc_hash'),
         ]
     
     def __str__(self):
@@ -326,6 +292,33 @@ class CalculoPreco(models.Model):
         return 0
 
 
+class CacheMatchTarifario(models.Model):
+    """Resultado persistido da busca fuzzy de um nome de serviço em um tarifário"""
+
+    hash_nome = models.CharField(max_length=40, help_text="SHA-1 do nome do serviço consultado")
+    nome_servico = models.TextField()
+    fingerprint_tarifario = models.CharField(max_length=40, help_text="SHA-1 do conteúdo do tarifário")
+    threshold = models.FloatField()
+    chave_encontrada = models.CharField(max_length=255, null=True, blank=True)
+    similaridade = models.FloatField(default=0.0)
+    candidatos = models.JSONField(
+        null=True, blank=True,
+        help_text="Melhores [chave, similaridade] da mesma busca, do maior para o menor"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Cache de Match de Tarifário"
+        verbose_name_plural = "Cache de Matches de Tarifário"
+        unique_together = ['hash_nome', 'fingerprint_tarifario', 'threshold']
+        indexes = [
+            models.Index(fields=['fingerprint_tarifario']),
+        ]
+
+    def __str__(self):
+        return f"{self.nome_servico[:50]} → {self.chave_encontrada or 'sem match'} ({self.similaridade:.2f})"
+
+
 class ActivityLog(models.Model):
     ACTIVITY_TYPES = [
         ('CREATE', 'Criação'),
@@ -3,20 +3,50 @@ Módulo para processamento da planilha OS
 Baseado na função limparOS() do Google Apps Script
 """
 
+import json
+import os
+import numpy as np
 import pandas as pd
 import re
-from datetime import datetime, time
-from typing import List, Dict, Tuple, Optional
+import tempfile
+from collections import Counter
+from datetime import date, datetime, time, timedelta
+from itertools import compress, islice, repeat
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import openpyxl
+from django.core.files import File
 from django.core.files.uploadedfile import UploadedFile
+from django.db.models import Case, When
+from django.utils import timezone
+from core.classificacao_servicos import CAMPOS_CLASSIFICACAO, classificar_dataframe
+from core.deduplicacao import ChaveadorServicos, calcular_hash_arquivo
 from core.models import Servico, ProcessamentoPlanilha
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Regras de padronização dos nomes de serviço, na ordem em que são aplicadas
+RE_PREFIXO_NUMERICO = re.compile(r'^\d+\s*[-–]?\s*')
+RE_SEM_GUIA = re.compile(r'S\s*\/\s*GUIA', re.IGNORECASE)
+RE_COM_GUIA = re.compile(r'C\s*\/\s*GUIA', re.IGNORECASE)
+RE_PARA = re.compile(r'P\/\s*', re.IGNORECASE)
+RE_ZONA_SUL = re.compile(r'\bZ\.SUL\b', re.IGNORECASE)
+RE_HIFEN_FINAL = re.compile(r'\s*-\s*$')
+RE_ESPACOS_DUPLOS = re.compile(r'\s{2,}')
+RE_DISPOSICAO_HORAS = re.compile(r'disposição (\d+)\s*horas', re.IGNORECASE)
+
 
 class ProcessadorPlanilhaOS:
     """Classe para processar e limpar a planilha OS"""
     
+    TAMANHO_LOTE = 5000
+    TAMANHO_CONSULTA = 900  # chaves por consulta IN (limite de variáveis do SQLite)
+    
+    # Campos regravados quando uma linha reimportada mudou
+    CAMPOS_ATUALIZAVEIS = [
+        'cliente', 'local_pickup', 'pax', 'hash_conteudo', 'updated_at',
+    ] + CAMPOS_CLASSIFICACAO
+    
     def __init__(self):
         self.colunas_excluir = [
             "File Operadora", "Fone Contato", "Situação", "Agente", 
@@ -52,16 +82,18 @@ class ProcessadorPlanilhaOS:
             # Converte para objetos Servico
             servicos = self._converter_para_servicos(df, arquivo.name)
             
-            # Salva em lote para melhor performance
-            if servicos:
-                # Usa bulk_create para inserção otimizada
-                Servico.objects.bulk_create(servicos, batch_size=1000)
-                logger.info(f"Inseridos {len(servicos)} serviços usando bulk_create")
+            # Salva em lote, sem duplicar linhas de importações anteriores
+            contagem = (
+                self._gravar_lote(ChaveadorServicos().aplicar(servicos), processamento)
+                if servicos else {'novos': 0}
+            )
+            logger.info(f"Inseridos {contagem['novos']} serviços usando bulk_create")
             
             # Atualiza status
             processamento.status = 'CONCLUIDO'
             processamento.linhas_processadas = len(servicos)
-            processamento.log_processamento = f"Processamento concluído com sucesso. {len(servicos)} serviços criados."
+            processamento.total_servicos_criados = contagem['novos']
+            processamento.log_processamento = f"Processamento concluído com sucesso. {contagem['novos']} serviços criados."
             processamento.save()
             
             return servicos, processamento
@@ -73,6 +105,348 @@ class ProcessadorPlanilhaOS:
             logger.error(f"Erro no processamento: {e}")
             raise
     
+    def processar_planilha_em_lotes(self, arquivo: UploadedFile,
+                                    tamanho_lote: int = None) -> ProcessamentoPlanilha:
+        """Processa a planilha OS em lotes, na hora (sem passar pela fila)"""
+        processamento = ProcessamentoPlanilha.objects.create(
+            arquivo=arquivo,
+            nome_arquivo=arquivo.name,
+            status='PROCESSANDO'
+        )
+        return self.executar_processamento(processamento, tamanho_lote)
+    
+    def enfileirar_planilha(self, arquivo: UploadedFile, usuario: str = '',
+                            status: str = 'PENDENTE') -> ProcessamentoPlanilha:
+        """
+        Grava o arquivo e registra o processamento como PENDENTE; quem processa
+        é o worker (python manage.py processar_planilhas).
+        
+        Com status='PROCESSANDO' o processamento já nasce reservado para quem
+        vai executá-lo na hora, e o worker (que só reserva PENDENTE) não o pega.
+        """
+        processamento = ProcessamentoPlanilha.objects.create(
+            arquivo=arquivo,
+            nome_arquivo=arquivo.name,
+            tamanho_arquivo=arquivo.size or 0,
+            usuario_upload=usuario,
+            status=status
+        )
+        if status == 'PENDENTE':
+            logger.info(f"📥 Planilha {arquivo.name} enfileirada (processamento {processamento.id})")
+        return processamento
+    
+    def executar_processamento(self, processamento: ProcessamentoPlanilha,
+                               tamanho_lote: int = None,
+                               lotes: Iterable[List[Servico]] = None) -> ProcessamentoPlanilha:
+        """
+        Processa o arquivo de um ProcessamentoPlanilha em trechos de tamanho_lote
+        linhas: cada trecho é lido, limpo, convertido e gravado antes do próximo,
+        então a memória não cresce com o tamanho do arquivo e as primeiras linhas
+        já ficam no banco durante a leitura. linhas_processadas é atualizado a
+        cada lote para a consulta de status acompanhar o progresso.
+        
+        Reimportar o mesmo arquivo não duplica serviços: linhas já gravadas e
+        inalteradas são ignoradas e as alteradas são atualizadas (ver _gravar_lote).
+        
+        lotes recebe serviços já convertidos (ex.: lidos em outro processo por
+        converter_arquivo, ou do arquivo_lido em reprocessar); sem ele o arquivo
+        é lido aqui mesmo e os trechos crus ficam salvos em arquivo_lido.
+        
+        Ao final, os serviços do processamento que esta execução não produziu
+        (num reprocessamento, a versão antiga das linhas cuja chave mudou) são
+        substituídos pelos novos (ver _substituir_servicos_obsoletos).
+        """
+        tamanho_lote = tamanho_lote or self.TAMANHO_LOTE
+        
+        try:
+            total = 0
+            contagem = Counter()
+            datas_servicos = []
+            chaveador = ChaveadorServicos()
+            produzidos = set()  # ids dos serviços desta execução, novos ou já existentes
+            criados_por_linha = {}  # linha_original -> id dos serviços inseridos agora
+            
+            with processamento.arquivo.open('rb') as arquivo, tempfile.TemporaryFile() as lidos:
+                processamento.hash_arquivo = calcular_hash_arquivo(arquivo)
+                anterior = (
+                    ProcessamentoPlanilha.objects
+                    .filter(hash_arquivo=processamento.hash_arquivo, status='CONCLUIDO')
+                    .exclude(id=processamento.id)
+                    .order_by('-created_at')
+                    .first()
+                )
+                if anterior:
+                    logger.info(f"♻️ {processamento.nome_arquivo} é idêntico ao processamento {anterior.id}")
+                
+                if lotes is None:
+                    # Os trechos lidos são guardados para reprocessar sem abrir a planilha de novo
+                    lotes = self._converter_em_lotes(
+                        self._guardar_lotes_lidos(self._ler_planilha_em_lotes(arquivo, tamanho_lote), lidos),
+                        processamento.nome_arquivo
+                    )
+                
+                for numero, servicos in enumerate(lotes, start=1):
+                    if servicos:
+                        contagem.update(self._gravar_lote(
+                            chaveador.aplicar(servicos), processamento, produzidos, criados_por_linha
+                        ))
+                        datas = [s.data_do_servico for s in servicos]
+                        datas_servicos = [min(datas_servicos + datas), max(datas_servicos + datas)]
+                        total += len(servicos)
+                    
+                    processamento.linhas_processadas = total
+                    processamento.save(update_fields=['linhas_processadas', 'hash_arquivo', 'updated_at'])
+                    logger.info(f"📦 Lote {numero}: {len(servicos)} linhas ({total} no total)")
+                
+                if lidos.tell():
+                    if processamento.arquivo_lido:
+                        processamento.arquivo_lido.delete(save=False)
+                    lidos.seek(0)
+                    processamento.arquivo_lido.save(
+                        f"{os.path.basename(processamento.arquivo.name)}.jsonl", File(lidos), save=False
+                    )
+            
+            substituidos = self._substituir_servicos_obsoletos(processamento, produzidos, criados_por_linha)
+            
+            processamento.status = 'CONCLUIDO'
+            processamento.linhas_processadas = total
+            processamento.total_servicos_criados = contagem['novos']
+            if datas_servicos:
+                processamento.data_primeira_linha, processamento.data_ultima_linha = datas_servicos
+            processamento.log_processamento = (
+                f"Processamento concluído com sucesso. {contagem['novos']} serviços criados, "
+                f"{contagem['atualizados']} atualizados e {contagem['inalterados']} já importados."
+            )
+            if substituidos:
+                processamento.log_processamento += f" {substituidos} serviços da versão anterior substituídos."
+            if anterior:
+                processamento.log_processamento += f" Arquivo idêntico ao processamento #{anterior.id}."
+            processamento.save()
+            
+            return processamento
+            
+        except Exception as e:
+            processamento.status = 'ERRO'
+            processamento.log_processamento = f"Erro durante processamento: {str(e)}"
+            processamento.save()
+            logger.error(f"Erro no processamento: {e}")
+            raise
+    
+    def _gravar_lote(self, servicos: List[Servico],
+                     processamento: ProcessamentoPlanilha = None,
+                     produzidos: set = None,
+                     criados_por_linha: Dict[int, int] = None) -> Dict[str, int]:
+        """
+        Grava um lote de serviços já com chave natural: insere os novos, atualiza
+        com bulk_update os que mudaram e não escreve nada para os inalterados.
+        Os novos ficam ligados ao processamento; os existentes continuam com o
+        processamento que os criou.
+        
+        Se informados, produzidos recebe o id de todos os serviços do lote e
+        criados_por_linha a linha_original -> id dos inseridos.
+        """
+        existentes = {}
+        chaves = [s.chave_natural for s in servicos]
+        for inicio in range(0, len(chaves), self.TAMANHO_CONSULTA):
+            linhas = (
+                Servico.objects
+                .filter(chave_natural__in=chaves[inicio:inicio + self.TAMANHO_CONSULTA])
+                .values_list('chave_natural', 'id', 'hash_conteudo')
+            )
+            for chave, id_servico, hash_conteudo in linhas:
+                existentes[chave] = (id_servico, hash_conteudo)
+        
+        novos, alterados = [], []
+        agora = timezone.now()
+        for servico in servicos:
+            if servico.chave_natural not in existentes:
+                servico.processamento = processamento
+                novos.append(servico)
+                continue
+            id_servico, hash_conteudo = existentes[servico.chave_natural]
+            if hash_conteudo != servico.hash_conteudo:
+                servico.pk = id_servico
+                servico.updated_at = agora
+                alterados.append(servico)
+        
+        if novos:
+            Servico.objects.bulk_create(novos, batch_size=1000)
+        if alterados:
+            Servico.objects.bulk_update(alterados, self.CAMPOS_ATUALIZAVEIS, batch_size=1000)
+        
+        if produzidos is not None:
+            produzidos.update(id_servico for id_servico, _ in existentes.values())
+            produzidos.update(s.pk for s in novos)
+        if criados_por_linha is not None:
+            criados_por_linha.update((s.linha_original, s.pk) for s in novos)
+        
+        return {
+            'novos': len(novos),
+            'atualizados': len(alterados),
+            'inalterados': len(servicos) - len(novos) - len(alterados),
+        }
+    
+    def _substituir_servicos_obsoletos(self, processamento: ProcessamentoPlanilha, produzidos: set,
+                                       criados_por_linha: Dict[int, int]) -> int:
+        """
+        Apaga os serviços ligados ao processamento que a execução não produziu.
+        Antes, o que aponta para eles (alocações nas escalas, grupos) passa para
+        o serviço inserido agora a partir da mesma linha da planilha, então um
+        reprocessamento não tira serviços já escalados.
+        
+        Returns:
+            Quantidade de serviços apagados
+        """
+        obsoletos = [
+            (id_servico, linha)
+            for id_servico, linha in processamento.servicos_criados.values_list('id', 'linha_original')
+            if id_servico not in produzidos
+        ]
+        relacoes = [
+            relacao for relacao in Servico._meta.related_objects
+            if relacao.one_to_many and relacao.field.name != 'processamento'
+        ]
+        for inicio in range(0, len(obsoletos), self.TAMANHO_CONSULTA):
+            trecho = obsoletos[inicio:inicio + self.TAMANHO_CONSULTA]
+            substitutos = {
+                id_servico: criados_por_linha[linha]
+                for id_servico, linha in trecho if linha in criados_por_linha
+            }
+            if substitutos:
+                for relacao in relacoes:
+                    coluna = relacao.field.attname
+                    relacao.related_model._base_manager.filter(**{f'{coluna}__in': substitutos}).update(**{
+                        coluna: Case(*(
+                            When(**{coluna: antigo}, then=novo) for antigo, novo in substitutos.items()
+                        ))
+                    })
+            Servico.objects.filter(id__in=[id_servico for id_servico, _ in trecho]).delete()
+        
+        if obsoletos:
+            logger.info(f"🔁 {len(obsoletos)} serviços antigos de {processamento.nome_arquivo} substituídos")
+        return len(obsoletos)
+    
+    def reprocessar(self, processamento: ProcessamentoPlanilha) -> ProcessamentoPlanilha:
+        """
+        Reaplica a limpeza e a conversão aos trechos guardados em arquivo_lido,
+        sem ler a planilha original de novo. A gravação é a mesma de um novo
+        upload, e as linhas cuja chave mudou substituem a versão antiga. Sem
+        arquivo_lido (processamentos antigos, ou artefato apagado do disco), o
+        arquivo original é lido e o artefato criado.
+        """
+        processamento.status = 'PROCESSANDO'
+        processamento.save(update_fields=['status', 'updated_at'])
+        lotes = None
+        if self.tem_trechos_lidos(processamento):
+            lotes = self._converter_em_lotes(self._ler_lotes_guardados(processamento), processamento.nome_arquivo)
+        return self.executar_processamento(processamento, lotes=lotes)
+    
+    def tem_trechos_lidos(self, processamento: ProcessamentoPlanilha) -> bool:
+        """Se reprocessar vai usar os trechos de arquivo_lido (senão relê o arquivo original)"""
+        arquivo_lido = processamento.arquivo_lido
+        return bool(arquivo_lido) and arquivo_lido.storage.exists(arquivo_lido.name)
+    
+    def _guardar_lotes_lidos(self, lotes: Iterable[pd.DataFrame], destino) -> Iterator[pd.DataFrame]:
+        """Repassa os trechos lidos, gravando cada um em destino como uma linha JSON"""
+        for lote in lotes:
+            registro = {
+                'colunas': [_valor_para_json(coluna) for coluna in lote.columns],
+                'tipos': [str(tipo) for tipo in lote.dtypes],
+                'indice': [int(posicao) for posicao in lote.index],
+                'linhas': [
+                    [_valor_para_json(valor) for valor in linha]
+                    for linha in lote.itertuples(index=False, name=None)
+                ],
+            }
+            destino.write(json.dumps(registro).encode('utf-8') + b'\n')
+            yield lote
+    
+    def _ler_lotes_guardados(self, processamento: ProcessamentoPlanilha) -> Iterator[pd.DataFrame]:
+        """Trechos gravados por _guardar_lotes_lidos, na ordem original e com os mesmos dtypes"""
+        with processamento.arquivo_lido.open('rb') as arquivo:
+            for linha in arquivo:
+                registro = json.loads(linha, object_hook=_valor_de_json)
+                lote = pd.DataFrame(
+                    [[np.nan if valor is None else valor for valor in valores] for valores in registro['linhas']],
+                    columns=registro['colunas'], index=registro['indice'], dtype=object
+                )
+                for posicao, tipo in enumerate(registro['tipos']):
+                    if tipo != 'object':
+                        lote.isetitem(posicao, lote.iloc[:, posicao].astype(tipo))
+                yield lote
+    
+    def _converter_em_lotes(self, lotes: Iterable[pd.DataFrame], nome_arquivo: str) -> Iterator[List[Servico]]:
+        """Limpa e converte os trechos lidos da planilha, sem acessar o banco"""
+        data_atual = None
+        for lote in lotes:
+            servicos, data_atual = self._converter_lote(self._limpar_planilha(lote), nome_arquivo, data_atual)
+            yield servicos
+    
+    def _ler_planilha_em_lotes(self, arquivo: UploadedFile, tamanho_lote: int) -> Iterator[pd.DataFrame]:
+        """
+        Lê a planilha em trechos de até tamanho_lote linhas. O índice de cada
+        trecho continua a numeração do anterior, como numa leitura completa.
+        """
+        arquivo.seek(0)
+        if arquivo.name.endswith('.xlsx'):
+            yield from self._ler_xlsx_em_lotes(arquivo, tamanho_lote)
+        elif arquivo.name.endswith('.csv'):
+            yield from pd.read_csv(arquivo, chunksize=tamanho_lote)
+        else:
+            # .xls não tem leitura incremental: lê de uma vez
+            yield self._ler_planilha(arquivo)
+    
+    def _ler_xlsx_em_lotes(self, arquivo: UploadedFile, tamanho_lote: int) -> Iterator[pd.DataFrame]:
+        """Itera as linhas da primeira aba com openpyxl em modo read_only"""
+        workbook = openpyxl.load_workbook(arquivo, read_only=True, data_only=True)
+        try:
+            linhas = workbook.active.iter_rows(values_only=True)
+            cabecalho = next(linhas, None)
+            if cabecalho is None:
+                return
+            colunas = [
+                nome if nome is not None else f'Unnamed: {posicao}'
+                for posicao, nome in enumerate(cabecalho)
+            ]
+            
+            largura = len(colunas)
+            linhas = self._sem_linhas_vazias_no_fim(linhas)
+            inicio = 0
+            while True:
+                # Linhas vazias no meio ficam (o índice vira linha_original), como em read_excel
+                trecho = [
+                    tuple(linha[:largura]) + (None,) * (largura - len(linha))
+                    for linha in islice(linhas, tamanho_lote)
+                ]
+                if not trecho:
+                    break
+                # dtype=object: a inferência de tipos não pode variar de um trecho para outro
+                df = pd.DataFrame(
+                    trecho, columns=colunas, dtype=object,
+                    index=range(inicio, inicio + len(trecho))
+                )
+                # Células vazias como NaN, igual a read_excel
+                yield df.mask(df.isna())
+                inicio += len(trecho)
+        finally:
+            workbook.close()
+    
+    @staticmethod
+    def _sem_linhas_vazias_no_fim(linhas: Iterator[tuple]) -> Iterator[tuple]:
+        """
+        Repassa as linhas da aba, menos as totalmente vazias depois da última
+        preenchida (read_excel também as descarta). As vazias no meio só saem
+        quando aparece uma linha preenchida depois delas.
+        """
+        vazias = 0
+        for linha in linhas:
+            if any(valor is not None for valor in linha):
+                yield from repeat((), vazias)
+                vazias = 0
+                yield linha
+            else:
+                vazias += 1
+    
     def _ler_planilha(self, arquivo: UploadedFile) -> pd.DataFrame:
         """Lê a planilha Excel ou CSV"""
         try:
@@ -134,19 +508,20 @@ class ProcessadorPlanilhaOS:
     def _limpar_linhas_indesejadas(self, df: pd.DataFrame) -> pd.DataFrame:
         """Remove linhas com folga, búzios, etc."""
         mascara_manter = True
+        texto = df.astype(str)  # uma única cópia em texto para todas as máscaras
         
         for col in df.columns:
             if df[col].dtype == 'object':  # Apenas colunas de texto
                 # Remove linhas que contêm "folga" (case insensitive)
-                mascara_folga = ~df[col].astype(str).str.lower().str.contains('folga', na=False)
+                mascara_folga = ~texto[col].str.lower().str.contains('folga', na=False)
                 mascara_manter = mascara_manter & mascara_folga
         
         # Remove linhas completamente vazias
-        mascara_nao_vazia = ~(df.astype(str) == '').all(axis=1)
+        mascara_nao_vazia = ~(texto == '').all(axis=1)
         mascara_manter = mascara_manter & mascara_nao_vazia
         
         # Remove linhas que são apenas "-"
-        mascara_hifen = ~(df.astype(str) == '-').all(axis=1)
+        mascara_hifen = ~(texto == '-').all(axis=1)
         mascara_manter = mascara_manter & mascara_hifen
         
         df_limpo = df[mascara_manter].copy()
@@ -191,41 +566,36 @@ class ProcessadorPlanilhaOS:
         servico_cols = [col for col in df.columns if 'serviço' in str(col).lower()]
         
         for col in servico_cols:
-            df[col] = df[col].astype(str).apply(self._limpar_servico)
+            # A OS repete os mesmos poucos nomes: limpa cada texto distinto uma vez só
+            valores = df[col].astype(str)
+            unicos = pd.Series(valores.unique(), dtype=object)
+            df[col] = valores.map(dict(zip(unicos, self._limpar_servicos(unicos))))
         
         return df
     
-    def _limpar_servico(self, servico_original: str) -> str:
-        """Limpa e padroniza um serviço individual"""
-        if pd.isna(servico_original) or servico_original == 'nan':
-            return ""
-        
-        servico = str(servico_original).strip()
+    def _limpar_servicos(self, servicos: pd.Series) -> pd.Series:
+        """Limpa e padroniza serviços, cada regra aplicada à coluna inteira"""
+        vazios = servicos == 'nan'
         
         # 1. Limpeza e substituições gerais
-        servico = re.sub(r'^\d+\s*[-–]?\s*', '', servico)  # Remove prefixo numérico
-        
-        # 2. Substituições específicas para GUIA - apenas se o serviço contém esses termos
-        if re.search(r'S\s*\/\s*GUIA', servico, flags=re.IGNORECASE):
-            servico = re.sub(r'S\s*\/\s*GUIA', 'Sem Guia', servico, flags=re.IGNORECASE)
+        s = servicos.str.strip()
+        s = s.str.replace(RE_PREFIXO_NUMERICO, '', regex=True)
         
-        if re.search(r'C\s*\/\s*GUIA', servico, flags=re.IGNORECASE):
-            servico = re.sub(r'C\s*\/\s*GUIA', 'Com Guia', servico, flags=re.IGNORECASE)
+        # 2. Substituições específicas para GUIA
+        s = s.str.replace(RE_SEM_GUIA, 'Sem Guia', regex=True)
+        s = s.str.replace(RE_COM_GUIA, 'Com Guia', regex=True)
+        s = s.str.replace(RE_PARA, 'PARA ', regex=True)
+        s = s.str.replace(RE_ZONA_SUL, 'ZONA SUL', regex=True)
         
-        servico = re.sub(r'P\/\s*', 'PARA ', servico, flags=re.IGNORECASE)  # Substitui "P/" por "PARA "
-        servico = re.sub(r'\bZ\.SUL\b', 'ZONA SUL', servico, flags=re.IGNORECASE)  # Substitui "Z.SUL"
+        # 3. Limpeza final
+        s = s.str.replace(RE_HIFEN_FINAL, '', regex=True).str.strip()
+        s = s.str.replace(RE_ESPACOS_DUPLOS, ' ', regex=True).str.strip()
         
-        # 2. Limpeza final
-        servico = re.sub(r'\s*-\s*$', '', servico).strip()  # Remove hífen final
-        servico = re.sub(r'\s{2,}', ' ', servico).strip()  # Remove espaços duplos
+        # 4. Padronização específica para "Disposição"
+        horas = s.str.extract(RE_DISPOSICAO_HORAS, expand=False)
+        s = s.where(horas.isna(), 'Disposição ' + horas + 'h')
         
-        # 3. Padronização específica para "Disposição"
-        disposicao_match = re.search(r'disposição (\d+)\s*horas', servico, re.IGNORECASE)
-        if disposicao_match:
-            horas = disposicao_match.group(1)
-            return f"Disposição {horas}h"
-        
-        return servico
+        return s.mask(vazios, '')
     
     def _normalizar_cabecalhos(self, df: pd.DataFrame) -> pd.DataFrame:
         """Normaliza nomes dos cabeçalhos"""
@@ -233,8 +603,20 @@ class ProcessadorPlanilhaOS:
     
     def _converter_para_servicos(self, df: pd.DataFrame, nome_arquivo: str = "") -> List[Servico]:
         """Converte DataFrame para lista de objetos Servico"""
-        servicos = []
+        servicos, _ = self._converter_lote(df, nome_arquivo)
+        return servicos
+    
+    def _converter_lote(self, df: pd.DataFrame, nome_arquivo: str = "",
+                        data_inicial: Optional[date] = None) -> Tuple[List[Servico], Optional[date]]:
+        """
+        Converte um trecho da planilha para objetos Servico, coluna a coluna
         
+        Args:
+            data_inicial: data vigente ao fim do trecho anterior (leitura em lotes)
+            
+        Returns:
+            Tuple (servicos, data vigente na última linha do trecho)
+        """
         # Mapear colunas
         col_mapping = {
             'numero_venda': self._encontrar_coluna(df, ['NÚMERO DA VENDA', 'Venda']),
@@ -246,42 +628,39 @@ class ProcessadorPlanilhaOS:
             'servico': self._encontrar_coluna(df, ['SERVIÇOS', 'Serviço'])
         }
         
-        data_atual = None
+        if df.empty:
+            return [], data_inicial
+        
+        clientes = self._coluna_string(df, col_mapping['cliente'])
+        textos = self._coluna_string(df, col_mapping['servico'])
+        
+        colunas = {
+            'numero_venda': self._coluna_string(df, col_mapping['numero_venda']),
+            'cliente': clientes,
+            'local_pickup': self._coluna_string(df, col_mapping['local_pickup']),
+            'pax': self._coluna_int(df, col_mapping['pax']),
+            'horario': self._coluna_time(df, col_mapping['horario']),
+            # A data vale para as linhas seguintes até aparecer outra
+            'data_do_servico': self._coluna_data(df, col_mapping['data_servico'], data_inicial),
+            'servico': textos,
+            'linha_original': df.index + 2,  # +2 porque pandas é 0-based e Excel começa na linha 1
+        }
         
-        for idx, row in df.iterrows():
-            # Atualiza data atual se presente
-            if col_mapping['data_servico'] and pd.notna(row[col_mapping['data_servico']]):
-                try:
-                    # Força formato brasileiro DD/MM/YYYY
-                    data_str = str(row[col_mapping['data_servico']])
-                    data_atual = pd.to_datetime(data_str, format='%d/%m/%Y', dayfirst=True).date()
-                except:
-                    try:
-                        # Fallback: tenta formato ISO
-                        data_atual = pd.to_datetime(row[col_mapping['data_servico']]).date()
-                    except:
-                        pass
-            
-            # Pula se não há serviço ou cliente
-            if not self._tem_dados_minimos(row, col_mapping):
-                continue
-            
-            # Cria objeto Servico
-            servico_obj = Servico(
-                numero_venda=self._obter_valor_string(row, col_mapping['numero_venda']),
-                cliente=self._obter_valor_string(row, col_mapping['cliente']),
-                local_pickup=self._obter_valor_string(row, col_mapping['local_pickup']),
-                pax=self._obter_valor_int(row, col_mapping['pax']),
-                horario=self._obter_valor_time(row, col_mapping['horario']),
-                data_do_servico=data_atual or datetime.now().date(),
-                servico=self._obter_valor_string(row, col_mapping['servico']),
-                linha_original=idx + 2,  # +2 porque pandas é 0-based e Excel começa na linha 1
-                arquivo_origem=nome_arquivo
-            )
-            
-            servicos.append(servico_obj)
+        # Pula linhas sem serviço e sem cliente
+        mascara = ((clientes != '') | (textos != '')).to_numpy()
+        tabela = {campo: list(compress(valores, mascara)) for campo, valores in colunas.items()}
         
-        return servicos
+        # bulk_create não passa por Servico.save(): classifica aqui os campos derivados
+        derivados = classificar_dataframe(textos[mascara], clientes[mascara])
+        for campo in CAMPOS_CLASSIFICACAO:
+            tabela[campo] = derivados[campo].tolist()
+        
+        campos = list(tabela)
+        servicos = [
+            Servico(arquivo_origem=nome_arquivo, **dict(zip(campos, valores)))
+            for valores in zip(*tabela.values())
+        ]
+        return servicos, colunas['data_do_servico'][-1]
     
     def _encontrar_coluna(self, df: pd.DataFrame, nomes_possiveis: List[str]) -> Optional[str]:
         """Encontra uma coluna pelos nomes possíveis"""
@@ -290,40 +669,92 @@ class ProcessadorPlanilhaOS:
                 return nome
         return None
     
-    def _tem_dados_minimos(self, row: pd.Series, col_mapping: Dict) -> bool:
-        """Verifica se a linha tem dados mínimos necessários"""
-        cliente = self._obter_valor_string(row, col_mapping['cliente'])
-        servico = self._obter_valor_string(row, col_mapping['servico'])
-        return bool(cliente or servico)
+    def _valores_unicos_convertidos(self, serie: pd.Series, conversor) -> List:
+        """Aplica o conversor uma vez por valor distinto da coluna (nulos incluídos)"""
+        codigos, unicos = pd.factorize(serie)
+        convertidos = [conversor(valor) for valor in unicos] + [conversor(None)]
+        return [convertidos[codigo] for codigo in codigos]
     
-    def _obter_valor_string(self, row: pd.Series, coluna: Optional[str]) -> str:
-        """Obtém valor string de uma célula"""
-        if not coluna or coluna not in row:
-            return ""
-        valor = row[coluna]
-        if pd.isna(valor):
+    def _coluna_string(self, df: pd.DataFrame, coluna: Optional[str]) -> pd.Series:
+        """Coluna como texto sem espaços nas pontas; nulos viram string vazia"""
+        if not coluna or coluna not in df.columns:
+            return pd.Series('', index=df.index, dtype=object)
+        return pd.Series(
+            self._valores_unicos_convertidos(df[coluna], self._converter_string),
+            index=df.index, dtype=object
+        )
+    
+    def _coluna_int(self, df: pd.DataFrame, coluna: Optional[str]) -> List[int]:
+        """Coluna como inteiros; valores vazios ou inválidos viram 0"""
+        if not coluna or coluna not in df.columns:
+            return [0] * len(df)
+        return self._valores_unicos_convertidos(df[coluna], self._converter_int)
+    
+    def _coluna_time(self, df: pd.DataFrame, coluna: Optional[str]) -> List[Optional[time]]:
+        """Coluna como horários; valores vazios ou inválidos viram None"""
+        if not coluna or coluna not in df.columns:
+            return [None] * len(df)
+        return self._valores_unicos_convertidos(df[coluna], self._converter_time)
+    
+    def _coluna_data(self, df: pd.DataFrame, coluna: Optional[str],
+                     data_inicial: Optional[date] = None) -> List:
+        """
+        Datas da planilha propagadas para as linhas seguintes (a OS só preenche
+        a data na primeira linha de cada dia); antes da primeira data, usa
+        data_inicial ou hoje
+        """
+        padrao = data_inicial or datetime.now().date()
+        if not coluna or coluna not in df.columns:
+            return [padrao] * len(df)
+        
+        serie = df[coluna]
+        # Força formato brasileiro DD/MM/YYYY
+        datas = pd.to_datetime(serie.astype(str), format='%d/%m/%Y', errors='coerce')
+        
+        # Fallback: demais formatos (ISO, datetime do Excel), um parse por valor distinto
+        falhas = datas.isna() & serie.notna()
+        if falhas.any():
+            datas = datas.astype(object)
+            datas[falhas] = self._valores_unicos_convertidos(serie[falhas], self._converter_data_livre)
+            datas = pd.to_datetime(datas)
+        
+        datas = datas.ffill()
+        return datas.dt.date.where(datas.notna(), padrao).tolist()
+    
+    @staticmethod
+    def _converter_data_livre(valor):
+        if valor is None or pd.isna(valor):
+            return pd.NaT
+        try:
+            return pd.to_datetime(valor)
+        except (ValueError, TypeError, OverflowError):
+            return pd.NaT
+    
+    @staticmethod
+    def _converter_string(valor) -> str:
+        if valor is None or pd.isna(valor):
             return ""
+        # Números inteiros lidos como float (coluna com vazios) não ganham ".0":
+        # o texto não pode depender de quais linhas caíram no mesmo lote
+        # (os serviços gravados antes disso foram normalizados na migração 0013)
+        if isinstance(valor, float) and valor.is_integer():
+            return str(int(valor))
         return str(valor).strip()
     
-    def _obter_valor_int(self, row: pd.Series, coluna: Optional[str]) -> int:
-        """Obtém valor inteiro de uma célula"""
-        if not coluna or coluna not in row:
+    @staticmethod
+    def _converter_int(valor) -> int:
+        if valor is None or pd.isna(valor):
             return 0
         try:
-            valor = row[coluna]
-            if pd.isna(valor):
-                return 0
             return int(float(valor))
-        except (ValueError, TypeError):
+        except (ValueError, TypeError, OverflowError):
             return 0
     
-    def _obter_valor_time(self, row: pd.Series, coluna: Optional[str]) -> Optional[time]:
-        """Obtém valor time de uma célula"""
-        if not coluna or coluna not in row:
+    @staticmethod
+    def _converter_time(valor) -> Optional[time]:
+        if valor is None:
             return None
-        
         try:
-            valor = row[coluna]
             if pd.isna(valor):
                 return None
             
@@ -347,4 +778,76 @@ class ProcessadorPlanilhaOS:
             return None
             
         except Exception:
-            return None
\ No newline at end of file
+            return None
+
+
+# Tipos de célula que o JSON não representa, com a chave usada no artefato
+_TIPOS_JSON = [
+    ('datetime', datetime, datetime.fromisoformat),
+    ('date', date, date.fromisoformat),
+    ('time', time, time.fromisoformat),
+]
+
+
+def _valor_para_json(valor):
+    """Célula da planilha -> valor JSON; datas, horários e durações levam o tipo junto"""
+    if valor is None or (pd.api.types.is_scalar(valor) and pd.isna(valor)):
+        return None
+    for chave, tipo, _ in _TIPOS_JSON:
+        if isinstance(valor, tipo):
+            return {chave: valor.isoformat()}
+    if isinstance(valor, timedelta):
+        return {'timedelta': valor.total_seconds()}
+    if isinstance(valor, np.generic):
+        return valor.item()
+    if isinstance(valor, (str, int, float, bool)):
+        return valor
+    return str(valor)
+
+
+def _valor_de_json(objeto: dict):
+    """object_hook de json.loads: desfaz as marcações de tipo de _valor_para_json"""
+    if len(objeto) == 1:
+        (chave, valor), = objeto.items()
+        for nome, _, conversor in _TIPOS_JSON:
+            if chave == nome:
+                return conversor(valor)
+        if chave == 'timedelta':
+            return timedelta(seconds=valor)
+    return objeto
+
+
+def converter_arquivo(caminho: str, tamanho_lote: int = None) -> Iterator[List[Servico]]:
+    """
+    Lê, limpa e converte uma planilha do disco em lotes de Servico não salvos,
+    um lote de cada vez. Não acessa o banco, então pode rodar em processos
+    filhos (ver enviar_lotes_convertidos); a gravação fica com
+    executar_processamento(lotes=...).
+    """
+    processador = ProcessadorPlanilhaOS()
+    nome_arquivo = os.path.basename(caminho)
+    with open(caminho, 'rb') as arquivo:
+        lidos = processador._ler_planilha_em_lotes(
+            File(arquivo, name=nome_arquivo), tamanho_lote or processador.TAMANHO_LOTE
+        )
+        yield from processador._converter_em_lotes(lidos, nome_arquivo)
+
+
+def enviar_lotes_convertidos(caminho: str, fila, tamanho_lote: int = None) -> int:
+    """
+    Roda converter_arquivo num processo filho e põe cada lote na fila assim que
+    fica pronto, para o processo principal gravar enquanto o resto é lido. None
+    na fila marca o fim (também quando a conversão falha: o erro sai no
+    resultado da tarefa). Com a fila limitada, a leitura espera a gravação.
+
+    Returns:
+        Quantidade de lotes enviados
+    """
+    enviados = 0
+    try:
+        for lote in converter_arquivo(caminho, tamanho_lote):
+            fila.put(lote)
+            enviados += 1
+    finally:
+        fila.put(None)
+    return enviados
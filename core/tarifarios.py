@@ -425,7 +425,7 @@ def calcular_preco_servico(servico_obj) -> tuple:
         Tupla (veiculo_recomendado, preco_estimado)
     """
     # Importação local para evitar circular import
-    from core.busca_inteligente_precos import BuscadorInteligentePrecosCodigoDoAnalista
+    from core.busca_inteligente_precos import obter_buscador
     
     # Verificação mais flexível - apenas verifica se tem os atributos necessários
     if not hasattr(servico_obj, 'servico') or not hasattr(servico_obj, 'pax'):
@@ -435,8 +435,8 @@ def calcular_preco_servico(servico_obj) -> tuple:
     veiculo = calcular_veiculo_recomendado(pax)
     preco = 0.0
     
-    # Usa busca inteligente avançada
-    buscador = BuscadorInteligentePrecosCodigoDoAnalista()
+    # Usa o buscador inteligente compartilhado do processo
+    buscador = obter_buscador()
     
     # Busca primeiro no tarifário JW com busca inteligente
     preco = buscador.buscar_preco_jw(
@@ -1,3 +1,872 @@
-from django.test import TestCase
+import gzip
+import io
+import json
+import os
+import re
+import shutil
+import tempfile
+import time as time_module
+from datetime import date, time, timedelta
+from decimal import Decimal
+from difflib import SequenceMatcher
+from importlib import import_module
+from unittest import mock
 
-# Create your tests here.
+import openpyxl
+import pandas as pd
+from django.apps import apps as django_apps
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.http import QueryDict
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from core import busca_inteligente_precos
+from core.busca_inteligente_precos import (
+    BuscadorInteligenteComHistorico, BuscadorInteligentePrecosCodigoDoAnalista,
+    CacheMatchesPersistente, lcs_length, obter_buscador
+)
+from core.cache_servicos import chave_lista_servicos
+from core.classificacao_servicos import classificar_dataframe, classificar_lote, classificar_servico
+from core.deduplicacao import ChaveadorServicos
+from core.models import CacheMatchTarifario, ProcessamentoPlanilha, Servico
+from core.processors import ProcessadorPlanilhaOS
+from core.tarifarios import TARIFARIO_JW, TARIFARIO_MOTORISTAS
+from escalas.models import AlocacaoVan, Escala
+
+
+def lcs_length_referencia(s1, s2):
+    """Programação dinâmica original, usada como referência de paridade"""
+    m, n = len(s1), len(s2)
+    dp = [[0] * (n + 1) for _ in range(m + 1)]
+    for i in range(1, m + 1):
+        for j in range(1, n + 1):
+            if s1[i-1] == s2[j-1]:
+                dp[i][j] = dp[i-1][j-1] + 1
+            else:
+                dp[i][j] = max(dp[i-1][j], dp[i][j-1])
+    return dp[m][n]
+
+
+def similaridade_referencia(buscador, nome1, nome2):
+    """calcular_similaridade original (antes do LCS bit-paralelo)"""
+    if not nome1 or not nome2:
+        return 0.0
+    norm1 = buscador.normalizar_nome_servico(nome1)
+    norm2 = buscador.normalizar_nome_servico(nome2)
+    if norm1 == norm2:
+        return 1.0
+    similaridades = [SequenceMatcher(None, norm1, norm2).ratio()]
+    palavras1 = set(norm1.split())
+    palavras2 = set(norm2.split())
+    if palavras1 or palavras2:
+        uniao = len(palavras1.union(palavras2))
+        similaridades.append(len(palavras1.intersection(palavras2)) / uniao if uniao > 0 else 0)
+    max_len = max(len(norm1), len(norm2))
+    if max_len > 0:
+        similaridades.append(lcs_length_referencia(norm1, norm2) / max_len)
+    importantes1 = palavras1 & buscador.PALAVRAS_IMPORTANTES
+    importantes2 = palavras2 & buscador.PALAVRAS_IMPORTANTES
+    if importantes1 or importantes2:
+        similaridades.append(len(importantes1 & importantes2) / len(importantes1 | importantes2))
+    return sum(similaridades) / len(similaridades)
+
+
+def melhor_match_referencia(buscador, nome_servico, tarifario, threshold):
+    """Varredura exaustiva original de buscar_melhor_match_tarifario"""
+    melhor = (None, 0.0, 0.0)
+    for chave, preco in tarifario.items():
+        for variacao in buscador.gerar_variacoes_nome(nome_servico):
+            similaridade = similaridade_referencia(buscador, variacao, chave)
+            if similaridade > melhor[2] and similaridade >= threshold:
+                melhor = (chave, preco, similaridade)
+    return melhor
+
+
+CONSULTAS = [
+    'TRANSFER IN REGULAR AEROPORTO SANTOS DUMONT (SDU) PARA ZONA SUL RJ',
+    'TRANSFER OUT REGULAR BÚZIOS PARA AEROPORTO INTER. GALEÃO RJ (GIG)',
+    'transfer saida santos dumont centro',
+    'Disposição 04h',
+    'tour petropolis',
+    'hotel copacabana',
+    'apt centro',
+    'xx',
+]
+
+TODAS_AS_CHAVES = list(TARIFARIO_JW) + list(TARIFARIO_MOTORISTAS)
+
+
+class LcsBitParaleloTest(SimpleTestCase):
+    def setUp(self):
+        self.buscador = BuscadorInteligentePrecosCodigoDoAnalista()
+
+    def test_casos_de_borda(self):
+        self.assertEqual(lcs_length('', 'abc'), 0)
+        self.assertEqual(lcs_length('abc', ''), 0)
+        self.assertEqual(lcs_length('abc', 'abc'), 3)
+        self.assertEqual(lcs_length('abcbdab', 'bdcaba'), 4)
+
+    def test_paridade_lcs_em_todas_as_chaves(self):
+        consultas = [self.buscador.normalizar_nome_servico(c) for c in CONSULTAS]
+        for chave in TODAS_AS_CHAVES:
+            normalizada = self.buscador.normalizar_nome_servico(chave)
+            for consulta in consultas + [normalizada[::-1]]:
+                with self.subTest(chave=chave, consulta=consulta):
+                    self.assertEqual(
+                        lcs_length(normalizada, consulta),
+                        lcs_length_referencia(normalizada, consulta)
+                    )
+
+    def test_paridade_similaridade_em_todas_as_chaves(self):
+        for chave in TODAS_AS_CHAVES:
+            for consulta in CONSULTAS + [chave.upper(), chave[:len(chave) // 2]]:
+                with self.subTest(chave=chave, consulta=consulta):
+                    self.assertEqual(
+                        self.buscador.calcular_similaridade(consulta, chave),
+                        similaridade_referencia(self.buscador, consulta, chave)
+                    )
+
+
+class BuscaMelhorMatchTest(SimpleTestCase):
+    def test_indice_retorna_o_mesmo_match_da_varredura_completa(self):
+        buscador = BuscadorInteligentePrecosCodigoDoAnalista()
+        casos = [
+            (TARIFARIO_JW, 0.4),
+            (TARIFARIO_MOTORISTAS, 0.25),
+        ]
+        for tarifario, threshold in casos:
+            for consulta in CONSULTAS + [chave.split('/')[-1] for chave in tarifario]:
+                with self.subTest(consulta=consulta, threshold=threshold):
+                    self.assertEqual(
+                        buscador.buscar_melhor_match_tarifario(consulta, tarifario, threshold),
+                        melhor_match_referencia(buscador, consulta, tarifario, threshold)
+                    )
+
+    def test_candidatos_iguais_ao_ranking_completo(self):
+        buscador = BuscadorInteligentePrecosCodigoDoAnalista()
+        for tarifario, threshold in ((TARIFARIO_JW, 0.4), (TARIFARIO_MOTORISTAS, 0.25)):
+            for consulta in CONSULTAS:
+                ranking = []
+                for posicao, (chave, preco) in enumerate(tarifario.items()):
+                    similaridade = max(
+                        similaridade_referencia(buscador, variacao, chave)
+                        for variacao in buscador.gerar_variacoes_nome(consulta)
+                    )
+                    if similaridade >= threshold and similaridade > 0:
+                        ranking.append((-similaridade, posicao, (chave, preco, similaridade)))
+                esperado = [item for _, _, item in sorted(ranking, key=lambda r: r[:2])[:5]]
+                with self.subTest(consulta=consulta, threshold=threshold):
+                    self.assertEqual(
+                        buscador.buscar_candidatos_tarifario(consulta, tarifario, threshold), esperado
+                    )
+                    self.assertEqual(
+                        buscador.buscar_candidatos_tarifario(consulta, tarifario, threshold, k=2), esperado[:2]
+                    )
+
+    def test_buscador_compartilhado(self):
+        self.assertIs(obter_buscador(), obter_buscador())
+
+
+class CacheMatchesPersistenteTest(TestCase):
+    def test_match_persistido_e_reaproveitado_por_outro_processo(self):
+        nome = 'TRANSFER IN REGULAR AEROPORTO SANTOS DUMONT (SDU) PARA ZONA SUL RJ'
+        primeiro = BuscadorInteligentePrecosCodigoDoAnalista(persistir_matches=True)
+        esperado = primeiro.buscar_melhor_match_tarifario(nome, TARIFARIO_MOTORISTAS, 0.25)
+        self.assertEqual(CacheMatchTarifario.objects.count(), 1)
+
+        # Um novo buscador carrega o match do banco sem recalcular
+        segundo = BuscadorInteligentePrecosCodigoDoAnalista(persistir_matches=True)
+        segundo.calcular_similaridade_normalizada = None
+        self.assertEqual(segundo.buscar_melhor_match_tarifario(nome, TARIFARIO_MOTORISTAS, 0.25), esperado)
+
+    def test_candidatos_persistidos_com_o_match(self):
+        nome = 'TRANSFER IN REGULAR AEROPORTO SANTOS DUMONT (SDU) PARA ZONA SUL RJ'
+        primeiro = BuscadorInteligentePrecosCodigoDoAnalista(persistir_matches=True)
+        primeiro.buscar_melhor_match_tarifario(nome, TARIFARIO_MOTORISTAS, 0.25)
+        esperado = primeiro.buscar_candidatos_tarifario(nome, TARIFARIO_MOTORISTAS, 0.25)
+        self.assertGreater(len(esperado), 1)
+
+        # Após um reinício, os candidatos da tela de detalhes também vêm do banco
+        segundo = BuscadorInteligentePrecosCodigoDoAnalista(persistir_matches=True)
+        segundo.calcular_similaridade_normalizada = None
+        self.assertEqual(segundo.buscar_candidatos_tarifario(nome, TARIFARIO_MOTORISTAS, 0.25), esperado)
+
+    def test_match_gravado_sem_candidatos_e_recalculado(self):
+        nome = 'Disposição 04h'
+        buscador = BuscadorInteligentePrecosCodigoDoAnalista(persistir_matches=True)
+        fingerprint = buscador.obter_indice_tarifario(TARIFARIO_MOTORISTAS).fingerprint
+        CacheMatchTarifario.objects.create(
+            hash_nome=CacheMatchesPersistente.hash_nome(nome), nome_servico=nome,
+            fingerprint_tarifario=fingerprint, threshold=0.25, chave_encontrada=nome, similaridade=1.0
+        )
+        candidatos = buscador.buscar_candidatos_tarifario(nome, TARIFARIO_MOTORISTAS, 0.25)
+        self.assertEqual(candidatos[0][0], nome)
+        buscador.buscar_melhor_match_tarifario(nome, TARIFARIO_MOTORISTAS, 0.25)
+        self.assertEqual(
+            CacheMatchTarifario.objects.get().candidatos,
+            [[chave, similaridade] for chave, _, similaridade in candidatos]
+        )
+
+    def test_falha_no_banco_pausa_o_cache_e_depois_tenta_de_novo(self):
+        cache_persistente = CacheMatchesPersistente()
+        inicio = time_module.monotonic()
+        erro = mock.patch.object(CacheMatchTarifario.objects, 'filter', side_effect=RuntimeError('banco fora'))
+
+        def relogio(segundos):
+            return mock.patch.object(busca_inteligente_precos, 'time', mock.Mock(monotonic=lambda: inicio + segundos))
+
+        with erro, relogio(0):
+            self.assertIsNone(cache_persistente.obter_varios(['Disposição 04h'], ['x']))
+            self.assertFalse(cache_persistente.habilitado)
+        with erro, relogio(31):
+            self.assertTrue(cache_persistente.habilitado)
+            cache_persistente.obter_varios(['Disposição 04h'], ['x'])
+        # Falhas seguidas dobram a espera; o primeiro acerto zera
+        with relogio(31 + 59):
+            self.assertFalse(cache_persistente.habilitado)
+        with relogio(31 + 61):
+            self.assertEqual(cache_persistente.obter_varios(['Disposição 04h'], ['x']), {})
+            self.assertEqual(cache_persistente._espera, 0)
+
+    def test_match_de_outra_versao_do_tarifario_e_ignorado(self):
+        CacheMatchTarifario.objects.create(
+            hash_nome='x' * 40, nome_servico='Disposição 04h', fingerprint_tarifario='antigo',
+            threshold=0.25, chave_encontrada='Hora extra', similaridade=1.0
+        )
+        buscador = BuscadorInteligentePrecosCodigoDoAnalista(persistir_matches=True)
+        chave, _, _ = buscador.buscar_melhor_match_tarifario('Disposição 04h', TARIFARIO_MOTORISTAS, 0.25)
+        self.assertEqual(chave, 'Disposição 04h')
+
+
+def limpar_texto_referencia(texto):
+    """limpar_texto_servico original, com três passadas de regex"""
+    if not texto:
+        return ""
+    texto = str(texto).upper()
+    texto = re.sub(r'[^\w\s]', ' ', texto)
+    texto = re.sub(r'\b\d+\b', '', texto)
+    texto = re.sub(r'\s+', ' ', texto)
+    return texto.strip()
+
+
+def buscar_historico_referencia(buscador, nome_servico, pax):
+    """buscar_em_padroes_historicos original, montando a chave palavra_{pax}pax a cada palavra"""
+    if not nome_servico:
+        return None
+    melhor_preco = None
+    melhor_confianca = 0
+    palavras = limpar_texto_referencia(nome_servico).split()
+    for palavra in palavras:
+        entrada = buscador.cache_historicos.get(f"{palavra}_{pax}pax")
+        if entrada and entrada['confianca'] > melhor_confianca:
+            melhor_preco = entrada['preco']
+            melhor_confianca = entrada['confianca']
+    if not melhor_preco:
+        for palavra in palavras:
+            if palavra in buscador.padroes_historicos:
+                dados = buscador.padroes_historicos[palavra]
+                preco_ajustado = dados['preco_medio'] * (0.8 + 0.2 * (pax / max(dados['pax_medio'], 1)))
+                confianca = dados['count'] / 10
+                if confianca > melhor_confianca:
+                    melhor_preco = preco_ajustado
+                    melhor_confianca = confianca
+    return melhor_preco if melhor_confianca > 0.1 else None
+
+
+class BuscaHistoricaTest(SimpleTestCase):
+    def setUp(self):
+        self.buscador = BuscadorInteligenteComHistorico()
+        self.nomes = CONSULTAS + [
+            'TRANSFER IN REGULAR - 2 PAX (SDU)', 'tour  privativo  04h 10', 'Ônibus 12_3 x', '', '***',
+        ] + [f'{palavra} extra 20' for palavra in self.buscador.padroes_historicos]
+
+    def test_limpeza_em_uma_passada_igual_a_original(self):
+        for nome in self.nomes:
+            with self.subTest(nome=nome):
+                self.assertEqual(self.buscador.limpar_texto_servico(nome), limpar_texto_referencia(nome))
+
+    def test_indice_por_token_igual_a_busca_original(self):
+        for nome in self.nomes:
+            for pax in (1, 3, 7, 13, 20, 40):
+                with self.subTest(nome=nome, pax=pax):
+                    self.assertEqual(
+                        self.buscador.buscar_em_padroes_historicos(nome, pax),
+                        buscar_historico_referencia(self.buscador, nome, pax)
+                    )
+
+
+def classificar_referencia(servico, cliente):
+    """_extrair_detalhes_do_servico original, com buscas por substring"""
+    s = servico.upper() if servico else ""
+    if 'DISPOSIÇÃO' in s or 'DISPOSICAO' in s:
+        tipo = 'DISPOSICAO'
+    elif s.startswith('TOUR'):
+        tipo = 'TOUR'
+    elif 'TRANSFER' in s:
+        tipo = 'TRANSFER'
+    else:
+        tipo = 'OUTRO'
+    direcao = 'IN' if ' IN ' in s else 'OUT' if ' OUT ' in s else 'N/A'
+    aeroporto = 'GIG' if 'GIG' in s or 'INTERNACIONAL' in s else 'SDU' if 'SDU' in s else 'N/A'
+    regioes = {
+        'ZONA SUL': ['Z.SUL', 'ZONA SUL', 'COPACABANA', 'IPANEMA', 'LEBLON'],
+        'SANTOS DUMONT': ['SANTOS DUMONT'],
+        'BARRA': ['BARRA', 'RECREIO'],
+        'CENTRO': ['CENTRO'],
+        'BUZIOS': ['BÚZIOS', 'BUZIOS'],
+        'ANGRA': ['ANGRA DOS REIS', 'ANGRA', 'FRADE', 'VILA GALE'],
+        'PETROPOLIS': ['PETRÓPOLIS', 'PETROPOLIS', 'ITAIPAVA'],
+        'PARATY': ['PARATY'],
+        'MACAE': ['MACAÉ', 'MACAE']
+    }
+    for nome, sinonimos in regioes.items():
+        if any(sin in s for sin in sinonimos):
+            regiao = nome
+            break
+    else:
+        regiao = 'N/A'
+    cliente_lower = cliente.lower() if cliente else ""
+    return {
+        'tipo': tipo,
+        'direcao': direcao,
+        'aeroporto': aeroporto,
+        'regiao': regiao,
+        'eh_regular': 'REGULAR' in s,
+        'eh_prioritario': 'hotelbeds' in cliente_lower or 'holiday' in cliente_lower or regiao == 'BARRA',
+    }
+
+
+class ClassificacaoServicoTest(SimpleTestCase):
+    SERVICOS = CONSULTAS + TODAS_AS_CHAVES + [
+        '', 'Tour Petrópolis', 'TRANSFER OUT - disposição IN Recreio', 'out transfer in ',
+        'TRANSFER IN SDU PARA BARRA E COPACABANA', 'ANGRA DOS REIS / FRADE', 'Z.SUL x ZXSUL',
+        'transfer out regular macaé - internacional', 'BARRACENTRO', 'city tour',
+    ]
+    CLIENTES = ['', 'Hotelbeds Brasil', 'HOLIDAY INN', 'Agência X']
+
+    def test_mesma_classificacao_da_busca_por_substring(self):
+        for servico in self.SERVICOS:
+            for cliente in self.CLIENTES:
+                with self.subTest(servico=servico, cliente=cliente):
+                    self.assertEqual(classificar_servico(servico, cliente), classificar_referencia(servico, cliente))
+
+    def test_classificar_lote_preenche_instancias_sem_salvar(self):
+        servicos = [Servico(servico=nome, cliente='Holiday') for nome in self.SERVICOS]
+        for servico in classificar_lote(servicos):
+            self.assertIsNone(servico.pk)
+            esperado = classificar_referencia(servico.servico, servico.cliente)
+            self.assertEqual({campo: getattr(servico, campo) for campo in esperado}, esperado)
+
+    def test_classificacao_vetorizada_igual_a_por_linha(self):
+        pares = [(servico, cliente) for servico in self.SERVICOS for cliente in self.CLIENTES]
+        derivados = classificar_dataframe(
+            pd.Series([servico for servico, _ in pares] + [None]),
+            pd.Series([cliente for _, cliente in pares] + [None])
+        )
+        for (servico, cliente), linha in zip(pares + [('', '')], derivados.to_dict('records')):
+            with self.subTest(servico=servico, cliente=cliente):
+                self.assertEqual(linha, classificar_referencia(servico, cliente))
+
+    def test_upload_preenche_campos_derivados_antes_do_bulk_create(self):
+        df = pd.DataFrame({
+            'CLIENTE': ['Hotelbeds', 'Agência X', 'Agência Y'],
+            'SERVIÇOS': [
+                'TRANSFER IN REGULAR AEROPORTO SANTOS DUMONT (SDU) PARA ZONA SUL RJ',
+                'TRANSFER OUT PRIVATIVO BARRA PARA GIG',
+                'Disposição 04h',
+            ],
+            'PAX': [2, 4, 6],
+            'DATA': ['15/10/2025', None, None],
+        })
+        servicos = ProcessadorPlanilhaOS()._converter_para_servicos(df, 'os.csv')
+        self.assertEqual(len(servicos), 3)
+        for servico in servicos:
+            esperado = classificar_referencia(servico.servico, servico.cliente)
+            self.assertEqual({campo: getattr(servico, campo) for campo in esperado}, esperado)
+        self.assertEqual(servicos[1].regiao, 'BARRA')
+        self.assertTrue(servicos[1].eh_prioritario)
+
+
+class ConversaoPlanilhaTest(SimpleTestCase):
+    def test_conversao_colunar(self):
+        df = pd.DataFrame({
+            'NÚMERO DA VENDA': [123.0, None, None, None],
+            'CLIENTE': [' Agência X / Titular ', None, None, 'Agência Y'],
+            'SERVIÇOS': ['TRANSFER IN SDU', None, 'Tour Petrópolis', 'Disposição 04h'],
+            'PAX': ['3', None, 'x', 4.7],
+            'HORÁRIO': ['10:30', None, '09:15 PM', 'lixo'],
+            'DATA': ['15/10/2025', '16/10/2025', None, '2025-10-17'],
+        }, index=[0, 2, 3, 5])
+        servicos = ProcessadorPlanilhaOS()._converter_para_servicos(df, 'os.xlsx')
+
+        # A linha sem cliente e sem serviço é pulada, mas a data dela vale para as seguintes
+        self.assertEqual(
+            [(s.numero_venda, s.cliente, s.pax, s.horario, s.data_do_servico, s.linha_original) for s in servicos],
+            [
+                ('123', 'Agência X / Titular', 3, time(10, 30), date(2025, 10, 15), 2),
+                ('', '', 0, time(21, 15), date(2025, 10, 16), 5),
+                ('', 'Agência Y', 4, None, date(2025, 10, 17), 7),
+            ]
+        )
+        self.assertEqual({s.arquivo_origem for s in servicos}, {'os.xlsx'})
+        self.assertEqual([s.tipo for s in servicos], ['TRANSFER', 'TOUR', 'DISPOSICAO'])
+
+    def test_limpeza_vetorizada_igual_a_original(self):
+        brutos = CONSULTAS + TODAS_AS_CHAVES + [
+            None, float('nan'), '', '   ', 'nan', '123 - TRANSFER IN S/GUIA P/ Z.SUL -',
+            '45–TOUR c / guia p/copacabana', 'DISPOSIÇÃO 4 HORAS', 'disposição 10horas extra',
+            'transfer  out   sp/ rj  - ', 'Z.SULINO', 'Tour s/guia - ', '7', '12 -',
+        ]
+        df = pd.DataFrame({'SERVIÇOS': brutos * 3, 'Outra': range(len(brutos) * 3)})
+        resultado = ProcessadorPlanilhaOS()._padronizar_servicos(df.copy())
+        esperado = [limpar_servico_referencia(v) for v in df['SERVIÇOS'].astype(str)]
+        self.assertEqual(resultado['SERVIÇOS'].tolist(), esperado)
+        self.assertEqual(resultado['Outra'].tolist(), df['Outra'].tolist())
+
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class ProcessamentoEmLotesTest(TestCase):
+    CABECALHO = ['Venda', 'Cliente', 'Serviço', 'Pax', 'Hora Voo', 'Data Reserva']
+    LINHAS = [
+        [101, 'Hotelbeds / Fulano', 'TRANSFER IN SDU PARA BARRA', 2, '10:00', '15/10/2025'],
+        [102, 'Agência X', 'Tour Petrópolis', 4, '11:00', None],
+        [None, 'Agência X', 'Dia de folga', 1, None, None],
+        [103, 'Agência Y', '12 - Disposição 4 horas', 5, '12:00', None],
+        [104, 'Agência Y', 'TRANSFER OUT ZONA SUL P/ GIG', 3, '13:00', '16/10/2025'],
+        [105, 'Agência Z', 'TRANSFER OUT ZONA SUL P/ GIG', 1, '14:00', None],
+        [106, 'Agência Z', 'TRANSFER IN GIG', 7, '15:00', None],
+    ]
+
+    def _csv(self):
+        conteudo = pd.DataFrame(self.LINHAS, columns=self.CABECALHO).to_csv(index=False)
+        return SimpleUploadedFile('os.csv', conteudo.encode('utf-8'))
+
+    def _xlsx(self):
+        workbook = openpyxl.Workbook()
+        aba = workbook.active
+        aba.append(self.CABECALHO)
+        for linha in self.LINHAS:
+            aba.append(linha)
+        aba.append([None] * len(self.CABECALHO))
+        conteudo = io.BytesIO()
+        workbook.save(conteudo)
+        return SimpleUploadedFile('os.xlsx', conteudo.getvalue())
+
+    def test_lotes_iguais_a_leitura_completa(self):
+        for arquivo in (self._csv, self._xlsx):
+            Servico.objects.all().delete()
+            with self.subTest(arquivo=arquivo.__name__):
+                processador = ProcessadorPlanilhaOS()
+                completo = processador._converter_para_servicos(
+                    processador._limpar_planilha(processador._ler_planilha(arquivo())), 'os'
+                )
+                processamento = processador.processar_planilha_em_lotes(arquivo(), tamanho_lote=2)
+
+                self.assertEqual(processamento.status, 'CONCLUIDO')
+                self.assertEqual(processamento.total_servicos_criados, 6)
+                self.assertEqual(processamento.data_primeira_linha, date(2025, 10, 15))
+                self.assertEqual(processamento.data_ultima_linha, date(2025, 10, 16))
+
+                campos = ['numero_venda', 'cliente', 'servico', 'pax', 'horario',
+                          'data_do_servico', 'linha_original', 'tipo', 'regiao', 'eh_prioritario']
+                gravados = list(Servico.objects.order_by('linha_original').values_list(*campos))
+                self.assertEqual(gravados, [tuple(getattr(s, c) for c in campos) for s in completo])
+                # A data da linha 2 vale até a troca de data, atravessando os lotes
+                self.assertEqual([g[5] for g in gravados], [date(2025, 10, 15)] * 3 + [date(2025, 10, 16)] * 3)
+
+    def test_linha_vazia_no_meio_nao_desloca_linha_original(self):
+        self.LINHAS = self.LINHAS[:3] + [[None] * len(self.CABECALHO)] + self.LINHAS[3:]
+        processador = ProcessadorPlanilhaOS()
+        completo = processador._converter_para_servicos(
+            processador._limpar_planilha(processador._ler_planilha(self._xlsx())), 'os'
+        )
+        processador.processar_planilha_em_lotes(self._xlsx(), tamanho_lote=2)
+        gravados = list(Servico.objects.order_by('linha_original').values_list('numero_venda', 'linha_original'))
+        self.assertEqual(gravados, [(s.numero_venda, s.linha_original) for s in completo])
+        self.assertIn(('103', 6), gravados)
+
+    def test_migracao_normaliza_numeros_gravados_com_ponto_zero(self):
+        normalizar = import_module('core.migrations.0013_normalizar_numeros_inteiros').normalizar_numeros_inteiros
+        antigo = Servico.objects.create(
+            numero_venda='47639.0', cliente='Agência X', servico='TRANSFER IN GIG', pax=2,
+            horario=time(10, 0), data_do_servico=date(2025, 10, 15), arquivo_origem='os.xlsx', linha_original=2
+        )
+        normalizar(django_apps, None)
+        antigo.refresh_from_db()
+        novo = ChaveadorServicos().aplicar([Servico(
+            numero_venda='47639', cliente='Agência X', servico='TRANSFER IN GIG', pax=2,
+            horario=time(10, 0), data_do_servico=date(2025, 10, 15)
+        )])[0]
+        self.assertEqual(antigo.numero_venda, '47639')
+        self.assertEqual((antigo.chave_natural, antigo.hash_conteudo), (novo.chave_natural, novo.hash_conteudo))
+
+    def test_erro_marca_processamento(self):
+        with self.assertRaises(ValueError):
+            ProcessadorPlanilhaOS().processar_planilha_em_lotes(SimpleUploadedFile('os.txt', b'x'))
+        self.assertEqual(ProcessamentoPlanilha.objects.get().status, 'ERRO')
+
+
+    def test_upload_enfileira_e_worker_processa(self):
+        processamento = ProcessadorPlanilhaOS().enfileirar_planilha(self._xlsx(), usuario='ana')
+        self.assertEqual(processamento.status, 'PENDENTE')
+        self.assertFalse(Servico.objects.exists())
+
+        call_command('processar_planilhas', '--uma-vez', stdout=io.StringIO())
+
+        processamento.refresh_from_db()
+        self.assertEqual(processamento.status, 'CONCLUIDO')
+        self.assertEqual(processamento.linhas_processadas, 6)
+        self.assertEqual(processamento.usuario_upload, 'ana')
+        self.assertEqual(Servico.objects.filter(arquivo_origem='os.xlsx').count(), 6)
+
+        status = self.client.get(reverse('core:status_processamento', args=[processamento.id])).json()
+        self.assertEqual((status['status'], status['total_servicos_criados']), ('CONCLUIDO', 6))
+
+    def test_upload_ajax_responde_sem_processar(self):
+        resposta = self.client.post(
+            reverse('core:upload_planilha'), {'arquivo': self._csv()},
+            HTTP_X_REQUESTED_WITH='XMLHttpRequest'
+        )
+        self.assertEqual(resposta.status_code, 202)
+        dados = resposta.json()
+        self.assertEqual(self.client.get(dados['status_url']).json()['status'], 'PENDENTE')
+        self.assertFalse(Servico.objects.exists())
+
+    def test_reimportacao_nao_duplica_e_atualiza_so_o_que_mudou(self):
+        processador = ProcessadorPlanilhaOS()
+        # openpyxl grava a hora do save no arquivo; o reenvio usa os mesmos bytes
+        conteudo = self._xlsx().read()
+        primeiro = processador.processar_planilha_em_lotes(SimpleUploadedFile('os.xlsx', conteudo), tamanho_lote=2)
+        ids = dict(Servico.objects.values_list('numero_venda', 'id'))
+        self.assertEqual(len(ids), 6)
+
+        # Mesmo arquivo: nenhuma escrita em Servico
+        with CaptureQueriesContext(connection) as consultas:
+            segundo = processador.processar_planilha_em_lotes(SimpleUploadedFile('os.xlsx', conteudo), tamanho_lote=2)
+        escritas = [q['sql'] for q in consultas.captured_queries
+                    if q['sql'].startswith(('INSERT', 'UPDATE')) and '"core_servico"' in q['sql']]
+        self.assertEqual(escritas, [])
+        self.assertEqual(segundo.hash_arquivo, primeiro.hash_arquivo)
+        self.assertEqual(segundo.total_servicos_criados, 0)
+        self.assertIn(f'#{primeiro.id}', segundo.log_processamento)
+
+        # Uma linha muda de PAX e outra é nova
+        self.LINHAS = [list(linha) for linha in self.LINHAS] + [
+            [107, 'Agência W', 'TRANSFER IN GIG', 2, '16:00', None],
+        ]
+        self.LINHAS[1][3] = 9
+        terceiro = processador.processar_planilha_em_lotes(self._xlsx(), tamanho_lote=2)
+        self.assertEqual(terceiro.total_servicos_criados, 1)
+        self.assertIn('1 atualizados', terceiro.log_processamento)
+        self.assertEqual(Servico.objects.count(), 7)
+        alterado = Servico.objects.get(numero_venda='102')
+        self.assertEqual((alterado.id, alterado.pax), (ids['102'], 9))
+
+    def test_linhas_identicas_no_mesmo_arquivo_continuam_distintas(self):
+        self.LINHAS = self.LINHAS + [self.LINHAS[-1]]
+        ProcessadorPlanilhaOS().processar_planilha_em_lotes(self._csv())
+        ProcessadorPlanilhaOS().processar_planilha_em_lotes(self._csv())
+        self.assertEqual(Servico.objects.filter(numero_venda='106').count(), 2)
+
+    def test_servicos_ligados_ao_upload_que_os_criou(self):
+        processador = ProcessadorPlanilhaOS()
+        primeiro = processador.processar_planilha_em_lotes(self._csv())
+        self.LINHAS = self.LINHAS + [[107, 'Agência W', 'TRANSFER IN GIG', 2, '16:00', None]]
+        segundo = processador.processar_planilha_em_lotes(self._csv())
+        self.assertEqual(primeiro.servicos_criados.count(), 6)
+        self.assertEqual(list(segundo.servicos_criados.values_list('numero_venda', flat=True)), ['107'])
+
+        contexto = self.client.get(reverse('core:lista_arquivos')).context
+        self.assertEqual(contexto['total_servicos'], 7)
+        self.assertEqual(
+            {arquivo.id: arquivo.total_servicos for arquivo in contexto['arquivos']},
+            {primeiro.id: 6, segundo.id: 1}
+        )
+
+        # Mesmo nome de arquivo: só os serviços do upload apagado saem
+        self.client.post(reverse('core:deletar_arquivo', args=[primeiro.id]))
+        self.assertEqual(list(Servico.objects.values_list('numero_venda', flat=True)), ['107'])
+
+    def test_importacao_paralela_de_varios_arquivos(self):
+        diretorio = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, diretorio)
+        for nome, deslocamento in (('os_1.csv', 0), ('os_2.csv', 100)):
+            linhas = [[l[0] + deslocamento if l[0] else None] + l[1:] for l in self.LINHAS]
+            pd.DataFrame(linhas, columns=self.CABECALHO).to_csv(os.path.join(diretorio, nome), index=False)
+
+        with open(os.path.join(diretorio, 'leia-me.txt'), 'w') as leia_me:
+            leia_me.write('não é planilha')
+        with open(os.path.join(diretorio, 'os_3.xlsx'), 'wb') as corrompida:
+            corrompida.write(b'isto nao e um xlsx')
+
+        # Lotes de 2 linhas: cada arquivo chega ao processo principal em vários lotes
+        saida = io.StringIO()
+        call_command(
+            'importar_planilhas', os.path.join(diretorio, '*'), '--processos', '2', '--lote', '2', stdout=saida
+        )
+
+        self.assertIn('2 de 3 planilhas importadas', saida.getvalue())
+        self.assertFalse(ProcessamentoPlanilha.objects.filter(nome_arquivo='leia-me.txt').exists())
+        self.assertEqual(ProcessamentoPlanilha.objects.get(nome_arquivo='os_3.xlsx').status, 'ERRO')
+        processamentos = ProcessamentoPlanilha.objects.filter(status='CONCLUIDO')
+        self.assertEqual(sorted(processamentos.values_list('nome_arquivo', flat=True)), ['os_1.csv', 'os_2.csv'])
+        for processamento in processamentos:
+            self.assertEqual(processamento.servicos_criados.count(), 6)
+        self.assertEqual(Servico.objects.get(numero_venda='201').arquivo_origem, 'os_2.csv')
+
+    def test_reprocessa_com_regras_novas_sem_reler_a_planilha(self):
+        processador = ProcessadorPlanilhaOS()
+        processamento = processador.processar_planilha_em_lotes(self._xlsx(), tamanho_lote=2)
+        self.assertTrue(processamento.arquivo_lido.name.endswith('.jsonl'))
+        escala = Escala.objects.create(data=date(2025, 10, 15))
+        tour = Servico.objects.get(servico='Tour Petrópolis')
+        alocacao = AlocacaoVan.objects.create(escala=escala, servico=tour, van='VAN1')
+
+        limpar_servicos = ProcessadorPlanilhaOS._limpar_servicos
+        with mock.patch.object(ProcessadorPlanilhaOS, '_ler_planilha_em_lotes', side_effect=AssertionError), \
+                mock.patch.object(ProcessadorPlanilhaOS, '_limpar_servicos',
+                                  lambda self, s: limpar_servicos(self, s).str.upper()):
+            call_command('reprocessar_planilha', processamento.id, stdout=io.StringIO())
+
+        processamento.refresh_from_db()
+        self.assertEqual((processamento.status, processamento.linhas_processadas), ('CONCLUIDO', 6))
+        # Os nomes que mudaram com a regra nova substituem a versão antiga
+        self.assertEqual(processamento.total_servicos_criados, 2)
+        self.assertEqual(processamento.servicos_criados.count(), 6)
+        self.assertFalse(Servico.objects.filter(servico__in=['Tour Petrópolis', 'Disposição 4h']).exists())
+        self.assertIn('2 serviços da versão anterior substituídos', processamento.log_processamento)
+        # A alocação já feita passa para o serviço novo da mesma linha
+        alocacao.refresh_from_db()
+        self.assertEqual(
+            (alocacao.servico.servico, alocacao.servico.linha_original), ('TOUR PETRÓPOLIS', tour.linha_original)
+        )
+
+    def test_reprocessar_informa_de_onde_leu(self):
+        processamento = ProcessadorPlanilhaOS().processar_planilha_em_lotes(self._csv())
+        saida = io.StringIO()
+        call_command('reprocessar_planilha', processamento.id, stdout=saida)
+        self.assertIn('trechos já lidos', saida.getvalue())
+
+        # Artefato sumido do disco: reprocessar relê o original, e a saída diz isso
+        processamento.refresh_from_db()
+        os.remove(processamento.arquivo_lido.path)
+        saida = io.StringIO()
+        call_command('reprocessar_planilha', processamento.id, stdout=saida)
+        self.assertIn('arquivo original', saida.getvalue())
+        processamento.refresh_from_db()
+        self.assertEqual(processamento.status, 'CONCLUIDO')
+
+    def test_trechos_guardados_voltam_iguais_a_leitura(self):
+        processador = ProcessadorPlanilhaOS()
+        for arquivo in (self._csv, self._xlsx):
+            with self.subTest(arquivo=arquivo.__name__):
+                processamento = processador.processar_planilha_em_lotes(arquivo(), tamanho_lote=4)
+                with processamento.arquivo.open('rb') as original:
+                    lidos = list(processador._ler_planilha_em_lotes(original, 4))
+                guardados = list(processador._ler_lotes_guardados(processamento))
+                self.assertEqual(len(guardados), len(lidos))
+                for lido, guardado in zip(lidos, guardados):
+                    pd.testing.assert_frame_equal(guardado, lido)
+
+    def test_deletar_arquivo_apaga_os_trechos_lidos(self):
+        processamento = ProcessadorPlanilhaOS().processar_planilha_em_lotes(self._xlsx())
+        caminho = processamento.arquivo_lido.path
+        self.assertTrue(os.path.exists(caminho))
+        self.client.post(reverse('core:deletar_arquivo', args=[processamento.id]))
+        self.assertFalse(os.path.exists(caminho))
+
+    def test_worker_nao_repete_processamento_ja_reservado(self):
+        processamento = ProcessadorPlanilhaOS().enfileirar_planilha(self._csv())
+        ProcessamentoPlanilha.objects.filter(id=processamento.id).update(
+            status='PROCESSANDO', updated_at=timezone.now()
+        )
+        call_command('processar_planilhas', '--uma-vez', stdout=io.StringIO())
+        self.assertFalse(Servico.objects.exists())
+
+    def test_worker_reenfileira_processamento_parado(self):
+        processamento = ProcessadorPlanilhaOS().enfileirar_planilha(self._csv())
+        ProcessamentoPlanilha.objects.filter(id=processamento.id).update(
+            status='PROCESSANDO', updated_at=timezone.now() - timedelta(minutes=20)
+        )
+        saida = io.StringIO()
+        call_command('processar_planilhas', '--uma-vez', '--expirar-apos', '15', stdout=saida)
+        self.assertIn('voltou para a fila', saida.getvalue())
+        processamento.refresh_from_db()
+        self.assertEqual(processamento.status, 'CONCLUIDO')
+        self.assertEqual(Servico.objects.count(), 6)
+
+    def test_worker_invalida_estatisticas_em_cache(self):
+        chave = chave_lista_servicos(QueryDict('tipo=TRANSFER'))
+        cache.set(chave, {'total_transfers': 0})
+        ProcessadorPlanilhaOS().enfileirar_planilha(self._csv())
+        call_command('processar_planilhas', '--uma-vez', stdout=io.StringIO())
+        self.assertNotEqual(chave_lista_servicos(QueryDict('tipo=TRANSFER')), chave)
+
+    @override_settings(PLANILHAS_PROCESSAR_NO_UPLOAD=True)
+    def test_upload_processa_na_hora_sem_worker(self):
+        resposta = self.client.post(
+            reverse('core:upload_planilha'), {'arquivo': self._csv()},
+            HTTP_X_REQUESTED_WITH='XMLHttpRequest'
+        )
+        self.assertEqual(resposta.status_code, 200)
+        self.assertEqual(self.client.get(resposta.json()['status_url']).json()['status'], 'CONCLUIDO')
+        self.assertEqual(Servico.objects.count(), 6)
+
+
+    @override_settings(PLANILHAS_PROCESSAR_NO_UPLOAD=True)
+    def test_upload_na_hora_nao_pode_ser_reservado_pelo_worker(self):
+        from core.management.commands.processar_planilhas import Command as ProcessarPlanilhas
+
+        executar = ProcessadorPlanilhaOS.executar_processamento
+        durante = {}
+
+        def executar_com_worker_rodando(processador, processamento, *args, **kwargs):
+            # Um worker que rode enquanto a requisição processa não encontra nada para reservar
+            durante['status'] = ProcessamentoPlanilha.objects.get(id=processamento.id).status
+            durante['reservado'] = ProcessarPlanilhas().reservar_proximo()
+            return executar(processador, processamento, *args, **kwargs)
+
+        with mock.patch.object(ProcessadorPlanilhaOS, 'executar_processamento', executar_com_worker_rodando):
+            self.client.post(
+                reverse('core:upload_planilha'), {'arquivo': self._csv()},
+                HTTP_X_REQUESTED_WITH='XMLHttpRequest'
+            )
+
+        self.assertEqual(durante, {'status': 'PROCESSANDO', 'reservado': None})
+        self.assertEqual(ProcessamentoPlanilha.objects.get().status, 'CONCLUIDO')
+        self.assertEqual(Servico.objects.count(), 6)
+
+class ImportarControleMensalTest(TestCase):
+    CSV = (
+        'Controle VAN 01 e 02 _ Fretamento _ NOVEMBRO 25,,,,,,,,,,,,,\n'
+        'Data,Nr Venda,Qtdade Pax,Horário,Início,Término,Serviços,Valor Custo Tarifário,'
+        'Valor Van/Dia,OBservação,Acumulado Van 01,Rent Van 01,Acumulado Van 02,Rent Van 02\n'
+        ',47639 / 47640,8,07:00,,,In Regular Gig x ZSul,"R$ 308,00","-R$ 635,17",,,"R$ 12,50",,\n'
+        '03/11/25,,,,,,,,,,,,,\n'
+        ',57224,4,06:30,,,Out Privativo Barra x Gig,"R$ 1.362,00",,,,,,\n'
+        'Van 02,52894,8,12:20,,,Out Regular ZSul x Gig,"R$ 231,00",,,,,,"R$ 1.290,00"\n'
+        ',,,,,,,"R$ 1.593,00","R$ 456,83",,,,,\n'
+    )
+
+    def test_importa_planilha_do_mes_em_lote(self):
+        Escala.objects.create(data=date(2025, 11, 3))
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', encoding='utf-8', delete=False) as arquivo:
+            arquivo.write(self.CSV)
+        self.addCleanup(os.remove, arquivo.name)
+        saida = io.StringIO()
+        call_command('importar_controle_mensal', arquivo.name, stdout=saida)
+
+        alocacoes = AlocacaoVan.objects.select_related('servico', 'escala').order_by('ordem')
+        self.assertEqual(
+            [(a.servico.numero_venda, a.escala.data, a.van, a.preco_calculado) for a in alocacoes],
+            [
+                ('47639', date(2025, 11, 1), 'VAN1', Decimal('308.00')),
+                ('47640', date(2025, 11, 1), 'VAN1', Decimal('308.00')),
+                ('57224', date(2025, 11, 3), 'VAN1', Decimal('1362.00')),
+                ('52894', date(2025, 11, 3), 'VAN2', Decimal('231.00')),
+            ]
+        )
+        self.assertEqual(alocacoes[0].lucratividade, Decimal('12.50'))
+        self.assertIsNone(alocacoes[3].lucratividade)
+        self.assertEqual(alocacoes[2].servico.regiao, 'BARRA')
+        self.assertEqual(Escala.objects.count(), 2)
+        self.assertIn('linhas/s', saida.getvalue())
+
+
+class RebuildHistoricoPrecosTest(TestCase):
+    def setUp(self):
+        pasta = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, pasta)
+        self.arquivo = os.path.join(pasta, 'historico_precos.json.gz')
+        configuracao = override_settings(HISTORICO_PRECOS_ARQUIVO=self.arquivo)
+        configuracao.enable()
+        self.addCleanup(configuracao.disable)
+        self.escala = Escala.objects.create(data=date(2025, 10, 15))
+        self.alocacoes = [
+            self._alocar('TRANSFER IN REGULAR GIG ZONA SUL', 3, '120.00'),
+            self._alocar('TRANSFER OUT REGULAR ZONA SUL GIG', 3, '110.00'),
+            self._alocar('TOUR PETROPOLIS PRIVATIVO', 6, '900.00'),
+        ]
+
+    def _alocar(self, nome, pax, preco):
+        servico = Servico.objects.create(
+            cliente='Holiday', servico=nome, pax=pax, data_do_servico=self.escala.data
+        )
+        return AlocacaoVan.objects.create(
+            escala=self.escala, servico=servico, van='VAN1', preco_calculado=Decimal(preco)
+        )
+
+    def _rodar(self, *args):
+        saida = io.StringIO()
+        call_command('rebuild_price_history', *args, stdout=saida)
+        with gzip.open(self.arquivo, 'rt', encoding='utf-8') as arquivo:
+            dados = json.load(arquivo)
+        return saida.getvalue(), {chave: dados[chave] for chave in ('padroes', 'pendentes')}
+
+    def _completo(self):
+        return self._rodar('--completo')[1]
+
+    def test_incremental_igual_a_reconstrucao_completa(self):
+        self._rodar()
+        self._alocar('TRANSFER IN REGULAR GIG BARRA', 2, '150.00')
+        saida, incremental = self._rodar()
+        self.assertIn('1 alocações processadas', saida)
+        self.assertEqual(incremental, self._completo())
+
+    def test_reprecificacao_e_remocao_reconstroem_tudo(self):
+        self._rodar()
+        alocacao = AlocacaoVan.objects.get(pk=self.alocacoes[0].pk)
+        alocacao.preco_calculado = Decimal('135.00')
+        alocacao.save(update_fields=['preco_calculado'])
+        saida, dados = self._rodar()
+        self.assertIn('reconstruindo tudo', saida)
+        self.assertEqual(dados, self._completo())
+        self.assertEqual(dados['padroes']['TRANSFER']['preco_max'], 135.0)
+
+        self.alocacoes[2].delete()
+        saida, dados = self._rodar()
+        self.assertIn('reconstruindo tudo', saida)
+        self.assertEqual(dados, self._completo())
+        self.assertNotIn('TOUR', {**dados['padroes'], **dados['pendentes']})
+
+    def test_arquivo_gerado_fica_fora_do_pacote_e_e_relido(self):
+        self.addCleanup(setattr, busca_inteligente_precos, '_historico_precos', None)
+        distribuido = busca_inteligente_precos.ARQUIVO_HISTORICO_PRECOS.stat().st_mtime_ns
+        self._rodar()
+        self.assertEqual(busca_inteligente_precos.ARQUIVO_HISTORICO_PRECOS.stat().st_mtime_ns, distribuido)
+
+        padroes = busca_inteligente_precos.carregar_historico_precos()[0]
+        self.assertIn('TRANSFER', padroes)
+        with gzip.open(self.arquivo, 'wt', encoding='utf-8') as arquivo:
+            json.dump({'padroes': {}}, arquivo)
+        self.assertIn('TRANSFER', busca_inteligente_precos.carregar_historico_precos()[0])
+        # Passado o intervalo de verificação, o arquivo novo é relido sem reiniciar o processo
+        depois = time_module.monotonic() + busca_inteligente_precos.INTERVALO_VERIFICACAO_HISTORICO + 1
+        with mock.patch.object(busca_inteligente_precos, 'time', mock.Mock(monotonic=lambda: depois)):
+            self.assertEqual(busca_inteligente_precos.carregar_historico_precos()[0], {})
+
+
+def limpar_servico_referencia(servico_original):
+    """_limpar_servico original, aplicado célula a célula"""
+    if pd.isna(servico_original) or servico_original == 'nan':
+        return ""
+    servico = str(servico_original).strip()
+    servico = re.sub(r'^\d+\s*[-–]?\s*', '', servico)
+    if re.search(r'S\s*\/\s*GUIA', servico, flags=re.IGNORECASE):
+        servico = re.sub(r'S\s*\/\s*GUIA', 'Sem Guia', servico, flags=re.IGNORECASE)
+    if re.search(r'C\s*\/\s*GUIA', servico, flags=re.IGNORECASE):
+        servico = re.sub(r'C\s*\/\s*GUIA', 'Com Guia', servico, flags=re.IGNORECASE)
+    servico = re.sub(r'P\/\s*', 'PARA ', servico, flags=re.IGNORECASE)
+    servico = re.sub(r'\bZ\.SUL\b', 'ZONA SUL', servico, flags=re.IGNORECASE)
+    servico = re.sub(r'\s*-\s*$', '', servico).strip()
+    servico = re.sub(r'\s{2,}', ' ', servico).strip()
+    disposicao_match = re.search(r'disposição (\d+)\s*horas', servico, re.IGNORECASE)
+    if disposicao_match:
+        return f"Disposição {disposicao_match.group(1)}h"
+    return servico
@@ -1,4 +1,6 @@
+from django.conf import settings
 from django.shortcuts import render, redirect, get_object_or_404
+from django.urls import reverse
 from django.contrib import messages
 from django.http import JsonResponse, HttpResponse
 from django.views import View
@@ -13,6 +15,7 @@ from datetime import datetime, date, timedelta
 from core.models import Servico, ProcessamentoPlanilha
 from escalas.models import Escala, AlocacaoVan
 from core.processors import ProcessadorPlanilhaOS
+from core.cache_servicos import chave_dashboard, chave_lista_servicos, invalidar_cache_servicos
 from escalas.services import GerenciadorEscalas, ExportadorEscalas
 from escalas.views import parse_data_brasileira
 import json
@@ -30,7 +33,7 @@ class HomeView(View):
             return redirect('authentication:login')
             
         # Tenta buscar do cache primeiro
-        cache_key = f"dashboard_stats_{request.user.id}"
+        cache_key = chave_dashboard(request.user.id)
         cached_data = cache.get(cache_key)
         
         if cached_data:
@@ -222,29 +225,20 @@ class UploadPlanilhaView(View):
             return redirect('core:upload_planilha')
         
         try:
-            # Processa a planilha
+            # Por padrão só grava e enfileira: o worker (manage.py processar_planilhas) processa em lotes
             processador = ProcessadorPlanilhaOS()
-            servicos, processamento = processador.processar_planilha(arquivo)
-            
-            # Atualiza informações adicionais do processamento
-            if processamento:
-                processamento.tamanho_arquivo = arquivo.size
-                processamento.usuario_upload = request.user.username
-                processamento.total_servicos_criados = len(servicos)
-                
-                # Determina período dos serviços
-                if servicos:
-                    datas_servicos = [s.data_do_servico for s in servicos]
-                    processamento.data_primeira_linha = min(datas_servicos)
-                    processamento.data_ultima_linha = max(datas_servicos)
-                
-                processamento.save()
-            
-            # Limpa cache relacionado após nova importação
-            cache.delete_many([
-                f"dashboard_stats_{request.user.id}",
-                "lista_servicos_stats_*"
-            ])
+            if settings.PLANILHAS_PROCESSAR_NO_UPLOAD:
+                # Deploy sem worker com acesso ao MEDIA_ROOT (ex.: Heroku): processa na própria
+                # requisição. Já nasce PROCESSANDO para nenhum worker reservar o mesmo arquivo.
+                processamento = processador.enfileirar_planilha(
+                    arquivo, usuario=request.user.username, status='PROCESSANDO'
+                )
+                try:
+                    processador.executar_processamento(processamento)
+                finally:
+                    invalidar_cache_servicos()
+            else:
+                processamento = processador.enfileirar_planilha(arquivo, usuario=request.user.username)
             
             # Log da atividade de upload bem-sucedido
             from core.activity_utils import log_activity
@@ -252,26 +246,32 @@ class UploadPlanilhaView(View):
                 request=request,
                 activity_type='UPLOAD',
                 description=f'Upload de planilha realizado: {arquivo.name}',
-                details=f'Arquivo {arquivo.name} processado com {len(servicos)} serviços importados',
+                details=f'Arquivo {arquivo.name} enviado para processamento',
                 object_type='Arquivo',
-                object_id=str(processamento.id) if processamento else '',
+                object_id=str(processamento.id),
                 extra_data={
                     'arquivo_nome': arquivo.name,
                     'arquivo_tamanho': arquivo.size,
-                    'servicos_importados': len(servicos)
                 }
             )
             
-            success_msg = f'Planilha processada com sucesso! {len(servicos)} serviços foram importados.'
+            if processamento.status == 'CONCLUIDO':
+                success_msg = (
+                    f'Planilha processada com sucesso! '
+                    f'{processamento.total_servicos_criados} serviços foram importados.'
+                )
+            else:
+                success_msg = 'Planilha recebida! O processamento continua em segundo plano.'
             
-            # Se for AJAX, retorna JSON
+            # Se for AJAX, retorna JSON com o endereço para acompanhar o progresso
             if is_ajax:
                 return JsonResponse({
                     'success': True,
                     'message': success_msg,
-                    'registros': len(servicos),
+                    'processamento_id': processamento.id,
+                    'status_url': reverse('core:status_processamento', args=[processamento.id]),
                     'arquivo': arquivo.name
-                })
+                }, status=200 if processamento.status == 'CONCLUIDO' else 202)
             
             messages.success(request, success_msg)
             return redirect('core:lista_arquivos')
@@ -296,51 +296,33 @@ class ListaArquivosView(ListView):
     paginate_by = 20
     
     def get_queryset(self):
+        # Serviços e serviços escalados de cada arquivo vêm na mesma consulta, pela FK
         return ProcessamentoPlanilha.objects.filter(
             status='CONCLUIDO'
+        ).annotate(
+            total_servicos=Count('servicos_criados', distinct=True),
+            servicos_escalados=Count(
+                'servicos_criados',
+                filter=Q(servicos_criados__alocacaovan__isnull=False),
+                distinct=True
+            ),
         ).order_by('-created_at')
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         
-        # Importar aqui para evitar dependência circular
-        from escalas.models import AlocacaoVan
-        
         # Estatísticas dos arquivos com queries otimizadas
-        queryset = self.get_queryset()
-        total_arquivos = queryset.count()
-        
-        # Calcular total de serviços de forma mais eficiente
-        total_servicos_calculado = 0
-        for arquivo in queryset:
-            if arquivo.total_servicos_criados:
-                total_servicos_calculado += arquivo.total_servicos_criados
-            else:
-                # Fallback: contar serviços reais
-                servicos_count = Servico.objects.filter(arquivo_origem=arquivo.nome_arquivo).count()
-                total_servicos_calculado += servicos_count
+        total_arquivos = ProcessamentoPlanilha.objects.filter(status='CONCLUIDO').count()
+        total_servicos_calculado = Servico.objects.filter(processamento__status='CONCLUIDO').count()
         
         # Adicionar informações sobre serviços escalados para cada arquivo
         arquivos_com_info = []
         arquivos_queryset = context.get('arquivos', []) or context.get('object_list', [])
         
         for arquivo in arquivos_queryset:
-            # Buscar serviços relacionados
-            servicos = Servico.objects.filter(arquivo_origem=arquivo.nome_arquivo)
-            
-            if not servicos.exists():
-                # Fallback por data
-                servicos = Servico.objects.filter(created_at__date=arquivo.created_at.date())
-            
-            # Contar serviços escalados
-            servicos_escalados = 0
-            for servico in servicos:
-                if AlocacaoVan.objects.filter(servico=servico).exists():
-                    servicos_escalados += 1
+            servicos_escalados = arquivo.servicos_escalados
             
             # Adicionar informações ao arquivo
-            arquivo.total_servicos = servicos.count()
-            arquivo.servicos_escalados = servicos_escalados
             arquivo.servicos_deletaveis = arquivo.total_servicos - servicos_escalados
             arquivo.pode_deletar_completo = (servicos_escalados == 0 and arquivo.total_servicos > 0)
             
@@ -387,17 +369,7 @@ class ServicosArquivoView(ListView):
         arquivo_id = self.kwargs.get('arquivo_id')
         self.arquivo = get_object_or_404(ProcessamentoPlanilha, id=arquivo_id, status='CONCLUIDO')
         
-        # Primeiro tenta usar o campo arquivo_origem para associação direta
-        queryset = Servico.objects.filter(
-            arquivo_origem=self.arquivo.nome_arquivo
-        ).select_related()
-        
-        # Se não encontrar serviços com arquivo_origem, usa data como fallback
-        if not queryset.exists():
-            data_upload = self.arquivo.created_at.date()
-            queryset = Servico.objects.filter(
-                created_at__date=data_upload
-            ).select_related()
+        queryset = Servico.objects.filter(processamento=self.arquivo)
         
         # Aplicar filtros da URL
         data_inicio = self.request.GET.get('data_inicio')
@@ -466,7 +438,7 @@ class ListaServicosView(ListView):
         context = super().get_context_data(**kwargs)
         
         # Cache das estatísticas por 5 minutos
-        cache_key = f"lista_servicos_stats_{hash(str(self.request.GET))}"
+        cache_key = chave_lista_servicos(self.request.GET)
         stats = cache.get(cache_key)
         
         if not stats:
@@ -622,13 +594,7 @@ class DeletarArquivoView(View):
             logger.info(f"Iniciando deleção do arquivo {nome_arquivo} pelo usuário {request.user.username}")
             
             # Busca serviços relacionados a este arquivo
-            servicos_relacionados = Servico.objects.filter(arquivo_origem=arquivo.nome_arquivo)
-            
-            # Se não encontrar por nome do arquivo, tenta por data (fallback)
-            if not servicos_relacionados.exists():
-                data_upload = arquivo.created_at.date()
-                servicos_relacionados = Servico.objects.filter(created_at__date=data_upload)
-                logger.info(f"Usando fallback por data para arquivo {nome_arquivo}: {servicos_relacionados.count()} serviços encontrados")
+            servicos_relacionados = Servico.objects.filter(processamento=arquivo)
             
             total_servicos = servicos_relacionados.count()
             logger.info(f"Arquivo {nome_arquivo}: {total_servicos} serviços serão deletados")
@@ -648,7 +614,9 @@ class DeletarArquivoView(View):
                 if not request.headers.get('X-Requested-With') == 'XMLHttpRequest':
                     messages.success(request, mensagem_deletados)
             
-            # Deleta o arquivo sempre
+            # Deleta o arquivo sempre; os trechos lidos guardados para reprocessar saem junto
+            if arquivo.arquivo_lido:
+                arquivo.arquivo_lido.delete(save=False)
             arquivo.delete()  # Deleta o arquivo físico e o registro
             logger.info(f"Arquivo {nome_arquivo} deletado completamente")
             mensagem_arquivo = f'Arquivo "{nome_arquivo}" foi deletado completamente.'
@@ -658,10 +626,7 @@ class DeletarArquivoView(View):
                 messages.success(request, mensagem_arquivo)
             
             # Limpa cache relacionado
-            cache.delete_many([
-                f"dashboard_stats_{request.user.id}",
-                "lista_servicos_stats_*"
-            ])
+            invalidar_cache_servicos()
             
             # Se for requisição AJAX, retorna JSON
             if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
@@ -713,6 +678,7 @@ class StatusProcessamentoView(View):
                 'status': processamento.status,
                 'linhas_processadas': processamento.linhas_processadas,
                 'linhas_erro': processamento.linhas_erro,
+                'total_servicos_criados': processamento.total_servicos_criados,
                 'log': processamento.log_processamento,
             })
         except ProcessamentoPlanilha.DoesNotExist:
@@ -0,0 +1,73 @@
+"""
+Agenda de uma van durante a otimização da escala.
+
+Cada serviço aceito é um intervalo [início, fim) em minutos desde a meia-noite
+do dia da escala. Um serviço que passa da meia-noite fica com fim > 1440, então
+as comparações com os outros serviços do dia não dão a volta no relógio.
+
+Como a agenda nunca aceita sobreposição, ordenar os intervalos pelo início
+também deixa os fins em ordem. Com as duas listas ordenadas, a pergunta "cabe
+com 3 horas de intervalo?" sai de dois bisect, e a posição de inserção já é a
+ordem do serviço na van.
+"""
+from bisect import bisect_left, bisect_right, insort
+
+INTERVALO_MINIMO_MINUTOS = 180  # 3 horas após o fim do serviço anterior
+
+
+def minutos_do_dia(horario):
+    """datetime.time -> minutos desde a meia-noite"""
+    return horario.hour * 60 + horario.minute
+
+
+def formatar_minutos(minutos):
+    """Minutos desde a meia-noite -> 'HH:MM' (depois da meia-noite volta a 00:00)"""
+    return f'{minutos // 60 % 24:02d}:{minutos % 60:02d}'
+
+
+class AgendaVan:
+    """Intervalos aceitos numa van, em listas paralelas de inícios e fins ordenados"""
+
+    def __init__(self):
+        self.inicios = []
+        self.fins = []
+
+    def __len__(self):
+        return len(self.inicios)
+
+    def __iter__(self):
+        return zip(self.inicios, self.fins)
+
+    def conflito(self, inicio, fim):
+        """
+        Verifica se o serviço [inicio, fim) cabe na van:
+        - Não pode haver sobreposição
+        - Deve ter 3 horas de intervalo após o serviço anterior
+
+        Returns:
+            None se couber, senão (motivo, (inicio, fim) do serviço agendado que impede)
+        """
+        # Entre os serviços que começam antes do fim deste, o último é o que termina mais tarde
+        anterior_ao_fim = bisect_left(self.inicios, fim)
+        if anterior_ao_fim and self.fins[anterior_ao_fim - 1] > inicio:
+            agendado = anterior_ao_fim - 1
+            return 'sobreposição', (self.inicios[agendado], self.fins[agendado])
+
+        # Serviço que terminou mais perto (antes ou junto) do início deste
+        terminados = bisect_right(self.fins, inicio)
+        if terminados and inicio - self.fins[terminados - 1] < INTERVALO_MINIMO_MINUTOS:
+            agendado = terminados - 1
+            return 'intervalo insuficiente', (self.inicios[agendado], self.fins[agendado])
+
+        return None
+
+    def adicionar(self, inicio, fim):
+        """
+        Registra o serviço na agenda
+
+        Returns:
+            Ordem do serviço na van (quantos serviços começam até o seu início, ele incluído)
+        """
+        insort(self.inicios, inicio)
+        insort(self.fins, fim)
+        return bisect_right(self.inicios, inicio)
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.7 on 2026-10-17 18:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("escalas", "0011_alter_status_alocacao_default"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="logescala",
+            name="acao",
+            field=models.CharField(
+                choices=[
+                    ("CRIAR", "Escala Criada"),
+                    ("PUXAR_DADOS", "Dados Puxados"),
+                    ("OTIMIZAR", "Escala Otimizada"),
+                    ("AGRUPAR", "Serviços Agrupados"),
+                    ("FORMATAR", "Escala Formatada"),
+                    ("APROVAR", "Escala Aprovada"),
+                    ("REJEITAR", "Escala Rejeitada"),
+                    ("EXPORTAR", "Escala Exportada"),
+                    ("EXCLUIR", "Escala Excluída"),
+                    ("ADICIONAR_MANUAL", "Serviço Adicionado Manualmente"),
+                ],
+                max_length=20,
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.7 on 2026-10-17 18:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("escalas", "0012_alter_logescala_acao"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="alocacaovan",
+            name="precificado_em",
+            field=models.DateTimeField(
+                blank=True,
+                db_index=True,
+                help_text="Quando o preço calculado mudou pela última vez (marca do rebuild_price_history)",
+                null=True,
+            ),
+        ),
+    ]
@@ -262,6 +262,10 @@ class AlocacaoVan(models.Model):
     veiculo_recomendado = models.CharField(max_length=50, null=True, blank=True)
     lucratividade = models.DecimalField(max_digits=5, decimal_places=2, null=True, blank=True, help_text="Score de lucratividade")
     detalhes_precificacao = models.JSONField(null=True, blank=True, help_text="Detalhes de como o preço foi calculado")
+    precificado_em = models.DateTimeField(
+        null=True, blank=True, db_index=True,
+        help_text="Quando o preço calculado mudou pela última vez (marca do rebuild_price_history)"
+    )
     
     # Status de alocação para otimização
     STATUS_ALOCACAO_CHOICES = [
@@ -294,12 +298,61 @@ class AlocacaoVan(models.Model):
     def __str__(self):
         return f"{self.servico.cliente} - {self.van} (Ordem: {self.ordem})"
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instancia = super().from_db(db, field_names, values)
+        # Preço como está no banco, para saber se mudou ao salvar
+        instancia._preco_lido = instancia.__dict__.get('preco_calculado')
+        return instancia
+    
+    def marcar_precificacao(self):
+        """
+        Atualiza precificado_em se o preço mudou desde a leitura do banco.
+        
+        Returns:
+            True se a marca mudou (o campo precisa ser gravado)
+        """
+        if 'preco_calculado' not in self.__dict__:
+            return False  # campo adiado e não alterado
+        
+        def centavos(valor):
+            return None if valor is None else round(float(valor), 2)
+        
+        lido = getattr(self, '_preco_lido', None)
+        if centavos(self.preco_calculado) == centavos(lido):
+            return False
+        self.precificado_em = timezone.now()
+        self._preco_lido = self.preco_calculado
+        return True
+    
+    def save(self, *args, **kwargs):
+        campos = kwargs.get('update_fields')
+        if campos is None or 'preco_calculado' in campos:
+            if self.marcar_precificacao() and campos is not None:
+                kwargs['update_fields'] = {*campos, 'precificado_em'}
+        super().save(*args, **kwargs)
+    
     def calcular_preco_e_veiculo(self):
         """
         Calcula e armazena preço e veículo recomendado usando sistema inteligente
         que consulta tanto o tarifário JW quanto o de motoristas com busca fuzzy
         """
-        from core.busca_inteligente_precos import BuscadorInteligentePrecosCodigoDoAnalista
+        veiculo, preco, _ = self.preparar_precificacao()
+        self.save()
+        return veiculo, preco
+    
+    def preparar_precificacao(self, resultados_busca=None):
+        """
+        Preenche preço, veículo, lucratividade e detalhes sem salvar.
+        
+        Args:
+            resultados_busca: dict opcional {(servico, pax): (veiculo, preco, fonte)}
+                compartilhado entre alocações para buscar cada par uma única vez
+        
+        Returns:
+            Tuple (veiculo, preco, fonte)
+        """
+        from core.busca_inteligente_precos import obter_buscador
         from decimal import Decimal, InvalidOperation
         from django.utils import timezone
         import logging
@@ -307,15 +360,21 @@ class AlocacaoVan(models.Model):
         logger = logging.getLogger(__name__)
         
         try:
-            # Inicializar buscador inteligente
-            buscador = BuscadorInteligentePrecosCodigoDoAnalista()
+            # Buscador inteligente compartilhado (índice e caches reaproveitados)
+            buscador = obter_buscador()
             
             # Buscar preço usando algoritmo inteligente
-            veiculo, preco, fonte = buscador.buscar_preco_inteligente(
-                nome_servico=self.servico.servico,
-                pax=self.servico.pax,
-                numero_venda=str(self.servico.numero_venda) if self.servico.numero_venda else "1"
-            )
+            chave_busca = (self.servico.servico, self.servico.pax)
+            if resultados_busca is not None and chave_busca in resultados_busca:
+                veiculo, preco, fonte = resultados_busca[chave_busca]
+            else:
+                veiculo, preco, fonte = buscador.buscar_preco_inteligente(
+                    nome_servico=self.servico.servico,
+                    pax=self.servico.pax,
+                    numero_venda=str(self.servico.numero_venda) if self.servico.numero_venda else "1"
+                )
+                if resultados_busca is not None:
+                    resultados_busca[chave_busca] = (veiculo, preco, fonte)
             
             # Obter detalhes adicionais da precificação
             detalhes = {
@@ -331,11 +390,13 @@ class AlocacaoVan(models.Model):
             }
             
             # Tentar obter mais detalhes específicos do tarifário usado
+            candidatos = []
             if 'JW' in fonte:
-                # Buscar chave específica no JW
-                chave_jw, preco_jw, sim_jw = buscador.buscar_melhor_match_tarifario(
+                # Candidatos do JW (o primeiro é o match usado no preço)
+                candidatos = buscador.buscar_candidatos_tarifario(
                     self.servico.servico, buscador.TARIFARIO_JW, 0.4
                 )
+                chave_jw, preco_jw, sim_jw = candidatos[0] if candidatos else (None, 0.0, 0.0)
                 detalhes.update({
                     'tarifario': 'JW',
                     'chave_encontrada': chave_jw,
@@ -344,10 +405,11 @@ class AlocacaoVan(models.Model):
                     'observacoes': f'Preço do veículo {veiculo} na tabela JW'
                 })
             elif 'Motoristas' in fonte:
-                # Buscar chave específica no Motoristas
-                chave_mot, preco_mot, sim_mot = buscador.buscar_melhor_match_tarifario(
+                # Candidatos do Motoristas (o primeiro é o match usado no preço)
+                candidatos = buscador.buscar_candidatos_tarifario(
                     self.servico.servico, buscador.TARIFARIO_MOTORISTAS, 0.25
                 )
+                chave_mot, preco_mot, sim_mot = candidatos[0] if candidatos else (None, 0.0, 0.0)
                 detalhes.update({
                     'tarifario': 'Motoristas',
                     'chave_encontrada': chave_mot,
@@ -366,6 +428,16 @@ class AlocacaoVan(models.Model):
                     'observacoes': f'Preço padrão baseado no veículo {veiculo} e {self.servico.pax} PAX'
                 })
             
+            # Demais candidatos considerados, para conferência na tela de detalhes
+            detalhes['historico_busca'] = [
+                {
+                    'termo': chave,
+                    'score': round(float(similaridade), 4),
+                    'preco': float(preco_chave.get(veiculo, 0) if isinstance(preco_chave, dict) else preco_chave),
+                }
+                for chave, preco_chave, similaridade in candidatos
+            ]
+            
             # Validar resultado
             if preco is None or preco == '' or str(preco).strip() == '':
                 preco = 0.0
@@ -390,8 +462,7 @@ class AlocacaoVan(models.Model):
                        f"PAX: {self.servico.pax} | Veículo: {veiculo} | "
                        f"Preço: R$ {preco:.2f} | Fonte: {fonte}")
             
-            self.save()
-            return veiculo, preco
+            return veiculo, preco, fonte
             
         except (InvalidOperation, ValueError, TypeError, ZeroDivisionError) as e:
             # Em caso de erro, usar valores padrão inteligentes baseados no PAX
@@ -435,8 +506,7 @@ class AlocacaoVan(models.Model):
             
             logger.info(f"Usando preço padrão - PAX: {pax} | Veículo: {veiculo_padrao} | Preço: R$ {preco_padrao:.2f}")
             
-            self.save()
-            return veiculo_padrao, preco_padrao
+            return veiculo_padrao, preco_padrao, 'Padrão (erro)'
 
 
 class LogEscala(models.Model):
@@ -446,6 +516,7 @@ class LogEscala(models.Model):
         ('CRIAR', 'Escala Criada'),
         ('PUXAR_DADOS', 'Dados Puxados'),
         ('OTIMIZAR', 'Escala Otimizada'),
+        ('AGRUPAR', 'Serviços Agrupados'),
         ('FORMATAR', 'Escala Formatada'),
         ('APROVAR', 'Escala Aprovada'),
         ('REJEITAR', 'Escala Rejeitada'),
@@ -0,0 +1,113 @@
+"""
+Perfil do texto de um serviço para agrupamento e escala.
+
+O agrupamento e a otimização da escala consultam o mesmo texto muitas vezes
+(nome normalizado, privativo, transfer IN/OUT regular, tour...). O perfil
+reúne tudo isso numa tupla calculada uma vez por texto distinto e guardada
+num lru_cache, então as regras em GerenciarEscalasView só leem campos.
+"""
+import re
+import unicodedata
+from functools import lru_cache
+from typing import NamedTuple
+
+TERMOS_PRIVATIVO = ['PRIVATIVO', 'PRIVADO', 'EXCLUSIVO', 'VEICULO PRIVATIVO', 'VEÍCULO PRIVATIVO']
+TERMOS_TOUR_EQUIVALENTE = ['TOUR', 'GUIA A DISPOSICAO', 'VEICULO + GUIA', 'VEICULO E GUIA']
+TERMOS_TOUR_ALTO_VALOR = [
+    'TOUR', 'VEÍCULO + GUIA À DISPOSIÇÃO', 'VEICULO + GUIA A DISPOSICAO',
+    'GUIA À DISPOSIÇÃO', 'GUIA A DISPOSICAO',
+]
+TERMOS_DESTINO_BARRA = ['BARRA', 'BARRA DA TIJUCA', 'RECREIO']
+DURACAO_PADRAO_MINUTOS = 180  # transfers e outros: 3 horas
+
+# (padrão, substituição) aplicados ao nome sem acentos e em maiúsculas, em ordem
+NORMALIZACOES_NOME = [
+    (re.compile(r'\s+'), ' '),
+    (re.compile(r'RJ\s*\(GIG\)'), 'GIG'),
+    (re.compile(r'RJ\s*\(SDU\)'), 'SDU'),
+    (re.compile(r'\(GIG\)'), 'GIG'),
+    (re.compile(r'\(SDU\)'), 'SDU'),
+    (re.compile(r'AEROPORTO\s+INTER\.\s+GALEÃO'), 'AEROPORTO GALEAO'),
+    (re.compile(r'AEROPORTO\s+SANTOS\s+DUMONT'), 'AEROPORTO SDU'),
+    (re.compile(r'[,\.](?!\d)'), ''),
+    (re.compile(r'\s+'), ' '),
+    (re.compile(r'TRANSFER\s+IN\s+REGULAR'), 'TRANSFER IN REGULAR'),
+    (re.compile(r'TRANSFER\s+OUT\s+REGULAR'), 'TRANSFER OUT REGULAR'),
+    (re.compile(r'TRANSFER\s+IN\s+VEÍCULO\s+PRIVATIVO'), 'TRANSFER IN PRIVATIVO'),
+    (re.compile(r'TRANSFER\s+OUT\s+VEÍCULO\s+PRIVATIVO'), 'TRANSFER OUT PRIVATIVO'),
+]
+
+RE_GUIA_DISPOSICAO = re.compile(r'GUIA\s*A\s*DISPOSICAO\s*\d+\s*HORAS?')
+# Duração de tours no nome: "06 HORAS", "GUIA À DISPOSIÇÃO 08 HORAS", "DISPOSIÇÃO 10H"
+RES_DURACAO_HORAS = [
+    re.compile(r'(\d+)\s*HORAS?'),
+    re.compile(r'GUIA.*DISPOSIÇÃO.*(\d+)\s*HORAS?'),
+    re.compile(r'DISPOSIÇÃO.*(\d+)H'),
+]
+
+
+class PerfilServico(NamedTuple):
+    texto_sem_acentos: str  # sem acentos e em maiúsculas
+    nome_normalizado: str
+    privativo: bool
+    transfer_out: bool
+    transfer_in_regular: bool
+    transfer_out_regular: bool
+    tour_equivalente: bool
+    guia_disposicao: bool
+    in_out: bool
+    tour_alto_valor: bool
+    destino_barra: bool
+    duracao_ocupacao_minutos: int
+
+
+def remover_acentos(texto) -> str:
+    """Remove acentos para comparações resilientes"""
+    if not texto:
+        return ''
+    if isinstance(texto, str):
+        texto_normalizado = unicodedata.normalize('NFKD', texto)
+        return ''.join(c for c in texto_normalizado if not unicodedata.combining(c))
+    return str(texto)
+
+
+def _duracao_ocupacao_minutos(texto_upper: str) -> int:
+    for padrao in RES_DURACAO_HORAS:
+        match = padrao.search(texto_upper)
+        if match:
+            return int(match.group(1)) * 60
+    return DURACAO_PADRAO_MINUTOS
+
+
+@lru_cache(maxsize=8192)
+def _perfil_texto(texto: str) -> PerfilServico:
+    sem_acentos = remover_acentos(texto).upper()
+    # As regras de escala comparam o texto em maiúsculas ainda com acentos
+    upper = texto.upper()
+
+    nome_normalizado = sem_acentos.strip()
+    for padrao, substituicao in NORMALIZACOES_NOME:
+        nome_normalizado = padrao.sub(substituicao, nome_normalizado)
+
+    transfer = 'TRANSFER' in sem_acentos
+    regular = 'REGULAR' in sem_acentos
+    transfer_out = transfer and 'OUT' in sem_acentos
+    return PerfilServico(
+        texto_sem_acentos=sem_acentos,
+        nome_normalizado=nome_normalizado.strip(),
+        privativo=any(termo in sem_acentos for termo in TERMOS_PRIVATIVO),
+        transfer_out=transfer_out,
+        transfer_in_regular=transfer and 'IN' in sem_acentos and regular,
+        transfer_out_regular=transfer_out and regular,
+        tour_equivalente=any(termo in sem_acentos for termo in TERMOS_TOUR_EQUIVALENTE),
+        guia_disposicao=RE_GUIA_DISPOSICAO.search(sem_acentos) is not None,
+        in_out='TRANSFER' in upper and ('IN' in upper or 'OUT' in upper),
+        tour_alto_valor=any(termo in upper for termo in TERMOS_TOUR_ALTO_VALOR),
+        destino_barra=any(termo in upper for termo in TERMOS_DESTINO_BARRA),
+        duracao_ocupacao_minutos=_duracao_ocupacao_minutos(upper),
+    )
+
+
+def perfil_servico(texto) -> PerfilServico:
+    """Perfil do texto do serviço, calculado uma vez por texto distinto"""
+    return _perfil_texto(texto if isinstance(texto, str) else remover_acentos(texto))
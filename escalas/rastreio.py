@@ -0,0 +1,50 @@
+"""
+Rastreio das decisões de agrupamento e escala.
+
+Desligado por padrão. Com ESCALAS_RASTREIO_DECISOES = True, cada decisão
+(grupo montado ou recusado, van escolhida, conflito de horário...) vira um
+dict num buffer circular de tamanho fixo, que vai para o dados_depois do
+LogEscala da ação. Desligado, nada é formatado nem escrito: quem registra
+dentro de laços confere rastreio.ativo antes de montar o evento.
+"""
+from collections import deque
+
+from django.conf import settings
+
+CAPACIDADE_PADRAO = 2000
+
+
+class RastreioDecisoes:
+    """Buffer circular com as últimas decisões de uma ação de escala"""
+
+    def __init__(self, ativo=False, capacidade=CAPACIDADE_PADRAO):
+        self.ativo = ativo
+        self.eventos = deque(maxlen=capacidade)
+        self.descartados = 0
+
+    def registrar(self, evento, **dados):
+        if not self.ativo:
+            return
+        if len(self.eventos) == self.eventos.maxlen:
+            self.descartados += 1
+        self.eventos.append({'evento': evento, **dados})
+
+    def exportar(self):
+        """Conteúdo serializável para LogEscala.dados_depois"""
+        return {
+            'eventos': list(self.eventos),
+            'descartados': self.descartados,
+        }
+
+
+RASTREIO_DESLIGADO = RastreioDecisoes()
+
+
+def novo_rastreio():
+    """Rastreio de uma ação, ligado ou não conforme as settings"""
+    if not getattr(settings, 'ESCALAS_RASTREIO_DECISOES', False):
+        return RASTREIO_DESLIGADO
+    return RastreioDecisoes(
+        ativo=True,
+        capacidade=getattr(settings, 'ESCALAS_RASTREIO_CAPACIDADE', CAPACIDADE_PADRAO),
+    )
@@ -945,4 +945,80 @@ class ExportadorEscalas:
         wb.save(buffer)
         buffer.seek(0)
 
-        return buffer.getvalue()
\ No newline at end of file
+        return buffer.getvalue()
+
+CAMPOS_PRECIFICACAO = [
+    'preco_calculado', 'veiculo_recomendado', 'lucratividade', 'detalhes_precificacao', 'precificado_em'
+]
+
+
+def categorizar_fonte_preco(fonte: str) -> str:
+    """Agrupa a fonte retornada pela busca inteligente em JW / Motoristas / padrão"""
+    if 'JW' in fonte:
+        return 'JW'
+    if 'Motoristas' in fonte:
+        return 'Motoristas'
+    return 'padrão'
+
+
+def precificar_lote(alocacoes) -> Dict:
+    """
+    Precifica um conjunto de alocações em uma única passada.
+    
+    Cada par (servico, pax) distinto é buscado uma única vez no buscador
+    compartilhado e todas as alocações são gravadas com um único bulk_update.
+    O cache persistente de matches é lido numa consulta para o lote inteiro e
+    os matches novos são gravados num único bulk_create.
+    
+    Returns:
+        Dict com servicos_precificados, servicos_com_erro, valor_total e
+        estatisticas_fonte (contagem por JW / Motoristas / padrão)
+    """
+    from core.busca_inteligente_precos import obter_buscador
+    
+    if hasattr(alocacoes, 'select_related'):
+        alocacoes = alocacoes.select_related('servico')
+    alocacoes = list(alocacoes)
+    
+    resultados_busca = {}
+    atualizadas = []
+    servicos_com_erro = 0
+    total_valor = 0.0
+    estatisticas_fonte = {'JW': 0, 'Motoristas': 0, 'padrão': 0}
+    
+    nomes = (alocacao.servico.servico for alocacao in alocacoes if alocacao.servico is not None)
+    with obter_buscador().lote_persistente(nomes):
+        for alocacao in alocacoes:
+            try:
+                veiculo_anterior = alocacao.veiculo_recomendado
+                preco_anterior = alocacao.preco_calculado
+                
+                veiculo, preco, fonte = alocacao.preparar_precificacao(resultados_busca)
+                alocacao.marcar_precificacao()
+                
+                if preco > 0:
+                    estatisticas_fonte[categorizar_fonte_preco(fonte)] += 1
+                
+                atualizadas.append(alocacao)
+                total_valor += preco
+                
+                if veiculo != veiculo_anterior or abs(preco - float(preco_anterior or 0)) > 0.01:
+                    logger.info(f"🔄 Atualização - {alocacao.servico.servico[:30]}... | "
+                               f"{veiculo_anterior or 'N/A'} → {veiculo} | "
+                               f"R$ {preco_anterior or 0:.2f} → R$ {preco:.2f}")
+            except Exception as e:
+                logger.error(f"❌ Erro ao precificar alocação {alocacao.id}: {e}")
+                servicos_com_erro += 1
+    
+    if atualizadas:
+        AlocacaoVan.objects.bulk_update(atualizadas, CAMPOS_PRECIFICACAO, batch_size=500)
+    
+    logger.info(f"Precificação em lote: {len(atualizadas)} alocações, "
+                f"{len(resultados_busca)} buscas distintas")
+    
+    return {
+        'servicos_precificados': len(atualizadas),
+        'servicos_com_erro': servicos_com_erro,
+        'valor_total': total_valor,
+        'estatisticas_fonte': estatisticas_fonte,
+    }
@@ -1,3 +1,255 @@
-from django.test import TestCase
+import io
+import random
+from contextlib import redirect_stdout
+from datetime import date, time
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from core.busca_inteligente_precos import BuscadorInteligentePrecosCodigoDoAnalista
+from core.models import Servico
+from escalas.agenda_van import INTERVALO_MINIMO_MINUTOS, AgendaVan, formatar_minutos, minutos_do_dia
+from escalas.models import Escala, AlocacaoVan, LogEscala, ServicoGrupo
+from escalas.perfil_servico import _perfil_texto, perfil_servico
+from escalas.services import precificar_lote
+from escalas.views import GerenciarEscalasView
+
+
+class PrecificarLoteTest(TestCase):
+    def setUp(self):
+        self.escala = Escala.objects.create(data=date(2025, 10, 15), etapa='DADOS_PUXADOS')
+        nomes = [
+            ('TRANSFER IN REGULAR AEROPORTO SANTOS DUMONT (SDU) PARA ZONA SUL RJ', 2),
+            ('TRANSFER IN REGULAR AEROPORTO SANTOS DUMONT (SDU) PARA ZONA SUL RJ', 2),
+            ('Disposição 04h', 5),
+        ]
+        for ordem, (nome, pax) in enumerate(nomes):
+            servico = Servico.objects.create(
+                cliente=f'Cliente {ordem}', servico=nome, pax=pax,
+                data_do_servico=self.escala.data
+            )
+            AlocacaoVan.objects.create(escala=self.escala, servico=servico, van='VAN1', ordem=ordem)
+
+    def test_precifica_todas_as_alocacoes_com_um_bulk_update(self):
+        buscador = BuscadorInteligentePrecosCodigoDoAnalista(persistir_matches=True)
+        alocacoes = self.escala.alocacoes.all()
+        with mock.patch('core.busca_inteligente_precos.buscador_inteligente', buscador):
+            # Buscador recém-criado: aquecimento do LRU, uma consulta dos matches do
+            # lote e um bulk_create dos novos (cada um num savepoint), além do
+            # SELECT das alocações e do UPDATE
+            with CaptureQueriesContext(connection) as consultas:
+                resultado = precificar_lote(alocacoes)
+            sqls = [q['sql'] for q in consultas.captured_queries if not q['sql'].startswith(('SAVEPOINT', 'RELEASE'))]
+            self.assertEqual(len(sqls), 5, sqls)
+            self.assertEqual(sum(sql.startswith('UPDATE') for sql in sqls), 1)
+            self.assertEqual(sum(sql.startswith('INSERT') for sql in sqls), 1)
+            
+            # Tudo no LRU: só o SELECT das alocações e o UPDATE
+            with self.assertNumQueries(2):
+                precificar_lote(alocacoes)
+
+        self.assertEqual(resultado['servicos_precificados'], 3)
+        self.assertEqual(resultado['servicos_com_erro'], 0)
+        self.assertEqual(sum(resultado['estatisticas_fonte'].values()), 3)
+
+        for alocacao in self.escala.alocacoes.select_related('servico'):
+            self.assertIsNotNone(alocacao.preco_calculado)
+            self.assertIsNotNone(alocacao.veiculo_recomendado)
+            self.assertEqual(alocacao.detalhes_precificacao['servico_original'], alocacao.servico.servico)
+
+    def test_mesmo_resultado_que_precificacao_individual(self):
+        precificar_lote(self.escala.alocacoes.all())
+        em_lote = {a.id: (a.veiculo_recomendado, a.preco_calculado)
+                   for a in self.escala.alocacoes.all()}
+
+        for alocacao in self.escala.alocacoes.all():
+            alocacao.calcular_preco_e_veiculo()
+            alocacao.refresh_from_db()
+            self.assertEqual(em_lote[alocacao.id], (alocacao.veiculo_recomendado, alocacao.preco_calculado))
+
+
+def agrupar_referencia(view, alocacoes):
+    """Agrupamento original: cada base testada contra todas as outras com _servicos_sao_compativeis"""
+    grupos, agrupados = [], set()
+    for base in alocacoes:
+        if base.id in agrupados:
+            continue
+        regra = view._detectar_regra_agrupamento(base.servico)
+        compativeis = [
+            outra for outra in alocacoes
+            if outra.id != base.id and outra.id not in agrupados
+            and view._servicos_sao_compativeis(
+                base.servico, outra.servico, considerar_total_pax=regra != 'TRANSFER_OUT_REGULAR'
+            )
+        ]
+        if not compativeis:
+            continue
+        if regra == 'TRANSFER_OUT_REGULAR' and base.servico.pax + sum(o.servico.pax for o in compativeis) < 4:
+            continue
+        grupo = [base.id] + [outra.id for outra in compativeis]
+        agrupados.update(grupo)
+        grupos.append(grupo)
+    return grupos
+
+
+class AgruparServicosTest(TestCase):
+    NOMES = [
+        'TRANSFER OUT REGULAR HOTEIS ZONA SUL PARA AEROPORTO GIG',
+        'Transfer  Out Regular hotéis Zona Sul para Aeroporto GIG',
+        'TRANSFER OUT REGULAR BARRA PARA AEROPORTO INTERNACIONAL',
+        'TRANSFER IN REGULAR AEROPORTO SANTOS DUMONT (SDU) PARA ZONA SUL RJ',
+        'TRANSFER IN REGULAR AEROPORTO RJ (GIG) PARA ZONA SUL',
+        'TRANSFER IN VEÍCULO PRIVATIVO GIG PARA BARRA',
+        'TOUR PETROPOLIS',
+        'Guia à disposição 4 horas',
+        'VEICULO + GUIA CENTRO HISTORICO',
+        'Disposição 04h',
+    ]
+    PICKUPS = ['', 'Hotel Copacabana Palace', 'HOTEL COPACABANA PALACE ', 'Windsor Barra']
+
+    def _criar_escala(self, quantidade):
+        sorteio = random.Random(21)
+        escala = Escala.objects.create(data=date(2025, 10, 15), etapa='DADOS_PUXADOS')
+        for ordem in range(quantidade):
+            horario = None if ordem % 17 == 0 else time(sorteio.randint(5, 20), sorteio.choice([0, 10, 20, 30, 40, 50]))
+            servico = Servico.objects.create(
+                cliente=f'Cliente {ordem}', servico=sorteio.choice(self.NOMES), pax=sorteio.randint(1, 4),
+                local_pickup=sorteio.choice(self.PICKUPS), horario=horario,
+                numero_venda=str(ordem), data_do_servico=escala.data
+            )
+            AlocacaoVan.objects.create(
+                escala=escala, servico=servico, van='VAN1', ordem=ordem, preco_calculado=Decimal('10.50')
+            )
+        return escala
+
+    def test_mesmos_grupos_que_a_comparacao_par_a_par(self):
+        escala = self._criar_escala(120)
+        view = GerenciarEscalasView()
+        alocacoes = list(escala.alocacoes.select_related('servico').order_by('servico__horario', 'id'))
+        esperado = agrupar_referencia(view, alocacoes)
+        self.assertGreater(len(esperado), 5)
+
+        self.assertEqual(view._agrupar_servicos(escala), len(esperado))
+        obtido = [
+            list(grupo.servicos.order_by('id').values_list('alocacao_id', flat=True))
+            for grupo in escala.grupos.order_by('id')
+        ]
+        self.assertEqual(obtido, esperado)
+        self.assertEqual(ServicoGrupo.objects.count(), sum(len(grupo) for grupo in esperado))
+
+
+    def test_grava_grupos_e_membros_com_dois_inserts(self):
+        escala = self._criar_escala(120)
+        with CaptureQueriesContext(connection) as consultas:
+            grupos_criados = GerenciarEscalasView()._agrupar_servicos(escala)
+        escritas = [q['sql'] for q in consultas.captured_queries if q['sql'].startswith(('INSERT', 'UPDATE'))]
+        self.assertEqual(len(escritas), 2)
+        self.assertGreater(grupos_criados, 5)
+
+        for grupo in escala.grupos.prefetch_related('servicos__alocacao__servico'):
+            membros = [sg.alocacao for sg in grupo.servicos.all()]
+            self.assertEqual(grupo.total_pax, sum(a.servico.pax for a in membros))
+            self.assertEqual(grupo.total_valor, Decimal('10.50') * len(membros))
+            self.assertEqual(set(grupo.numeros_venda.split(' / ')), {a.servico.numero_venda for a in membros})
+
+
+    def test_rastreio_desligado_nao_escreve_nada(self):
+        escala = self._criar_escala(120)
+        saida = io.StringIO()
+        with redirect_stdout(saida):
+            GerenciarEscalasView()._agrupar_servicos(escala)
+        self.assertEqual(saida.getvalue(), '')
+        self.assertFalse(LogEscala.objects.filter(escala=escala).exists())
+
+    @override_settings(ESCALAS_RASTREIO_DECISOES=True, ESCALAS_RASTREIO_CAPACIDADE=10)
+    def test_rastreio_ligado_vai_para_o_log_da_escala(self):
+        escala = self._criar_escala(120)
+        grupos_criados = GerenciarEscalasView()._agrupar_servicos(escala)
+
+        log = LogEscala.objects.get(escala=escala, acao='AGRUPAR')
+        self.assertEqual(log.dados_depois['grupos_criados'], grupos_criados)
+        rastreio = log.dados_depois['rastreio']
+        # Buffer circular: só as últimas decisões ficam, o resto é contado
+        self.assertEqual(len(rastreio['eventos']), 10)
+        self.assertGreater(rastreio['descartados'], 0)
+        self.assertTrue({'grupo', 'sem_grupo'} >= {e['evento'] for e in rastreio['eventos']})
+
+    @override_settings(ESCALAS_RASTREIO_DECISOES=True)
+    def test_rastreio_das_alocacoes_na_otimizacao(self):
+        escala = self._criar_escala(60)
+        view = GerenciarEscalasView()
+        view._agrupar_servicos(escala)
+        view._otimizar_escala(escala)
+
+        log = LogEscala.objects.get(escala=escala, acao='OTIMIZAR')
+        eventos = log.dados_depois['rastreio']['eventos']
+        alocados = [e for e in eventos if e['evento'] == 'alocado']
+        self.assertTrue(alocados)
+        # Um evento por candidato (grupo ou serviço solto); o total conta alocações
+        self.assertLessEqual(len(alocados), log.dados_depois['alocados'])
+        self.assertTrue(any(e['evento'] == 'conflito' for e in eventos))
+
+
+class PerfilServicoTest(SimpleTestCase):
+    def test_flags_e_nome_normalizado(self):
+        perfil = perfil_servico('Transfer  In Regular Aeroporto RJ (GIG) para Barra, Recreio')
+        self.assertEqual(perfil.nome_normalizado, 'TRANSFER IN REGULAR AEROPORTO GIG PARA BARRA RECREIO')
+        self.assertTrue(perfil.transfer_in_regular and perfil.in_out and perfil.destino_barra)
+        self.assertFalse(perfil.transfer_out_regular or perfil.privativo or perfil.tour_equivalente)
+        self.assertEqual(perfil.duracao_ocupacao_minutos, 180)
+
+        guia = perfil_servico('VEÍCULO + GUIA À DISPOSIÇÃO 06 HORAS')
+        self.assertTrue(guia.tour_equivalente and guia.guia_disposicao and guia.tour_alto_valor)
+        self.assertEqual(guia.duracao_ocupacao_minutos, 360)
+        self.assertTrue(perfil_servico('TRANSFER OUT VEÍCULO PRIVATIVO').privativo)
+        self.assertEqual(perfil_servico(None).nome_normalizado, '')
+
+    def test_calculado_uma_vez_por_texto(self):
+        texto = 'TOUR PETRÓPOLIS IMPERIAL'
+        perfil_servico(texto)
+        acertos = _perfil_texto.cache_info().hits
+        view = GerenciarEscalasView()
+        view._eh_servico_privativo(texto)
+        view._eh_servico_tour_equivalente(texto)
+        view._normalizar_nome_servico(texto)
+        self.assertEqual(_perfil_texto.cache_info().hits, acertos + 3)
+
+
+class AgendaVanTest(SimpleTestCase):
+    def _cabe_referencia(self, agendados, inicio, fim):
+        """Varredura original de _van_pode_aceitar_servico, em minutos"""
+        for agendado_inicio, agendado_fim in agendados:
+            if not (fim <= agendado_inicio or inicio >= agendado_fim):
+                return False
+            if agendado_fim <= inicio and inicio - agendado_fim < INTERVALO_MINIMO_MINUTOS:
+                return False
+        return True
+
+    def test_mesmo_resultado_que_a_varredura_da_lista(self):
+        sorteio = random.Random(25)
+        for _ in range(50):
+            agenda, agendados = AgendaVan(), []
+            for _ in range(40):
+                inicio = sorteio.randrange(0, 24 * 60, 5)
+                fim = inicio + sorteio.choice([0, 60, 180, 360, 480, 600])
+                cabe = self._cabe_referencia(agendados, inicio, fim)
+                self.assertEqual(agenda.conflito(inicio, fim) is None, cabe)
+                if cabe:
+                    agendados.append((inicio, fim))
+                    ordem = agenda.adicionar(inicio, fim)
+                    self.assertEqual(ordem, len([a for a in agendados if a[0] <= inicio]))
+            self.assertEqual(list(agenda), sorted(agendados))
+
+    def test_servico_que_passa_da_meia_noite(self):
+        agenda = AgendaVan()
+        inicio = minutos_do_dia(time(22, 0))
+        agenda.adicionar(inicio, inicio + 180)
+        self.assertEqual(formatar_minutos(inicio + 180), '01:00')
+
+        motivo, agendado = agenda.conflito(minutos_do_dia(time(23, 30)), minutos_do_dia(time(23, 30)) + 180)
+        self.assertEqual(motivo, 'sobreposição')
+        self.assertEqual(agendado, (1320, 1500))
+        self.assertEqual(agenda.conflito(minutos_do_dia(time(18, 0)), minutos_do_dia(time(21, 0))), None)
@@ -13,13 +13,16 @@ from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_protect, ensure_csrf_cookie
 from datetime import datetime, date, timedelta
 from decimal import Decimal, InvalidOperation
+from bisect import bisect_left, bisect_right
 from calendar import monthrange
-import re
-import unicodedata
+from collections import defaultdict
 from core.models import Servico, ProcessamentoPlanilha
 from escalas.models import Escala, AlocacaoVan, GrupoServico, ServicoGrupo, LogEscala
+from escalas.agenda_van import AgendaVan, formatar_minutos, minutos_do_dia
+from escalas.perfil_servico import perfil_servico, remover_acentos
+from escalas.rastreio import RASTREIO_DESLIGADO, novo_rastreio
 from core.processors import ProcessadorPlanilhaOS
-from escalas.services import GerenciadorEscalas, ExportadorEscalas
+from escalas.services import GerenciadorEscalas, ExportadorEscalas, precificar_lote
 from core.tarifarios import calcular_preco_servico
 import json
 import logging
@@ -304,6 +307,9 @@ class SelecionarMesView(LoginRequiredMixin, View):
 
 class GerenciarEscalasView(LoginRequiredMixin, View):
     """View para gerenciar escalas de um mês específico"""
+
+    # Trocado por um rastreio novo a cada _agrupar_servicos/_otimizar_escala
+    _rastreio = RASTREIO_DESLIGADO
     
     def get(self, request, mes=None, ano=None):
         # Se não especificado, usar mês atual
@@ -391,13 +397,10 @@ class GerenciarEscalasView(LoginRequiredMixin, View):
                     return redirect('escalas:selecionar_ano')
                 
                 try:
-                    print(f"DEBUG: Tentando agrupar serviços para escala {escala.id}")
                     grupos_criados = self._agrupar_servicos(escala)
-                    print(f"DEBUG: Agrupamento retornou {grupos_criados} grupos")
                     logger.debug(f"Agrupamento concluído - Grupos criados: {grupos_criados}")
                     messages.success(request, f'Agrupamento concluído! {grupos_criados} grupos criados para {data_alvo.strftime("%d/%m/%Y")}.')
                 except Exception as e:
-                    print(f"DEBUG: Erro no agrupamento: {e}")
                     logger.error(f"Erro no agrupamento: {e}")
                     messages.error(request, f'Erro ao agrupar serviços: {e}')
                 
@@ -442,6 +445,7 @@ class GerenciarEscalasView(LoginRequiredMixin, View):
         5. STATUS: Marca como 'Alocado' ou 'Não alocado'
         """
         logger.info(f"🚀 INICIANDO ESCALAR - Sistema de otimização avançado para escala {escala.id}")
+        self._rastreio = novo_rastreio()
         
         with transaction.atomic():
             # RESETAR TODOS OS STATUS PARA NÃO ALOCADO
@@ -456,6 +460,7 @@ class GerenciarEscalasView(LoginRequiredMixin, View):
                 logger.warning("⚠️ Nenhum candidato encontrado com 4-10 PAX")
                 escala.etapa = 'OTIMIZADA'
                 escala.save()
+                self._gravar_rastreio(escala, 'OTIMIZAR', 'Escala otimizada sem candidatos (4-10 PAX)', {})
                 return
             
             # ETAPA 2: PRIORIZAÇÃO
@@ -464,8 +469,8 @@ class GerenciarEscalasView(LoginRequiredMixin, View):
             
             # ETAPA 3: ALOCAÇÃO INICIAL NAS VANS (Prioritários)
             logger.info("🎯 ETAPA 3 - Alocando serviços prioritários...")
-            van1_schedule = []  # [(horario_inicio, horario_fim)]
-            van2_schedule = []
+            van1_schedule = AgendaVan()
+            van2_schedule = AgendaVan()
             
             alocados_prioritarios = 0
             for candidato in prioritarios:
@@ -525,141 +530,259 @@ class GerenciarEscalasView(LoginRequiredMixin, View):
             logger.info(f"   📊 Van 1: {escala.alocacoes.filter(status_alocacao='ALOCADO', van='VAN1').count()} serviços")
             logger.info(f"   📊 Van 2: {escala.alocacoes.filter(status_alocacao='ALOCADO', van='VAN2').count()} serviços")
 
+            self._gravar_rastreio(
+                escala,
+                'OTIMIZAR',
+                f'Escala otimizada - {total_alocados} alocados, {total_nao_alocados} não alocados',
+                {'alocados': total_alocados, 'nao_alocados': total_nao_alocados}
+            )
+
+    def _gravar_rastreio(self, escala, acao, descricao, dados):
+        """Anexa as decisões rastreadas ao LogEscala da ação, se o rastreio estiver ligado"""
+        if not self._rastreio.ativo:
+            return
+        LogEscala.objects.create(
+            escala=escala,
+            acao=acao,
+            descricao=descricao,
+            dados_depois={**dados, 'rastreio': self._rastreio.exportar()}
+        )
+
     def _agrupar_servicos(self, escala):
         """Agrupa serviços compatíveis na escala"""
-        print(f"DEBUG: Iniciando _agrupar_servicos para escala {escala.id}")
-        grupos_criados = 0
+        self._rastreio = novo_rastreio()
+        grupos = []  # (GrupoServico ainda não salvo, alocações do grupo)
         
         logger.debug(f"Iniciando agrupamento para escala {escala.id}")
         
-        with transaction.atomic():
-            # Buscar alocações que ainda não estão agrupadas
-            alocacoes_disponiveis = list(
-                escala.alocacoes.filter(grupo_info__isnull=True)
-                .select_related('servico')
-                .order_by('servico__horario', 'id')
-            )
+        # Buscar alocações que ainda não estão agrupadas
+        alocacoes_disponiveis = list(
+            escala.alocacoes.filter(grupo_info__isnull=True)
+            .select_related('servico')
+            .order_by('servico__horario', 'id')
+        )
 
-            logger.debug(
-                "Encontradas %s alocações disponíveis para agrupamento",
-                len(alocacoes_disponiveis)
-            )
+        logger.debug(
+            "Encontradas %s alocações disponíveis para agrupamento",
+            len(alocacoes_disponiveis)
+        )
 
-            for alocacao in alocacoes_disponiveis:
-                if getattr(alocacao, 'grupo_info', None):
-                    # Já foi agrupada em uma iteração anterior
-                    continue
+        # Assinatura de cada serviço calculada uma vez; a busca olha só os
+        # baldes da base dentro da janela de horário
+        assinaturas = [self._assinatura_agrupamento(a.servico) for a in alocacoes_disponiveis]
+        baldes = self._indexar_para_agrupamento(assinaturas)
+        agrupados = set()
 
-                # Buscar serviços compatíveis para agrupamento
-                print(f"Analisando alocação {alocacao.id}: {alocacao.servico.cliente} - {alocacao.servico.servico}")
-                servicos_compativeis, regra_agrupamento = self._encontrar_servicos_compativeis(
-                    alocacao,
-                    alocacoes_disponiveis
-                )
-                print(f"Encontrados {len(servicos_compativeis)} serviços compatíveis com regra: {regra_agrupamento}")
+        for indice, alocacao in enumerate(alocacoes_disponiveis):
+            if indice in agrupados:
+                # Já foi agrupada em uma iteração anterior
+                continue
 
-                if not servicos_compativeis:
-                    continue
+            # Buscar serviços compatíveis para agrupamento
+            indices_compativeis, regra_agrupamento = self._encontrar_servicos_compativeis(
+                indice,
+                assinaturas,
+                baldes,
+                agrupados
+            )
 
-                # Criar grupo consolidado
-                grupo = GrupoServico.objects.create(
-                    escala=escala,
-                    van=alocacao.van or 'VAN1',
-                    cliente_principal=alocacao.servico.cliente,
-                    servico_principal=alocacao.servico.servico,
-                    local_pickup_principal=alocacao.servico.local_pickup or '',
-                    ordem=alocacao.ordem,
-                )
+            if not indices_compativeis:
+                if self._rastreio.ativo:
+                    self._rastreio.registrar('sem_grupo', alocacao=alocacao.id, regra=regra_agrupamento)
+                continue
 
-                total_pax = 0
-                total_valor = Decimal('0')
-                vendas = []
+            agrupados.add(indice)
+            agrupados.update(indices_compativeis)
+            servicos_compativeis = [alocacoes_disponiveis[i] for i in indices_compativeis]
 
-                for servico_alocacao in [alocacao] + servicos_compativeis:
-                    ServicoGrupo.objects.create(
-                        grupo=grupo,
-                        alocacao=servico_alocacao
-                    )
+            # Monta o grupo consolidado em memória, já com os totais
+            membros = [alocacao] + servicos_compativeis
+            total_pax = 0
+            total_valor = Decimal('0')
+            vendas = []
 
-                    pax_atual = servico_alocacao.servico.pax or 0
-                    total_pax += pax_atual
+            for servico_alocacao in membros:
+                pax_atual = servico_alocacao.servico.pax or 0
+                total_pax += pax_atual
 
-                    valor_atual = servico_alocacao.preco_calculado or Decimal('0')
-                    total_valor += Decimal(valor_atual)
+                valor_atual = servico_alocacao.preco_calculado or Decimal('0')
+                total_valor += Decimal(valor_atual)
 
-                    numero_venda = servico_alocacao.servico.numero_venda
-                    if numero_venda:
-                        numero_venda_str = str(numero_venda).strip()
-                        if numero_venda_str.endswith('.0'):
-                            numero_venda_str = numero_venda_str[:-2]
-                        vendas.append(numero_venda_str)
+                numero_venda = servico_alocacao.servico.numero_venda
+                if numero_venda:
+                    numero_venda_str = str(numero_venda).strip()
+                    if numero_venda_str.endswith('.0'):
+                        numero_venda_str = numero_venda_str[:-2]
+                    vendas.append(numero_venda_str)
 
-                grupo.total_pax = total_pax
-                grupo.total_valor = total_valor
-                if vendas:
-                    vendas_unicas = list(dict.fromkeys(vendas))
-                    grupo.numeros_venda = ' / '.join(vendas_unicas)
-                else:
-                    grupo.numeros_venda = ''
-                grupo.save()
+            grupo = GrupoServico(
+                escala=escala,
+                van=alocacao.van or 'VAN1',
+                cliente_principal=alocacao.servico.cliente,
+                servico_principal=alocacao.servico.servico,
+                local_pickup_principal=alocacao.servico.local_pickup or '',
+                ordem=alocacao.ordem,
+                total_pax=total_pax,
+                total_valor=total_valor,
+                numeros_venda=' / '.join(dict.fromkeys(vendas)),
+            )
+            grupos.append((grupo, membros))
+            if self._rastreio.ativo:
+                self._rastreio.registrar(
+                    'grupo',
+                    alocacao=alocacao.id,
+                    regra=regra_agrupamento,
+                    membros=[membro.id for membro in membros],
+                    pax=total_pax,
+                )
 
-                grupos_criados += 1
+            logger.info(
+                "Grupo montado (%s): %s com %s serviços e %s PAX",
+                regra_agrupamento,
+                grupo.cliente_principal,
+                len(membros),
+                total_pax
+            )
 
-                logger.info(
-                    "Grupo criado (%s): %s com %s serviços e %s PAX",
-                    regra_agrupamento,
-                    grupo.cliente_principal,
-                    len(servicos_compativeis) + 1,
-                    total_pax
+        # Grava tudo de uma vez: os grupos voltam do bulk_create com a pk
+        if grupos:
+            with transaction.atomic():
+                GrupoServico.objects.bulk_create([grupo for grupo, _ in grupos], batch_size=500)
+                ServicoGrupo.objects.bulk_create(
+                    [
+                        ServicoGrupo(grupo=grupo, alocacao=membro)
+                        for grupo, membros in grupos
+                        for membro in membros
+                    ],
+                    batch_size=500
                 )
+        grupos_criados = len(grupos)
         
         logger.debug(f"Agrupamento finalizado. Total de grupos criados: {grupos_criados}")
+        self._gravar_rastreio(
+            escala,
+            'AGRUPAR',
+            f'Agrupamento automático - {grupos_criados} grupos criados',
+            {'grupos_criados': grupos_criados}
+        )
         return grupos_criados
     
-    def _encontrar_servicos_compativeis(self, alocacao_base, alocacoes_disponiveis):
-        """Encontra serviços compatíveis para agrupamento"""
-        servicos_compativeis = []
-        servico_base = alocacao_base.servico
-        regra_agrupamento = self._detectar_regra_agrupamento(servico_base)
-        
-        print(f"  Base: {servico_base.servico} | Regra: {regra_agrupamento}")
+    JANELA_AGRUPAMENTO_SEGUNDOS = 40 * 60
 
-        considerar_total_pax = regra_agrupamento != 'TRANSFER_OUT_REGULAR'
+    def _assinatura_agrupamento(self, servico):
+        """
+        Tudo o que _servicos_sao_compativeis olha num serviço, calculado uma
+        vez: tipo de regra, nome e pickup normalizados e o horário em segundos
+        (None sem horário, que nunca agrupa)
+        """
+        perfil = perfil_servico(servico.servico)
+        horario = servico.horario
+        if isinstance(horario, str):
+            horario = datetime.strptime(horario, '%H:%M').time()
+        return {
+            'privativo': perfil.privativo,
+            'out_regular': perfil.transfer_out_regular,
+            'in_regular': perfil.transfer_in_regular,
+            'tour': perfil.tour_equivalente,
+            'nome': perfil.nome_normalizado,
+            'pickup': remover_acentos(getattr(servico, 'local_pickup', '')).strip().upper(),
+            'segundos': (
+                horario.hour * 3600 + horario.minute * 60 + horario.second + horario.microsecond / 1e6
+                if horario else None
+            ),
+            'pax': servico.pax or 0,
+        }
 
-        for outra_alocacao in alocacoes_disponiveis:
-            if outra_alocacao.id == alocacao_base.id:
-                continue
-            if getattr(outra_alocacao, 'grupo_info', None):
+    def _baldes_da_assinatura(self, assinatura):
+        """Baldes onde estão todos os serviços que podem ser compatíveis com este"""
+        baldes = [('NOME', assinatura['nome'])]
+        if assinatura['out_regular']:
+            baldes.append(('TRANSFER_OUT_REGULAR',))
+        if assinatura['in_regular'] and assinatura['pickup']:
+            baldes.append(('TRANSFER_IN_REGULAR', assinatura['pickup']))
+        if assinatura['tour']:
+            baldes.append(('TOUR',))
+        return baldes
+
+    def _indexar_para_agrupamento(self, assinaturas):
+        """
+        Baldes de índices das assinaturas, cada um ordenado por horário, com a
+        lista de horários ao lado para a busca por janela com bisect
+        """
+        baldes = defaultdict(list)
+        for indice, assinatura in enumerate(assinaturas):
+            if assinatura['privativo'] or assinatura['segundos'] is None:
                 continue
+            for balde in self._baldes_da_assinatura(assinatura):
+                baldes[balde].append((assinatura['segundos'], indice))
 
-            outro_servico = outra_alocacao.servico
-            
-            compativel = self._servicos_sao_compativeis(
-                servico_base,
-                outro_servico,
-                considerar_total_pax=considerar_total_pax
-            )
-            
-            if compativel:
-                print(f"    ✅ Compatível: {outro_servico.servico}")
-                servicos_compativeis.append(outra_alocacao)
-            else:
-                print(f"    ❌ Incompatível: {outro_servico.servico}")
+        indexados = {}
+        for balde, itens in baldes.items():
+            itens.sort()
+            indexados[balde] = ([segundos for segundos, _ in itens], [indice for _, indice in itens])
+        return indexados
+
+    def _assinaturas_compativeis(self, base, outra):
+        """
+        Mesmo resultado de _servicos_sao_compativeis(base, outra) com
+        considerar_total_pax desligado só para Transfer OUT Regular, como em
+        _encontrar_servicos_compativeis. Todas as regras exigem até 40 minutos
+        de diferença, e dois OUT Regular nesse intervalo sempre agrupam.
+        """
+        if base['privativo'] or outra['privativo']:
+            return False
+        if base['segundos'] is None or outra['segundos'] is None:
+            return False
+        if abs(base['segundos'] - outra['segundos']) > self.JANELA_AGRUPAMENTO_SEGUNDOS:
+            return False
+        if base['out_regular'] and outra['out_regular']:
+            return True
+        if base['in_regular'] and outra['in_regular']:
+            return bool(base['pickup']) and base['pickup'] == outra['pickup']
+        return base['nome'] == outra['nome'] or (base['tour'] and outra['tour'])
+
+    def _encontrar_servicos_compativeis(self, indice_base, assinaturas, baldes, agrupados):
+        """
+        Encontra serviços compatíveis para agrupamento, olhando só os baldes da
+        base dentro da janela de 40 minutos
+
+        Returns:
+            (índices compatíveis na ordem de alocacoes_disponiveis, regra de agrupamento)
+        """
+        base = assinaturas[indice_base]
+        if base['out_regular']:
+            regra_agrupamento = 'TRANSFER_OUT_REGULAR'
+        elif base['tour']:
+            regra_agrupamento = 'TOUR'
+        else:
+            regra_agrupamento = 'NOME'
 
-        if not servicos_compativeis:
-            print(f"    Nenhum serviço compatível encontrado")
+        if base['privativo'] or base['segundos'] is None:
             return [], regra_agrupamento
 
-        if regra_agrupamento == 'TRANSFER_OUT_REGULAR':
-            total_pax = (servico_base.pax or 0) + sum(
-                outra.servico.pax or 0 for outra in servicos_compativeis
-            )
-            print(f"    Transfer OUT: PAX total = {total_pax}")
+        candidatos = set()
+        for balde in self._baldes_da_assinatura(base):
+            horarios, indices = baldes[balde]
+            inicio = bisect_left(horarios, base['segundos'] - self.JANELA_AGRUPAMENTO_SEGUNDOS)
+            fim = bisect_right(horarios, base['segundos'] + self.JANELA_AGRUPAMENTO_SEGUNDOS)
+            candidatos.update(indices[inicio:fim])
+
+        compativeis = [
+            indice for indice in sorted(candidatos)
+            if indice != indice_base and indice not in agrupados
+            and self._assinaturas_compativeis(base, assinaturas[indice])
+        ]
+
+        if compativeis and regra_agrupamento == 'TRANSFER_OUT_REGULAR':
+            total_pax = base['pax'] + sum(assinaturas[indice]['pax'] for indice in compativeis)
             if total_pax < 4:
-                print(f"    PAX insuficiente para transfer OUT ({total_pax} < 4)")
+                if self._rastreio.ativo:
+                    self._rastreio.registrar(
+                        'pax_insuficiente', regra=regra_agrupamento, total_pax=total_pax, compativeis=len(compativeis)
+                    )
                 return [], regra_agrupamento
 
-        return servicos_compativeis, regra_agrupamento
+        return compativeis, regra_agrupamento
 
     def _servicos_sao_compativeis(self, servico1, servico2, considerar_total_pax=True):
         """
@@ -673,7 +796,6 @@ class GerenciarEscalasView(LoginRequiredMixin, View):
         
         # REGRA 1: SERVIÇOS PRIVATIVOS NÃO COMPARTILHAM TRANSPORTE
         if self._eh_servico_privativo(servico1.servico) or self._eh_servico_privativo(servico2.servico):
-            print(f"    ❌ Serviço privativo detectado - não agrupa")
             return False
         
         # REGRA 2: REGULAR OUT - Pode agrupar locais DIFERENTES
@@ -682,9 +804,7 @@ class GerenciarEscalasView(LoginRequiredMixin, View):
             if self._diferenca_horario_minutos(servico1.horario, servico2.horario) <= 40:
                 total_pax = (servico1.pax or 0) + (servico2.pax or 0)
                 if considerar_total_pax and total_pax < 4:
-                    print(f"    ❌ Transfer OUT Regular: PAX insuficiente ({total_pax} < 4)")
                     return False
-                print(f"    ✅ Transfer OUT Regular: pode agrupar (locais podem ser diferentes)")
                 return True
         
         # REGRA 3: REGULAR IN - Só agrupa MESMO local pickup
@@ -692,19 +812,15 @@ class GerenciarEscalasView(LoginRequiredMixin, View):
             # Transfer IN Regular SÓ agrupa se for no mesmo local de pickup
             if self._mesmo_local_pickup(servico1, servico2):
                 if self._diferenca_horario_minutos(servico1.horario, servico2.horario) <= 40:
-                    print(f"    ✅ Transfer IN Regular: mesmo local pickup")
                     return True
                 else:
-                    print(f"    ❌ Transfer IN Regular: horários muito distantes")
                     return False
             else:
-                print(f"    ❌ Transfer IN Regular: locais de pickup diferentes")
                 return False
         
         # REGRA 4: Mesmo nome de serviço e diferença de até 40 minutos (outros casos)
         if self._nomes_equivalentes(servico1.servico, servico2.servico):
             if self._diferenca_horario_minutos(servico1.horario, servico2.horario) <= 40:
-                print(f"    ✅ Mesmo nome de serviço dentro do intervalo de tempo")
                 return True
 
         # REGRA 5: Serviços de TOUR / GUIA À DISPOSIÇÃO (qualquer variação)
@@ -713,41 +829,13 @@ class GerenciarEscalasView(LoginRequiredMixin, View):
             and self._eh_servico_tour_equivalente(servico2.servico)
             and self._diferenca_horario_minutos(servico1.horario, servico2.horario) <= 40
         ):
-            print(f"    ✅ Serviços de TOUR compatíveis")
             return True
 
         return False
 
     def _normalizar_nome_servico(self, nome):
         """Normaliza nome do serviço para comparação"""
-        import re
-
-        nome_normalizado = self._remover_acentos(nome).upper().strip()
-        
-        # 1. Normalizar espaços múltiplos
-        nome_normalizado = re.sub(r'\s+', ' ', nome_normalizado)
-        
-        # 2. Normalizar códigos de aeroportos
-        nome_normalizado = re.sub(r'RJ\s*\(GIG\)', 'GIG', nome_normalizado)
-        nome_normalizado = re.sub(r'RJ\s*\(SDU\)', 'SDU', nome_normalizado)
-        nome_normalizado = re.sub(r'\(GIG\)', 'GIG', nome_normalizado)
-        nome_normalizado = re.sub(r'\(SDU\)', 'SDU', nome_normalizado)
-        
-        # 3. Normalizar aeroportos
-        nome_normalizado = re.sub(r'AEROPORTO\s+INTER\.\s+GALEÃO', 'AEROPORTO GALEAO', nome_normalizado)
-        nome_normalizado = re.sub(r'AEROPORTO\s+SANTOS\s+DUMONT', 'AEROPORTO SDU', nome_normalizado)
-        
-        # 4. Remover pontuações desnecessárias
-        nome_normalizado = re.sub(r'[,\.](?!\d)', '', nome_normalizado)
-        nome_normalizado = re.sub(r'\s+', ' ', nome_normalizado)  # Limpar espaços novamente
-        
-        # 5. Normalizar variações específicas comuns
-        nome_normalizado = re.sub(r'TRANSFER\s+IN\s+REGULAR', 'TRANSFER IN REGULAR', nome_normalizado)
-        nome_normalizado = re.sub(r'TRANSFER\s+OUT\s+REGULAR', 'TRANSFER OUT REGULAR', nome_normalizado)
-        nome_normalizado = re.sub(r'TRANSFER\s+IN\s+VEÍCULO\s+PRIVATIVO', 'TRANSFER IN PRIVATIVO', nome_normalizado)
-        nome_normalizado = re.sub(r'TRANSFER\s+OUT\s+VEÍCULO\s+PRIVATIVO', 'TRANSFER OUT PRIVATIVO', nome_normalizado)
-        
-        return nome_normalizado.strip()
+        return perfil_servico(nome).nome_normalizado
 
     def _nomes_equivalentes(self, nome1, nome2):
         """Compara nomes de serviço considerando normalização"""
@@ -763,12 +851,7 @@ class GerenciarEscalasView(LoginRequiredMixin, View):
 
     def _remover_acentos(self, texto):
         """Remove acentos para comparações resilientes"""
-        if not texto:
-            return ''
-        if isinstance(texto, str):
-            texto_normalizado = unicodedata.normalize('NFKD', texto)
-            return ''.join(c for c in texto_normalizado if not unicodedata.combining(c))
-        return str(texto)
+        return remover_acentos(texto)
 
     def _mesmo_local_pickup(self, servico1, servico2):
         """Compara o local de pickup considerando normalização"""
@@ -798,35 +881,23 @@ class GerenciarEscalasView(LoginRequiredMixin, View):
     
     def _eh_transfer_out(self, nome_servico):
         """Verifica se é um transfer OUT"""
-        nome_upper = self._remover_acentos(nome_servico).upper()
-        return 'TRANSFER' in nome_upper and 'OUT' in nome_upper
+        return perfil_servico(nome_servico).transfer_out
 
     def _eh_servico_privativo(self, nome_servico):
         """Verifica se é um serviço privativo/privado"""
-        nome_upper = self._remover_acentos(nome_servico).upper()
-        termos_privativo = ['PRIVATIVO', 'PRIVADO', 'EXCLUSIVO', 'VEICULO PRIVATIVO', 'VEÍCULO PRIVATIVO']
-        return any(termo in nome_upper for termo in termos_privativo)
+        return perfil_servico(nome_servico).privativo
     
     def _eh_transfer_in_regular(self, nome_servico):
         """Identifica transfers IN regulares"""
-        nome_upper = self._remover_acentos(nome_servico).upper()
-        return 'TRANSFER' in nome_upper and 'IN' in nome_upper and 'REGULAR' in nome_upper
+        return perfil_servico(nome_servico).transfer_in_regular
     
     def _eh_transfer_out_regular(self, nome_servico):
         """Identifica transfers OUT regulares"""
-        nome_upper = self._remover_acentos(nome_servico).upper()
-        return 'TRANSFER' in nome_upper and 'OUT' in nome_upper and 'REGULAR' in nome_upper
+        return perfil_servico(nome_servico).transfer_out_regular
 
     def _eh_servico_tour_equivalente(self, nome_servico):
         """Verifica se o nome indica um tour ou guia à disposição"""
-        nome_upper = self._remover_acentos(nome_servico).upper()
-        palavras_chave = [
-            'TOUR',
-            'GUIA A DISPOSICAO',
-            'VEICULO + GUIA',
-            'VEICULO E GUIA',
-        ]
-        return any(chave in nome_upper for chave in palavras_chave)
+        return perfil_servico(nome_servico).tour_equivalente
 
     def _eh_tour(self, nome_servico):
         """Mantido para compatibilidade com testes anteriores"""
@@ -834,9 +905,7 @@ class GerenciarEscalasView(LoginRequiredMixin, View):
 
     def _eh_guia_disposicao(self, nome_servico):
         """Verifica se é um serviço de guia à disposição"""
-        nome_upper = self._remover_acentos(nome_servico).upper()
-        padrao = r'GUIA\s*A\s*DISPOSICAO\s*\d+\s*HORAS?'
-        return bool(re.search(padrao, nome_upper))
+        return perfil_servico(nome_servico).guia_disposicao
     
     def _selecionar_candidatos_4_10_pax(self, escala):
         """
@@ -946,8 +1015,7 @@ class GerenciarEscalasView(LoginRequiredMixin, View):
     
     def _verificar_servico_in_out(self, nome_servico):
         """Verifica se é serviço IN ou OUT"""
-        nome_upper = nome_servico.upper()
-        return ('TRANSFER' in nome_upper and ('IN' in nome_upper or 'OUT' in nome_upper))
+        return perfil_servico(nome_servico).in_out
     
     def _aplicar_priorizacao(self, candidatos):
         """
@@ -981,7 +1049,7 @@ class GerenciarEscalasView(LoginRequiredMixin, View):
         """
         score = 0
         cliente = candidato['cliente_principal'].upper()
-        servico = candidato['servico_principal'].upper()
+        perfil = perfil_servico(candidato['servico_principal'])
         
         # PRIORIDADE 1: Serviços IN e OUT da Hotelbeds e Holiday
         if candidato['eh_in_out']:
@@ -990,12 +1058,12 @@ class GerenciarEscalasView(LoginRequiredMixin, View):
                 logger.debug(f"   🏆 Hotelbeds/Holiday IN/OUT: {candidato['cliente_principal']} (+100)")
         
         # PRIORIDADE 2: Serviços com destino à Barra da Tijuca
-        if 'BARRA' in servico or 'BARRA DA TIJUCA' in servico or 'RECREIO' in servico:
+        if perfil.destino_barra:
             score += 50
             logger.debug(f"   🏖️ Destino Barra: {candidato['servico_principal'][:50]}... (+50)")
         
         # PRIORIDADE 3: Serviços que tenham preço alto "tours"
-        if self._eh_tour_alto_valor(servico):
+        if perfil.tour_alto_valor:
             score += 75
             logger.debug(f"   🎯 Tour alto valor: {candidato['servico_principal'][:50]}... (+75)")
         
@@ -1006,14 +1074,7 @@ class GerenciarEscalasView(LoginRequiredMixin, View):
     
     def _eh_tour_alto_valor(self, nome_servico):
         """Verifica se é um tour de alto valor"""
-        nome_upper = nome_servico.upper()
-        return (
-            'TOUR' in nome_upper or 
-            'VEÍCULO + GUIA À DISPOSIÇÃO' in nome_upper or
-            'VEICULO + GUIA A DISPOSICAO' in nome_upper or
-            'GUIA À DISPOSIÇÃO' in nome_upper or
-            'GUIA A DISPOSICAO' in nome_upper
-        )
+        return perfil_servico(nome_servico).tour_alto_valor
     
     def _alocar_candidato_respeitando_intervalo_3h(self, candidato, van1_schedule, van2_schedule):
         """
@@ -1024,27 +1085,39 @@ class GerenciarEscalasView(LoginRequiredMixin, View):
         horario_inicio = candidato['horario_principal']
         
         if not horario_inicio:
-            logger.debug(f"   ⚠️ {candidato['cliente_principal']} - sem horário, não alocado")
+            if self._rastreio.ativo:
+                self._rastreio.registrar('nao_alocado', cliente=candidato['cliente_principal'], motivo='sem horário')
             return False
         
-        # Calcular duração baseada no tipo de serviço
+        # Calcular duração baseada no tipo de serviço; o fim pode passar da meia-noite
         duracao_minutos = self._calcular_duracao_ocupacao_van(candidato['servico_principal'])
-        horario_fim = self._somar_minutos_ao_horario(horario_inicio, duracao_minutos)
-        
-        logger.debug(f"   🕐 {candidato['cliente_principal']} - {horario_inicio} a {horario_fim} ({duracao_minutos}min)")
-        
-        # Tentar Van 1 primeiro
-        if self._van_pode_aceitar_servico(horario_inicio, horario_fim, van1_schedule):
-            self._confirmar_alocacao_na_van(candidato, 'VAN1', van1_schedule, horario_inicio, horario_fim)
-            return True
-        
-        # Tentar Van 2
-        elif self._van_pode_aceitar_servico(horario_inicio, horario_fim, van2_schedule):
-            self._confirmar_alocacao_na_van(candidato, 'VAN2', van2_schedule, horario_inicio, horario_fim)
-            return True
+        inicio = minutos_do_dia(horario_inicio)
+        fim = inicio + duracao_minutos
+        
+        # Tentar Van 1 primeiro, depois Van 2
+        for van_nome, schedule_van in (('VAN1', van1_schedule), ('VAN2', van2_schedule)):
+            if self._van_pode_aceitar_servico(inicio, fim, schedule_van):
+                self._confirmar_alocacao_na_van(candidato, van_nome, schedule_van, inicio, fim)
+                if self._rastreio.ativo:
+                    self._rastreio.registrar(
+                        'alocado',
+                        cliente=candidato['cliente_principal'],
+                        van=van_nome,
+                        inicio=formatar_minutos(inicio),
+                        fim=formatar_minutos(fim),
+                        duracao_minutos=duracao_minutos,
+                    )
+                return True
         
         # Não conseguiu alocar em nenhuma van
-        logger.debug(f"   ❌ {candidato['cliente_principal']} - não coube em nenhuma van")
+        if self._rastreio.ativo:
+            self._rastreio.registrar(
+                'nao_alocado',
+                cliente=candidato['cliente_principal'],
+                inicio=formatar_minutos(inicio),
+                fim=formatar_minutos(fim),
+                motivo='não coube em nenhuma van',
+            )
         return False
     
     def _calcular_duracao_ocupacao_van(self, nome_servico):
@@ -1053,88 +1126,38 @@ class GerenciarEscalasView(LoginRequiredMixin, View):
         Tours especiais: conforme especificado no nome (6H, 8H, 10H)
         Outros serviços: 3 horas padrão
         """
-        nome_upper = nome_servico.upper()
-        
-        # Buscar padrões de horas nos tours
-        import re
-        
-        # Padrão: "VEÍCULO + GUIA À DISPOSIÇÃO 06 HORAS"
-        match = re.search(r'(\d+)\s*HORAS?', nome_upper)
-        if match:
-            horas = int(match.group(1))
-            logger.debug(f"     ⏱️ Tour de {horas} horas detectado")
-            return horas * 60
-        
-        # Padrão: "GUIA À DISPOSIÇÃO 08 HORAS"  
-        match = re.search(r'GUIA.*DISPOSIÇÃO.*(\d+)\s*HORAS?', nome_upper)
-        if match:
-            horas = int(match.group(1))
-            logger.debug(f"     ⏱️ Guia {horas} horas detectado")
-            return horas * 60
-        
-        # Padrão: "DISPOSIÇÃO 10H" ou variações
-        match = re.search(r'DISPOSIÇÃO.*(\d+)H', nome_upper)
-        if match:
-            horas = int(match.group(1))
-            logger.debug(f"     ⏱️ Disposição {horas}H detectado")
-            return horas * 60
-        
-        # Transfers e outros: 3 horas padrão
-        logger.debug(f"     ⏱️ Serviço padrão: 3 horas")
-        return 180  # 3 horas = 180 minutos
-    
-    def _somar_minutos_ao_horario(self, horario, minutos):
-        """Adiciona minutos a um horário"""
-        from datetime import datetime, timedelta
-        dt = datetime.combine(datetime.today(), horario)
-        dt_fim = dt + timedelta(minutes=minutos)
-        return dt_fim.time()
+        return perfil_servico(nome_servico).duracao_ocupacao_minutos
     
     def _van_pode_aceitar_servico(self, inicio, fim, schedule_van):
         """
-        Verifica se a van pode aceitar o serviço:
+        Verifica se a van pode aceitar o serviço (minutos desde a meia-noite):
         - Não pode haver sobreposição
         - Deve ter 3 horas de intervalo após o último serviço
         """
-        INTERVALO_MINIMO_MINUTOS = 180  # 3 horas
+        conflito = schedule_van.conflito(inicio, fim)
+        if conflito is None:
+            return True
         
-        for agendado_inicio, agendado_fim in schedule_van:
-            # Verificar sobreposição
-            if not (fim <= agendado_inicio or inicio >= agendado_fim):
-                logger.debug(f"     ❌ Conflito de horário: {inicio}-{fim} vs {agendado_inicio}-{agendado_fim}")
-                return False
-            
-            # Verificar intervalo mínimo (3 horas após o fim do último)
+        if self._rastreio.ativo:
+            motivo, (agendado_inicio, agendado_fim) = conflito
+            detalhes = {}
             if agendado_fim <= inicio:
-                diferenca_minutos = self._calcular_diferenca_minutos(agendado_fim, inicio)
-                if diferenca_minutos < INTERVALO_MINIMO_MINUTOS:
-                    logger.debug(f"     ❌ Intervalo insuficiente: {diferenca_minutos}min < 180min")
-                    return False
-        
-        return True
-    
-    def _calcular_diferenca_minutos(self, horario1, horario2):
-        """Calcula diferença em minutos entre dois horários"""
-        from datetime import datetime, timedelta
-        
-        dt1 = datetime.combine(datetime.today(), horario1)
-        dt2 = datetime.combine(datetime.today(), horario2)
-        
-        # Lidar com horários que passam da meia-noite
-        if dt2 < dt1:
-            dt2 += timedelta(days=1)
-        
-        return (dt2 - dt1).total_seconds() / 60
+                detalhes['intervalo_minutos'] = inicio - agendado_fim
+            self._rastreio.registrar(
+                'conflito',
+                motivo=motivo,
+                servico=f'{formatar_minutos(inicio)}-{formatar_minutos(fim)}',
+                agendado=f'{formatar_minutos(agendado_inicio)}-{formatar_minutos(agendado_fim)}',
+                **detalhes,
+            )
+        return False
     
-    def _confirmar_alocacao_na_van(self, candidato, van_nome, schedule_van, horario_inicio, horario_fim):
+    def _confirmar_alocacao_na_van(self, candidato, van_nome, schedule_van, inicio, fim):
         """Confirma alocação do candidato na van especificada"""
-        # Adicionar ao schedule da van
-        schedule_van.append((horario_inicio, horario_fim))
-        schedule_van.sort()
+        # Adicionar à agenda da van; a posição de inserção é a ordem na van
+        ordem = schedule_van.adicionar(inicio, fim)
         
         # Marcar todas as alocações do candidato como alocadas
-        ordem = len([s for s in schedule_van if s[0] <= horario_inicio])
-        
         for alocacao in candidato['alocacoes']:
             alocacao.status_alocacao = 'ALOCADO'
             alocacao.van = van_nome
@@ -1344,9 +1367,6 @@ class VisualizarEscalaView(LoginRequiredMixin, View):
 
     def get(self, request, data):
         """Exibe a escala"""
-        import sys
-        print(f"🟢 GET CHAMADO! VisualizarEscalaView - Data: {data}", file=sys.stderr)
-        
         escala = self.get_object()
         
         # Se a escala ainda está na etapa ESTRUTURA (sem dados puxados),
@@ -1510,104 +1530,59 @@ class VisualizarEscalaView(LoginRequiredMixin, View):
 
     def post(self, request, data):
         """Processa ações do botão Agrupar e Otimizar"""
-        import sys
-        print(f"\n" + "="*60, file=sys.stderr)
-        print(f"🔥 POST CHAMADO! VisualizarEscalaView", file=sys.stderr)
-        print(f"🔥 Data: {data}", file=sys.stderr)
-        print(f"🔥 Método: {request.method}", file=sys.stderr)
-        print(f"🔥 User: {request.user}", file=sys.stderr)
-        print(f"🔥 POST keys: {list(request.POST.keys())}", file=sys.stderr)
-        print(f"🔥 POST items: {dict(request.POST.items())}", file=sys.stderr)
-        print("="*60, file=sys.stderr)
-        
-        print(f"\n=== DEBUG POST VisualizarEscalaView ===")
-        print(f"Data recebida: {data}")
-        print(f"Método: {request.method}")
-        print(f"POST keys: {list(request.POST.keys())}")
-        print(f"POST items: {dict(request.POST.items())}")
-        
-        # Verificar se há parâmetro acao
         acao = request.POST.get('acao')
-        print(f"Parâmetro 'acao': '{acao}'")
+        logger.debug("POST VisualizarEscalaView - data %s, ação %r, usuário %s", data, acao, request.user)
         
         if not acao:
-            print("ERRO: Parâmetro 'acao' não encontrado!")
             messages.error(request, 'Ação não especificada.')
             return redirect('escalas:visualizar_escala', data=data)
         
         escala = self.get_object()
-        print(f"Escala ID: {escala.id}, Etapa: {escala.etapa}")
-        
-        # Log detalhado das alocações
-        total_alocacoes = escala.alocacoes.count()
         alocacoes_sem_grupo = escala.alocacoes.filter(grupo_info__isnull=True).count()
-        print(f"Total alocações: {total_alocacoes}, Sem grupo: {alocacoes_sem_grupo}")
         
         if acao == 'agrupar':
-            print("=== PROCESSANDO AGRUPAMENTO ===")
-            print(f"Etapa da escala: '{escala.etapa}'")
-            print(f"Etapas válidas: ['DADOS_PUXADOS', 'OTIMIZADA']")
-            print(f"Etapa é válida? {escala.etapa in ['DADOS_PUXADOS', 'OTIMIZADA']}")
-            
             if escala.etapa not in ['DADOS_PUXADOS', 'OTIMIZADA']:
                 error_msg = f'Para agrupar, é necessário ter dados puxados ou estar otimizada. Etapa atual: {escala.etapa}'
-                print(f"ERRO ETAPA: {error_msg}")
                 messages.error(request, error_msg)
                 return redirect('escalas:visualizar_escala', data=data)
 
             if alocacoes_sem_grupo == 0:
-                print("AVISO: Não há alocações disponíveis para agrupamento")
                 messages.warning(request, 'Não há serviços disponíveis para agrupamento.')
                 return redirect('escalas:visualizar_escala', data=data)
 
             try:
-                print(f"Iniciando agrupamento com {alocacoes_sem_grupo} alocações disponíveis...")
+                logger.info(f"🔗 Agrupando escala {escala.id} ({alocacoes_sem_grupo} alocações sem grupo)")
                 gerenciar_view = GerenciarEscalasView()
                 grupos_criados = gerenciar_view._agrupar_servicos(escala)
-                print(f"Agrupamento concluído: {grupos_criados} grupos criados")
                 if grupos_criados > 0:
                     messages.success(request, f'Agrupamento concluído! {grupos_criados} grupos criados.')
                 else:
                     messages.info(request, 'Nenhum grupo foi criado. Verifique se há serviços compatíveis para agrupamento.')
             except Exception as e:
-                print(f"ERRO no agrupamento: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception(f"❌ Erro no agrupamento da escala {escala.id}: {e}")
                 messages.error(request, f'Erro ao agrupar serviços: {e}')
 
             return redirect('escalas:visualizar_escala', data=data)
 
         elif acao in {'otimizar', 'escalar'}:
-            print("=== PROCESSANDO ESCALONAMENTO ===")
-            print(f"Etapa da escala: '{escala.etapa}'")
-            print(f"Etapas válidas: ['DADOS_PUXADOS', 'OTIMIZADA']")
-            print(f"Etapa é válida? {escala.etapa in ['DADOS_PUXADOS', 'OTIMIZADA']}")
-            
             if escala.etapa not in ['DADOS_PUXADOS', 'OTIMIZADA']:
                 error_msg = f'Para escalar, é necessário ter dados puxados. Etapa atual: {escala.etapa}'
-                print(f"ERRO ETAPA: {error_msg}")
                 messages.error(request, error_msg)
                 return redirect('escalas:visualizar_escala', data=data)
 
             try:
-                print(f"Iniciando escalonamento/otimização da escala {escala.id}...")
                 gerenciar_view = GerenciarEscalasView()
                 gerenciar_view._otimizar_escala(escala)
-                print("Escalonamento concluído com sucesso")
                 messages.success(request, 'Escala escalada com sucesso!')
             except Exception as e:
-                print(f"ERRO no escalonamento: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception(f"❌ Erro no escalonamento da escala {escala.id}: {e}")
                 messages.error(request, f'Erro ao escalar: {e}')
 
             return redirect('escalas:visualizar_escala', data=data)
 
         else:
-            print(f"AÇÃO DESCONHECIDA: '{acao}'")
             messages.error(request, f'Ação desconhecida: {acao}')
 
-        print("=== REDIRECIONANDO ===")
         return redirect('escalas:visualizar_escala', data=data)
 
 class PuxarDadosView(LoginRequiredMixin, View):
@@ -1941,59 +1916,15 @@ class PrecificarEscalaView(LoginRequiredMixin, View):
                     'error': 'Esta escala não tem dados puxados ainda.'
                 }, status=400)
             
-            # Inicializar contadores e estatísticas detalhadas
-            servicos_precificados = 0
-            servicos_com_erro = 0
-            total_valor = 0.0
-            estatisticas_fonte = {'JW': 0, 'Motoristas': 0, 'padrão': 0}
-            
             logger.info(f"🚀 INICIANDO PRECIFICAÇÃO INTELIGENTE - Escala {escala.data}")
             
             with transaction.atomic():
-                # Buscar todas as alocações da escala
-                alocacoes = escala.alocacoes.all()
-                logger.info(f"📋 Total de alocações a precificar: {alocacoes.count()}")
-                
-                for alocacao in alocacoes:
-                    try:
-                        # Calcular preço e veículo usando sistema inteligente
-                        veiculo_anterior = alocacao.veiculo_recomendado
-                        preco_anterior = alocacao.preco_calculado
-                        
-                        veiculo, preco = alocacao.calcular_preco_e_veiculo()
-                        
-                        # Estatísticas por fonte (extrair do log)
-                        # O log é gerado no modelo, então vamos inferir a fonte baseada no preço
-                        if preco > 0:
-                            # Busca inteligente para determinar fonte
-                            from core.busca_inteligente_precos import BuscadorInteligentePrecosCodigoDoAnalista
-                            buscador = BuscadorInteligentePrecosCodigoDoAnalista()
-                            _, _, fonte = buscador.buscar_preco_inteligente(
-                                alocacao.servico.servico, 
-                                alocacao.servico.pax, 
-                                str(alocacao.servico.numero_venda or "1")
-                            )
-                            
-                            # Categorizar fonte
-                            if 'JW' in fonte:
-                                estatisticas_fonte['JW'] += 1
-                            elif 'Motoristas' in fonte:
-                                estatisticas_fonte['Motoristas'] += 1
-                            else:
-                                estatisticas_fonte['padrão'] += 1
-                        
-                        servicos_precificados += 1
-                        total_valor += preco
-                        
-                        # Log detalhado de mudanças
-                        if veiculo != veiculo_anterior or abs(preco - (preco_anterior or 0)) > 0.01:
-                            logger.info(f"🔄 Atualização - {alocacao.servico.servico[:30]}... | "
-                                       f"{veiculo_anterior or 'N/A'} → {veiculo} | "
-                                       f"R$ {preco_anterior or 0:.2f} → R$ {preco:.2f}")
-                        
-                    except Exception as e:
-                        logger.error(f"❌ Erro ao precificar alocação {alocacao.id}: {e}")
-                        servicos_com_erro += 1
+                # Precificar todas as alocações da escala em uma única passada
+                resultado = precificar_lote(escala.alocacoes.all())
+                servicos_precificados = resultado['servicos_precificados']
+                servicos_com_erro = resultado['servicos_com_erro']
+                total_valor = resultado['valor_total']
+                estatisticas_fonte = resultado['estatisticas_fonte']
                 
                 # Recalcular totais de grupos se existirem
                 grupos = escala.grupos.all()
@@ -2154,7 +2085,13 @@ class ApiDetalhesPrecificacaoView(LoginRequiredMixin, View):
                 # Informações adicionais
                 'observacoes': detalhes.get('observacoes', 'Preço calculado com sucesso' if alocacao.preco_calculado else 'Sem observações disponíveis'),
                 'data_calculo': detalhes.get('data_calculo', 'N/A'),
-                'historico_busca': detalhes.get('historico_busca', []),
+                'historico_busca': [
+                    {
+                        **item,
+                        'preco': f"{float(item.get('preco') or 0):,.2f}".replace(',', 'X').replace('.', ',').replace('X', '.'),
+                    }
+                    for item in detalhes.get('historico_busca', [])
+                ],
                 
                 # Status e debug
                 'tem_detalhes_salvos': bool(alocacao.detalhes_precificacao),
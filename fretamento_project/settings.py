@@ -20,6 +20,9 @@ env = environ.Env(
     DEBUG=(bool, True),
     USE_DOCKER=(bool, False),
     DATABASE_URL=(str, ''),
+    ESCALAS_RASTREIO_DECISOES=(bool, False),
+    ESCALAS_RASTREIO_CAPACIDADE=(int, 2000),
+    PLANILHAS_PROCESSAR_NO_UPLOAD=(bool, False),
 )
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -248,6 +251,23 @@ SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
 SESSION_CACHE_ALIAS = 'default'
 SESSION_COOKIE_AGE = 3600  # 1 hora
 
+# Rastreio das decisões de agrupamento/escala, gravado no LogEscala da ação
+# (escalas/rastreio.py). Desligado, o caminho normal não faz I/O por comparação.
+ESCALAS_RASTREIO_DECISOES = env('ESCALAS_RASTREIO_DECISOES')
+ESCALAS_RASTREIO_CAPACIDADE = env('ESCALAS_RASTREIO_CAPACIDADE')
+
+# Planilhas enviadas ficam PENDENTE até o worker (manage.py processar_planilhas)
+# processá-las; o worker precisa enxergar o mesmo MEDIA_ROOT que o web. Em deploys
+# onde isso não vale (um dyno Heroku não vê os arquivos de outro), processa no upload.
+PLANILHAS_PROCESSAR_NO_UPLOAD = env('PLANILHAS_PROCESSAR_NO_UPLOAD')
+
+# Histórico de preços gerado pelo comando rebuild_price_history. Fica fora do
+# código-fonte; enquanto não existe, vale o arquivo distribuído em core/data.
+HISTORICO_PRECOS_ARQUIVO = env.str(
+    'HISTORICO_PRECOS_ARQUIVO', default=str(BASE_DIR / 'var' / 'historico_precos.json.gz')
+)
+
+
 # Logging Configuration
 LOGGING = {
     'version': 1,
@@ -85,6 +85,12 @@ STATIC_URL = '/static/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 MEDIA_URL = '/media/'
 
+# Dynos não compartilham disco: um dyno worker não enxerga a planilha gravada no
+# MEDIA_ROOT do dyno web. Processo worker separado não é suportado aqui; as
+# planilhas são processadas na própria requisição de upload, ou seja, aqui o
+# upload continua síncrono (ver README, "Processamento de Planilhas").
+PLANILHAS_PROCESSAR_NO_UPLOAD = True
+
 # ============================================
 # CACHE - REDIS PARA PRODUÇÃO
 # ============================================